@@ -0,0 +1,96 @@
+# Completion time of tiles made of long attempts that can fail (fire capes, Inferno).
+# An AttemptModel's exact time distribution comes from one FFT of H / (1 - M) on a grid of `step` minutes.
+from functools import lru_cache
+from statistics import NormalDist
+
+import numpy as np
+
+import nbkernel
+
+STEP_MINUTES = 1.0
+TAIL = 1e-12  # probability mass allowed to fall off the end of the grid
+
+
+def duration_pmf(mean, sd, step):
+    """pmf over grid points 1, 2, ... (times step minutes) of a normal duration, at least one step."""
+    if not sd:
+        pmf = np.zeros(max(int(round(mean / step)), 1) + 1)
+        pmf[-1] = 1.0
+        return pmf
+    dist = NormalDist(mean, sd)
+    edges = (np.arange(int((mean + 8 * sd) / step) + 2) + 0.5) * step
+    cdf = np.array([dist.cdf(x) for x in edges])
+    pmf = np.diff(cdf, prepend=0.0)
+    pmf[0] = 0.0  # nothing takes no time: the mass below half a step goes to the first point
+    pmf[1] += cdf[0]
+    return pmf / pmf.sum()
+
+
+class AttemptModel:
+    """Total time for `drops` items from attempts that succeed with chance `success`."""
+
+    def __init__(self, minutes, sd=0.0, success=1.0, drop=1.0, drops=1, fail_minutes=None, fail_sd=None,
+                 step=STEP_MINUTES):
+        if not 0 < success * drop <= 1:
+            raise ValueError("success * drop must be in (0, 1]")
+        self.minutes = minutes
+        self.sd = sd
+        self.success = success
+        self.drop = drop
+        self.drops = drops
+        self.fail_minutes = minutes / 2 if fail_minutes is None else fail_minutes
+        self.fail_sd = sd / 2 if fail_sd is None else fail_sd
+        self.step = step
+        self.pmf = self._distribution()
+        self.cdf = np.cumsum(self.pmf)
+
+    def params(self):
+        """Constructor arguments as a JSON-friendly dict (the tile's "attempts" entry)."""
+        return {"minutes": self.minutes, "sd": self.sd, "success": self.success, "drop": self.drop,
+                "drops": self.drops, "fail_minutes": self.fail_minutes, "fail_sd": self.fail_sd}
+
+    def _distribution(self):
+        ok = duration_pmf(self.minutes, self.sd, self.step)
+        fail = duration_pmf(self.fail_minutes, self.fail_sd, self.step)
+        p = self.success * self.drop
+        size = max(ok.size, fail.size)
+        hit = np.zeros(size)
+        miss = np.zeros(size)
+        hit[:ok.size] = p * ok
+        miss[:ok.size] += self.success * (1 - self.drop) * ok
+        miss[:fail.size] += (1 - self.success) * fail
+        # Enough grid for the attempts needed with probability 1 - TAIL, each as long as the longest
+        attempts = (nbkernel.nbinom_ppf(1 - TAIL, self.drops, p) if p < 1 else 0) + self.drops
+        n = 1 << int(np.ceil(np.log2(attempts * size + 1)))
+        transform = (np.fft.rfft(hit, n) / (1 - np.fft.rfft(miss, n))) ** self.drops
+        return np.maximum(np.fft.irfft(transform, n), 0.0)
+
+    def hours_at(self, u):
+        """Hours by which the drops are done with probability u (grid quantiles)."""
+        return np.searchsorted(self.cdf, np.asarray(u, dtype=float) * self.cdf[-1]) * self.step / 60
+
+    @property
+    def median_hours(self):
+        return float(self.hours_at(0.5))
+
+    @property
+    def mean_hours(self):
+        return float(np.dot(np.arange(self.pmf.size), self.pmf) / self.pmf.sum() * self.step / 60)
+
+    def notes(self):
+        note = f"{self.minutes:g} min runs"
+        if self.success < 1:
+            note += f", {self.success:.0%} success ({self.fail_minutes:g} min lost per death)"
+        if self.drop < 1:
+            note += f", 1/{1 / self.drop:.0f} per success"
+        return note + f", median {self.median_hours:.2f} hrs for {self.drops}"
+
+
+@lru_cache(maxsize=None)
+def _cached(items):
+    return AttemptModel(**dict(items))
+
+
+def model(params):
+    """AttemptModel for a tile's "attempts" dict, built once per distinct set of parameters."""
+    return _cached(tuple(sorted(params.items())))
@@ -0,0 +1,430 @@
+# Monte Carlo playthroughs of a snakes & ladders board.
+# The board is flattened into arrays by tile number so every playthrough advances together, one roll per step.
+import itertools
+import re
+from statistics import NormalDist
+
+import numpy as np
+
+import attempts
+import nbkernel
+
+QUANTILE_POINTS = 1024  # resolution of the per-tile inverse-CDF tables
+STREAM_BATCH = 1 << 15  # playthroughs advanced together with a stream (bounds the per-tile visit counters)
+REPORT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99)  # hour columns in the workbook
+# splitmix64 constants for the counter-based streams used by common random numbers
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+SKIP_CHANGE_RE = re.compile(r"([+-]\d+) SKIP")
+SIT_RE = re.compile(r"\(SIT\)")
+
+
+def tile_hours_at(tile, u):
+    """Hours to finish an obtain tile at quantile levels u.
+
+    The shape comes from the tile's attempt model (attempts.py) or its
+    drops/rate (negative binomial in kills) when known, otherwise a single
+    rare drop (exponential). Either way it is rescaled so the median matches
+    the tile's median_hours, which keeps the hand-adjusted tiles honest.
+    """
+    u = np.asarray(u, dtype=float)
+    if tile.get("attempts"):
+        model = attempts.model(tile["attempts"])
+        return model.hours_at(u) * (tile["median_hours"] / model.median_hours)
+    if tile.get("rate"):
+        r = tile["drops"] or 1
+        kills = nbkernel.nbinom_ppf(u, r, tile["rate"]) + r
+        med = nbkernel.nbinom_ppf(0.5, r, tile["rate"]) + r
+    else:
+        kills = -np.log1p(-u)
+        med = np.log(2)
+    return kills * (tile["median_hours"] / med)
+
+
+def tile_quantiles(tiles, ps=REPORT_QUANTILES):
+    """Hours at quantile levels ps for every obtain tile, as a (len(tiles), len(ps)) array.
+
+    Same model as tile_hours_at, but all tiles go through one broadcast
+    quantile call instead of one call per tile, and tiles sharing a drop
+    model (every Nx Raid Drop, say) are only evaluated once. Attempt-model
+    tiles are filled in one by one from their (cached) distributions.
+    """
+    ps = np.asarray(ps, dtype=float)
+    median = np.array([t["median_hours"] for t in tiles], dtype=float)
+    rate = np.array([t.get("rate") or 0.0 for t in tiles], dtype=float)
+    r = np.array([t.get("drops") or 1 for t in tiles], dtype=float)
+    out = -np.log1p(-ps)[None, :] * (median / np.log(2))[:, None]
+    known = rate > 0
+    if known.any():
+        levels = np.concatenate(([0.5], ps))
+        models, which = np.unique(np.column_stack((r[known], rate[known])), axis=0, return_inverse=True)
+        kills = (nbkernel.nbinom_ppf(levels[None, :], models[:, :1], models[:, 1:]) + models[:, :1])[which.ravel()]
+        out[known] = kills[:, 1:] * (median[known] / kills[:, 0])[:, None]
+    for i, t in enumerate(tiles):
+        if t.get("attempts"):
+            out[i] = tile_hours_at(t, ps)
+    return out
+
+
+class BoardArrays:
+    """Board tables indexed by tile number; index 0 is the start square.
+
+    target[t]      tile you end up on after landing on t (movement chains resolved)
+    sit[t]         landing on t passes through a SIT tile
+    obtain[t]      t is an obtain tile
+    skip_change[t] skips gained (+1) or lost (-1) on t
+    median_hours[t], icdf[t, :] completion time of t (median / inverse CDF table)
+    """
+
+    def __init__(self, board, quantile_points=QUANTILE_POINTS):
+        size = max(t["tile"] for t in board) + 1
+        self.last_tile = size - 1
+        self.obtain = np.zeros(size, dtype=bool)
+        self.skip_change = np.zeros(size, dtype=np.int64)
+        self.median_hours = np.zeros(size)
+        self.icdf = np.zeros((size, quantile_points))
+        u = (np.arange(quantile_points) + 0.5) / quantile_points
+
+        obtain = [t for t in board if t["category"] == "obtain"]
+        if obtain:
+            self.icdf[[t["tile"] for t in obtain]] = tile_quantiles(obtain, u)
+        moves, sit = {}, np.zeros(size, dtype=bool)
+        for t in board:
+            num = t["tile"]
+            sit[num] = bool(SIT_RE.search(t["description"]))
+            if t["category"] == "movement":
+                moves[num] = t["target"]
+            elif t["category"] == "obtain":
+                self.obtain[num] = True
+                self.median_hours[num] = t["median_hours"]
+            else:
+                m = SKIP_CHANGE_RE.search(t["description"])
+                if m:
+                    self.skip_change[num] = int(m.group(1))
+
+        # Landing on 26 sends you to 40, which sends you back to 38
+        self.target = np.arange(size)
+        self.sit = sit.copy()
+        for num in moves:
+            dest, seen = num, set()
+            while dest in moves and dest not in seen:
+                seen.add(dest)
+                self.sit[num] |= sit[dest]
+                dest = moves[dest]
+            self.target[num] = dest
+            self.sit[num] |= sit[min(dest, self.last_tile)]
+        self.target = np.minimum(self.target, size)  # past the end just finishes
+
+    def update_tile(self, tile):
+        """Re-estimate one obtain tile in place (its hours or drop model changed, nothing else)."""
+        num = tile["tile"]
+        self.median_hours[num] = tile["median_hours"]
+        self.icdf[num] = tile_hours_at(tile, (np.arange(self.icdf.shape[1]) + 0.5) / self.icdf.shape[1])
+
+    def default_skip_threshold(self, rank=10):
+        """Median hours of the rank-th longest obtain tile (the 'Strong candidate' cutoff)."""
+        hours = np.sort(self.median_hours[self.obtain])[::-1]
+        return hours[min(rank, len(hours)) - 1] if len(hours) else np.inf
+
+
+class SimResult:
+    """Per-playthrough totals plus per-tile visit/skip counts summed over playthroughs.
+
+    control[i] is playthrough i's tile hours minus their expected value
+    given the tiles it worked, a zero-mean control variate.
+    """
+
+    def __init__(self, hours, skips_used, rolls, visits, skipped, control=None):
+        self.hours = hours
+        self.skips_used = skips_used
+        self.rolls = rolls
+        self.visits = visits
+        self.skipped = skipped
+        self.control = control
+
+
+def _per_row(value, n, dtype):
+    return np.broadcast_to(np.asarray(value, dtype=dtype), (n,)).copy()
+
+
+def _mix(x):
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def stream_uniforms(seed, row, kind, counter):
+    """Uniforms in [0, 1) that depend only on (seed, row, kind, counter).
+
+    A counter-based generator: playthrough `row` gets the same dice roll
+    number k, or the same k-th time on a tile, whatever else differs between
+    two simulations. That is what makes common random numbers line up
+    across policies.
+    """
+    with np.errstate(over="ignore"):
+        x = _mix(np.uint64(seed) + _GOLDEN * (np.asarray(row, dtype=np.uint64) + np.uint64(1)))
+        x = _mix(x ^ (np.asarray(kind, dtype=np.uint64) * _GOLDEN))
+        x = _mix(x + np.asarray(counter, dtype=np.uint64))
+    return (x >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+def simulate(arrays, n, dice=6, skips=3, sit_hours=0.0, board_length=None, threshold=None, rng=None,
+             speed=None, group=None, policy=None, stream=None, antithetic=False, recorder=None):
+    """Play n playthroughs of the board and return a SimResult.
+
+    dice, skips, sit_hours, board_length and threshold may be scalars or
+    arrays of length n, so a whole grid of rule variants runs as one batch.
+    A team skips an obtain tile when it has a skip left and the tile's median
+    hours are at least `threshold` (default: arrays.default_skip_threshold()).
+    Landing on a SIT tile costs sit_hours; the event ends once a roll or a
+    ladder takes the team past board_length (default: the last tile).
+
+    speed is an optional (groups, tiles) table of kph multipliers and group
+    the row of that table each playthrough uses; tile times (and the hours a
+    team expects when deciding to skip) are divided by it.
+
+    policy, if given, replaces the threshold rule: policy.skip(skips_left,
+    tile, hours_so_far) returns which of the teams that landed on an obtain
+    tile (and still have a skip) skip it.
+
+    stream (an integer seed) draws every roll and tile time from
+    stream_uniforms instead of rng, so two calls with the same stream see
+    the same dice and drops (common random numbers). With antithetic, the
+    second half of the playthroughs replays the first half with every
+    uniform u replaced by 1 - u; n must be even.
+
+    recorder (e.g. a trajectories.TrajectoryWriter) is told about every
+    obtain tile landing: recorder.record(rows, roll number, tile, hours
+    spent, skipped), after recorder.begin(n).
+    """
+    rng = np.random.default_rng(rng)
+    if board_length is None:
+        board_length = arrays.last_tile
+    if threshold is None:
+        threshold = arrays.default_skip_threshold()
+    dice = _per_row(dice, n, np.int64)
+    skips_left = _per_row(skips, n, np.int64)
+    sit_hours = _per_row(sit_hours, n, float)
+    end = _per_row(board_length, n, np.int64)
+    threshold = _per_row(threshold, n, float)
+    if speed is None:
+        speed, group = np.ones((1, arrays.last_tile + 1)), np.zeros(n, dtype=np.int64)
+
+    size = arrays.last_tile + 1
+    q = arrays.icdf.shape[1]
+    pos = np.zeros(n, dtype=np.int64)
+    hours = np.zeros(n)
+    skips_used = np.zeros(n, dtype=np.int64)
+    rolls = np.zeros(n, dtype=np.int64)
+    visits = np.zeros(size, dtype=np.int64)
+    skipped = np.zeros(size, dtype=np.int64)
+
+    tile_mean = arrays.icdf.mean(axis=1)
+    control = np.zeros(n)
+    if antithetic and stream is None:
+        stream = int(rng.integers(2 ** 63))
+    if stream is not None:
+        half = n // 2 if antithetic else n
+        row_id = np.arange(n) % half
+        flip = np.arange(n) >= half if antithetic else np.zeros(n, dtype=bool)
+    if recorder is not None:
+        recorder.begin(n)
+
+    def uniforms(rows, kind, counter):
+        if stream is None:
+            return rng.random(rows.size)
+        u = stream_uniforms(stream, row_id[rows], kind, counter)
+        return np.where(flip[rows], 1.0 - u, u)
+
+    # With a stream, the k-th landing of a playthrough on a tile draws counter k, so every
+    # row carries a visit count per tile; rows are played STREAM_BATCH at a time to keep
+    # that table small. The uniforms depend only on the row, so batching changes nothing.
+    batch = n if stream is None else STREAM_BATCH
+    for lo in range(0, n, max(batch, 1)):
+        active = np.arange(lo, min(lo + batch, n))
+        if stream is not None:
+            tile_visits = np.zeros((active.size, size), dtype=np.uint16)
+        while active.size:
+            u = uniforms(active, 0, rolls[active])
+            landed = pos[active] + 1 + np.minimum(u * dice[active], dice[active] - 1).astype(np.int64)
+            rolls[active] += 1
+            on_board = landed <= end[active]
+            landed = np.minimum(landed, arrays.last_tile)
+            hours[active] += np.where(on_board & arrays.sit[landed], sit_hours[active], 0.0)
+            dest = arrays.target[landed]
+            on_board &= dest <= end[active]
+
+            active, dest = active[on_board], dest[on_board]
+            pos[active] = dest
+            skips_left[active] = np.maximum(skips_left[active] + arrays.skip_change[dest], 0)
+
+            tasks = arrays.obtain[dest]
+            active_t, dest_t = active[tasks], dest[tasks]
+            visits += np.bincount(dest_t, minlength=size)
+            tile_speed = speed[group[active_t], dest_t]
+            if policy is None:
+                skip = (skips_left[active_t] > 0) & (arrays.median_hours[dest_t] / tile_speed >= threshold[active_t])
+            else:
+                skip = (skips_left[active_t] > 0) & policy.skip(skips_left[active_t], dest_t, hours[active_t])
+            skips_left[active_t[skip]] -= 1
+            skips_used[active_t[skip]] += 1
+            skipped += np.bincount(dest_t[skip], minlength=size)
+
+            work, dest_w = active_t[~skip], dest_t[~skip]
+            if stream is None:
+                u = uniforms(work, None, None)
+            else:
+                u = uniforms(work, 1 + dest_w, tile_visits[work - lo, dest_w])
+                tile_visits[work - lo, dest_w] += 1
+            sample = arrays.icdf[dest_w, np.minimum(u * q, q - 1).astype(np.int64)]
+            hours[work] += sample / tile_speed[~skip]
+            control[work] += (sample - tile_mean[dest_w]) / tile_speed[~skip]
+            if recorder is not None:
+                spent = np.zeros(active_t.size)
+                spent[~skip] = sample / tile_speed[~skip]
+                recorder.record(active_t, rolls[active_t], dest_t, spent, skip)
+
+    return SimResult(hours, skips_used, rolls, visits, skipped, control)
+
+
+def sweep(arrays, n, dice=(6,), skips=(3,), sit_hours=(0.0,), board_length=(None,), threshold=None, rng=None):
+    """Evaluate every combination of rule parameters in one batched simulation.
+
+    Returns one dict per combination with expected, median and P90 event hours.
+    """
+    combos = list(itertools.product(dice, skips, sit_hours,
+                                    [arrays.last_tile if L is None else L for L in board_length]))
+    cols = np.array(combos, dtype=float).T
+    res = simulate(arrays, len(combos) * n,
+                   dice=np.repeat(cols[0], n).astype(np.int64),
+                   skips=np.repeat(cols[1], n).astype(np.int64),
+                   sit_hours=np.repeat(cols[2], n),
+                   board_length=np.repeat(cols[3], n).astype(np.int64),
+                   threshold=threshold, rng=rng)
+    hours = res.hours.reshape(len(combos), n)
+    p50, p90 = np.percentile(hours, [50, 90], axis=1)
+    mean = hours.mean(axis=1)
+    skips_used = res.skips_used.reshape(len(combos), n).mean(axis=1)
+    return [
+        {"dice": d, "skips": s, "sit_hours": sit, "board_length": L,
+         "mean_hours": mean[i], "median_hours": p50[i], "p90_hours": p90[i], "skips_used": skips_used[i]}
+        for i, (d, s, sit, L) in enumerate(combos)
+    ]
+
+
+class Comparison:
+    """Policy A minus policy B in expected event hours.
+
+    diff and stderr come from the variance-reduced paired estimator;
+    naive_stderr is what independent runs of the same size would give, so
+    (naive_stderr / stderr) ** 2 is the saving in playthroughs.
+    """
+
+    def __init__(self, mean_a, mean_b, diff, stderr, naive_stderr, n):
+        self.mean_a = mean_a
+        self.mean_b = mean_b
+        self.diff = diff
+        self.stderr = stderr
+        self.naive_stderr = naive_stderr
+        self.n = n
+
+    @property
+    def speedup(self):
+        return (self.naive_stderr / self.stderr) ** 2 if self.stderr > 0 else np.inf
+
+
+def _controlled(y, c):
+    """y - beta * c with the regression-optimal beta (c has mean zero)."""
+    var = c.var()
+    return y - (np.cov(y, c)[0, 1] / var) * c if var > 0 else y
+
+
+def compare(arrays, n, a, b, dice=6, skips=3, sit_hours=0.0, crn=True, antithetic=True, control=True, rng=None):
+    """Estimate E[hours | A] - E[hours | B] for two skip strategies.
+
+    a and b are simulate keyword dicts, e.g. {"threshold": 10} or
+    {"policy": risk}. With crn both see the same dice and drop streams;
+    antithetic pairs every playthrough with its mirror; control subtracts
+    the tile-time control variate, whose mean (the per-tile table means the
+    simulator samples from) is known exactly.
+    """
+    rng = np.random.default_rng(rng)
+    n += n % 2 if antithetic else 0
+    seed_a = int(rng.integers(2 ** 63))
+    seed_b = seed_a if crn else int(rng.integers(2 ** 63))
+    common = dict(dice=dice, skips=skips, sit_hours=sit_hours, antithetic=antithetic)
+    ra = simulate(arrays, n, stream=seed_a, **common, **a)
+    rb = simulate(arrays, n, stream=seed_b, **common, **b)
+
+    def pairs(x):
+        return (x[:n // 2] + x[n // 2:]) / 2 if antithetic else x
+
+    d = pairs(ra.hours - rb.hours)
+    if control:
+        d = _controlled(d, pairs(ra.control - rb.control))
+    naive = np.sqrt((ra.hours.var() + rb.hours.var()) / n)
+    return Comparison(ra.hours.mean(), rb.hours.mean(), d.mean(), d.std(ddof=1) / np.sqrt(d.size), naive, n)
+
+
+class AdaptiveResult:
+    """Statistics from an adaptive run.
+
+    quantiles[p] = (estimate, lo, hi) of the p-quantile of event hours;
+    skip_freq[t] is the fraction of playthroughs that skipped tile t, with
+    confidence half-width skip_halfwidth[t].
+    """
+
+    def __init__(self, hours, quantiles, skip_freq, skip_halfwidth, batches, converged):
+        self.hours = hours
+        self.n = hours.size
+        self.quantiles = quantiles
+        self.skip_freq = skip_freq
+        self.skip_halfwidth = skip_halfwidth
+        self.batches = batches
+        self.converged = converged
+
+
+def quantile_ci(sorted_hours, p, z):
+    """Distribution-free (order statistic) confidence interval for the p-quantile."""
+    n = sorted_hours.size
+    spread = z * np.sqrt(n * p * (1 - p))
+    lo = int(np.clip(np.floor(n * p - spread), 0, n - 1))
+    hi = int(np.clip(np.ceil(n * p + spread), 0, n - 1))
+    return sorted_hours[min(int(n * p), n - 1)], sorted_hours[lo], sorted_hours[hi]
+
+
+def adaptive(arrays, precision=2.0, quantiles=(0.5, 0.9), skip_precision=0.01, confidence=0.95,
+             batch=2000, max_playthroughs=2_000_000, rng=None, **kwargs):
+    """Simulate in batches until every requested statistic is known to the target precision.
+
+    precision is the largest allowed confidence half-width (hours) of each
+    quantile, skip_precision that of every tile's skip frequency. After
+    each batch the half-widths, which shrink like 1/sqrt(n), give the
+    playthroughs still needed; the next batch runs just those (at most
+    doubling n, so a noisy early estimate can't overshoot badly).
+    Remaining keyword arguments go to simulate().
+    """
+    rng = np.random.default_rng(rng)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    hours, skipped = [], np.zeros(arrays.last_tile + 1)
+    n, want, batches = 0, batch, 0
+    while True:
+        res = simulate(arrays, want, rng=rng, **kwargs)
+        hours.append(res.hours)
+        skipped += res.skipped
+        n += want
+        batches += 1
+
+        all_hours = np.sort(np.concatenate(hours))
+        hours = [all_hours]
+        qs = {p: quantile_ci(all_hours, p, z) for p in quantiles}
+        freq = skipped / n
+        p_skip = np.clip(freq, 0.0, 1.0)  # a snake can bring a team back to skip a tile twice
+        skip_hw = z * np.sqrt(p_skip * (1 - p_skip) / n)
+        widths = [(hi - lo) / 2 / precision for _, lo, hi in qs.values()] + [skip_hw.max() / skip_precision]
+        worst = max(widths)
+        if worst <= 1 or n >= max_playthroughs:
+            return AdaptiveResult(all_hours, qs, freq, skip_hw, batches, worst <= 1)
+        need = int(np.ceil(n * worst ** 2 * 1.05)) - n
+        want = int(np.clip(need, batch, min(n, max_playthroughs - n)))
@@ -0,0 +1,97 @@
+# Calendar finishing time of a team from when its members play, e.g.
+#   {"days": 10, "start_weekday": 4,
+#    "members": [{"name": "A", "windows": [[18, 23]], "speed": 1.0},
+#                {"name": "B", "windows": [[20, 2]], "weekdays": [5, 6], "reliability": 0.8}]}
+# A capacity-curve approximation, not an event simulation: sessions become a member-hours curve and
+# the event finishes when that curve covers the playthrough's total hours.
+import json
+
+import numpy as np
+
+import board_sim
+
+
+def load_roster(path):
+    with open(path) as f:
+        roster = json.load(f)
+    for i, m in enumerate(roster["members"]):
+        m.setdefault("name", f"Member {i + 1}")
+    return roster
+
+
+def sessions(roster):
+    """[(member index, start hour, end hour, reliability, speed), ...] over the whole event."""
+    out = []
+    start_weekday = roster.get("start_weekday", 0)
+    for i, m in enumerate(roster["members"]):
+        for day in range(roster["days"]):
+            if "weekdays" in m and (start_weekday + day) % 7 not in m["weekdays"]:
+                continue
+            for lo, hi in m["windows"]:
+                end = hi if hi > lo else hi + 24
+                out.append((i, day * 24 + lo, day * 24 + end, m.get("reliability", 1.0), m.get("speed", 1.0)))
+    return out
+
+
+class CalendarResult:
+    """finish[i] = calendar hours from the start until event i finished (inf if not by the deadline)."""
+
+    def __init__(self, finish, play_hours, deadline):
+        self.finish = finish
+        self.play_hours = play_hours
+        self.deadline = deadline
+        self.p_finish = np.mean(finish <= deadline)
+
+    def finish_quantile(self, p):
+        """Calendar hours by which a fraction p of events finished (inf if fewer than p finish)."""
+        return np.quantile(self.finish, p, method="higher")
+
+
+def capacity_curve(shows):
+    """Breakpoints (times, cumulative member-hours) from the sessions that happen.
+
+    shows is [(start, end, speed), ...]; between consecutive session starts
+    and ends the team's online speed is constant.
+    """
+    bounds = np.array([(start, speed) for start, _, speed in shows] + [(end, -speed) for _, end, speed in shows],
+                      dtype=float).reshape(-1, 2)
+    order = np.argsort(bounds[:, 0], kind="stable")
+    times = np.concatenate(([0.0], bounds[order, 0]))
+    rate = np.concatenate(([0.0], np.cumsum(bounds[order, 1])))[:-1]  # online speed over each interval
+    return times, np.concatenate(([0.0], np.cumsum(rate * np.diff(times))))
+
+
+def finish_times(times, work, needed):
+    """Calendar hours at which cumulative work reaches each of `needed` (inf if never)."""
+    k = np.searchsorted(work, needed, side="left")
+    out = np.full(needed.shape, np.inf)
+    ok = k < work.size
+    k = np.maximum(k[ok], 1)
+    w0, w1 = work[k - 1], work[k]
+    frac = np.where(w1 > w0, (needed[ok] - w0) / np.where(w1 > w0, w1 - w0, 1.0), 0.0)
+    out[ok] = times[k - 1] + frac * (times[k] - times[k - 1])
+    return out
+
+
+def capacity_calendar(arrays, roster, n, rng=None, **kwargs):
+    """Finish times of n events: board playthroughs (kwargs go to board_sim.simulate) against the roster's capacity curve."""
+    rng = np.random.default_rng(rng)
+    deadline = roster["days"] * 24.0
+    play = board_sim.simulate(arrays, n, rng=rng, **kwargs).hours
+    slots = sessions(roster)
+    if not slots:
+        return CalendarResult(np.full(n, np.inf), play, deadline)
+    reliability = np.array([s[3] for s in slots])
+    attended = rng.random((n, len(slots))) < reliability
+    finish = np.empty(n)
+    # Events with the same attendance pattern share a capacity curve; with
+    # reliable members that is most of them
+    patterns, inverse = np.unique(np.packbits(attended, axis=1), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(order, np.flatnonzero(np.diff(inverse[order])) + 1)
+    for rows in groups:
+        shows = [(s[1], s[2], s[4]) for s, on in zip(slots, attended[rows[0]]) if on]
+        times, work = capacity_curve(shows)
+        finish[rows] = finish_times(times, work, play[rows])
+    return CalendarResult(finish, play, deadline)
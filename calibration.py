@@ -0,0 +1,180 @@
+# Fit team / activity speed factors to a completion log (CSV or JSON rows of hours plus tile or description).
+#   python vibeslop.py --calibrate completions.csv     -> calibration.json, applied by add_tile while it exists
+import csv
+import json
+import os
+
+import numpy as np
+
+import attempts
+import nbkernel
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(HERE, "calibration.json")
+PRIOR_SD = 0.5
+TINY = 1e-300  # floor on an attempt tile's density, for times off the end of its grid
+
+
+class Calibration:
+    """Fitted speed factors: team_speed (global) and {activity: kph multiplier}."""
+
+    def __init__(self, team_speed=1.0, activities=None, observations=0, log_likelihood=None, unmatched=()):
+        self.team_speed = team_speed
+        self.activities = activities or {}
+        self.observations = observations
+        self.log_likelihood = log_likelihood
+        self.unmatched = list(unmatched)  # log rows that matched no obtain tile
+
+    def speed(self, activity=None):
+        return self.team_speed * self.activities.get(activity, 1.0)
+
+    def combined(self, previous):
+        """These factors applied on top of `previous` (the fit was made on an already-calibrated board)."""
+        acts = dict(previous.activities)
+        for a, m in self.activities.items():
+            acts[a] = acts.get(a, 1.0) * m
+        return Calibration(previous.team_speed * self.team_speed, acts, self.observations, self.log_likelihood)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"team_speed": self.team_speed, "activities": self.activities,
+                       "observations": self.observations}, f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get("team_speed", 1.0), data.get("activities", {}), data.get("observations", 0))
+
+
+def load_log(path):
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            return [{k.strip().lower(): v for k, v in row.items()} for row in csv.DictReader(f)]
+        return json.load(f)
+
+
+def _key(text):
+    return " ".join(text.lower().split())
+
+
+class Observations:
+    """Log rows matched to obtain tiles of a board, as parallel arrays."""
+
+    def __init__(self, board, rows):
+        by_desc = {}
+        for t in board:
+            if t["category"] == "obtain":
+                by_desc.setdefault(_key(t["description"]), t)
+        by_num = {t["tile"]: t for t in board if t["category"] == "obtain"}
+        matched, self.unmatched = [], []
+        for row in rows:
+            t = by_desc.get(_key(row.get("description") or "")) or by_num.get(int(row.get("tile") or -1))
+            if t is None or not t["median_hours"] or float(row["hours"]) <= 0:
+                self.unmatched.append(row)
+                continue
+            matched.append((t, float(row["hours"]), row.get("activity") or t.get("activity")))
+
+        self.activities = sorted({a for _, _, a in matched if a})
+        index = {a: i for i, a in enumerate(self.activities)}
+        self.n = len(matched)
+        self.hours = np.array([h for _, h, _ in matched])
+        self.act = np.array([index.get(a, -1) for _, _, a in matched], dtype=np.int64)
+        self.rate = np.array([t.get("rate") or 0.0 for t, _, _ in matched])
+        self.r = np.array([t.get("drops") or 1 for t, _, _ in matched], dtype=float)
+        self.att = np.array([bool(t.get("attempts")) for t, _, _ in matched], dtype=bool)
+        self.nb = (self.rate > 0) & ~self.att
+        # Hours per unit of the kill variable (grid step for attempt tiles) at the current estimate
+        med = np.full(self.n, np.log(2))
+        if self.nb.any():
+            med[self.nb] = nbkernel.nbinom_ppf(0.5, self.r[self.nb], self.rate[self.nb]) + self.r[self.nb]
+        # Attempt tiles: every distinct model's pmf end to end in one array, located by start / size
+        pmfs, first = [], {}
+        self.start = np.zeros(self.n, dtype=np.int64)
+        self.size = np.zeros(self.n, dtype=np.int64)
+        for i in np.flatnonzero(self.att):
+            model = attempts.model(matched[i][0]["attempts"])
+            if id(model) not in first:
+                first[id(model)] = sum(p.size for p in pmfs)
+                pmfs.append(model.pmf / model.pmf.sum())
+            self.start[i], self.size[i] = first[id(model)], model.pmf.size
+            med[i] = model.median_hours * 60 / model.step
+        self.pmf = np.concatenate(pmfs) if pmfs else np.zeros(0)
+        self.scale = np.array([t["median_hours"] for t, _, _ in matched]) / med
+
+    def log_likelihood(self, theta):
+        """(log likelihood, gradient) at theta = [log g, log m_1, ..., log m_k], without the prior."""
+        from scipy.special import digamma, gammaln
+        log_f = theta[0] + np.append(theta[1:], 0.0)[self.act]  # act -1 (untagged) picks the trailing 0
+        x = self.hours * np.exp(log_f) / self.scale  # implied kills (or Exp(1) variable)
+        ll = log_f - np.log(self.scale)
+        dll = np.ones(self.n)
+        nb, r = self.nb, self.r[self.nb]
+        y = np.maximum(x[nb] - r, 0.0)
+        q = np.log1p(-self.rate[nb])
+        ll[nb] += gammaln(y + r) - gammaln(r) - gammaln(y + 1) + r * np.log(self.rate[nb]) + y * q
+        dll[nb] += np.where(x[nb] > r, x[nb] * (digamma(y + r) - digamma(y + 1) + q), 0.0)
+        exp = ~nb & ~self.att
+        ll[exp] -= x[exp]
+        dll[exp] -= x[exp]
+        if self.att.any():
+            xa, start, size = x[self.att], self.start[self.att], self.size[self.att]
+            k = np.minimum(xa.astype(np.int64), size - 2)
+            lo, hi = self.pmf[start + k], self.pmf[start + k + 1]
+            slope = np.where(xa - k < 1, hi - lo, 0.0)
+            p = np.maximum(lo + np.minimum(xa - k, 1.0) * (hi - lo), TINY)
+            ll[self.att] += np.log(p)
+            dll[self.att] += np.where(p > TINY, xa * slope / p, 0.0)
+        grad = np.concatenate(([dll.sum()], np.bincount(self.act[self.act >= 0], weights=dll[self.act >= 0],
+                                                         minlength=len(self.activities))))
+        return ll.sum(), grad
+
+
+def fit(board, rows, prior_sd=PRIOR_SD, previous=None):
+    """Maximum a posteriori speed factors for board given completion log rows.
+
+    When board was built with `previous` factors applied, the fit is of the
+    remaining correction and the prior is on the combined multiplier, so
+    refitting the same log does not keep shrinking the estimates.
+    """
+    from scipy.optimize import minimize
+
+    obs = Observations(board, rows)
+    if not obs.n:
+        raise ValueError("no log rows match an obtain tile of the board")
+    prior_mean = -np.log([(previous or Calibration()).activities.get(a, 1.0) for a in obs.activities])
+
+    def objective(theta):
+        ll, grad = obs.log_likelihood(theta)
+        dev = theta[1:] - prior_mean
+        grad = grad.copy()
+        grad[1:] -= dev / prior_sd ** 2
+        return -(ll - 0.5 * np.sum(dev ** 2) / prior_sd ** 2), -grad
+
+    res = minimize(objective, np.zeros(1 + len(obs.activities)), jac=True, method="L-BFGS-B")
+    return Calibration(float(np.exp(res.x[0])), {a: float(np.exp(v)) for a, v in zip(obs.activities, res.x[1:])},
+                       obs.n, float(-res.fun), obs.unmatched)
+
+
+def default_path():
+    return os.environ.get("CALIBRATION_FILE", DEFAULT_PATH)
+
+
+_current = None
+
+
+def current():
+    """The Calibration in CALIBRATION_FILE (default calibration.json here); all factors 1 without one."""
+    global _current
+    if _current is None:
+        path = default_path()
+        _current = Calibration.load(path) if os.path.exists(path) else Calibration()
+        if _current.team_speed != 1 or any(m != 1 for m in _current.activities.values()):
+            print(f"Using calibration from {path} (team speed {_current.team_speed:.2f}, "
+                  f"{len(_current.activities)} activity factors)")
+    return _current
+
+
+def speed(activity=None):
+    """Speed factor for tiles of `activity` (global team speed for untagged tiles)."""
+    return current().speed(activity)
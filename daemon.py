@@ -0,0 +1,131 @@
+# Watch mode: stay resident and re-estimate whenever the inputs change.
+#   python vibeslop.py --watch [--board board.json]
+# Only tiles whose layout_key / estimate_key changed are re-estimated; an edit that changes nothing is skipped.
+import importlib
+import os
+import time
+import traceback
+
+import numpy as np
+
+import board_sim
+import calibration
+import dropdb
+import ehb
+
+POLL_SECONDS = 0.25
+CHECK_PLAYTHROUGHS = 5000
+
+
+def layout_key(board):
+    """Everything about a board except obtain tile estimates; if this changes BoardArrays is rebuilt."""
+    return sorted((t["tile"], t["category"], t.get("target"), t["description"] if t["category"] != "obtain" else
+                   bool(board_sim.SIT_RE.search(t["description"]))) for t in board)
+
+
+def estimate_key(tile):
+    return tile["median_hours"], tile.get("drops"), tile.get("rate"), tile.get("attempts")
+
+
+class Estimator:
+    """The warm state: current board, its BoardArrays and the last simulated hours."""
+
+    def __init__(self, source=None, kind="board", output="./snakes_ladders_estimates.xlsx",
+                 playthroughs=CHECK_PLAYTHROUGHS, seed=0, load_kwargs=None, **sim_kwargs):
+        self.source = source
+        self.kind = kind
+        self.load_kwargs = load_kwargs or {}
+        self.output = output
+        self.playthroughs = playthroughs
+        self.seed = seed
+        self.sim_kwargs = sim_kwargs
+        self.module = importlib.import_module("vibeslop")
+        self.board = None
+        self.arrays = None
+        self.hours = None
+        self.spreads = None
+
+    def watched(self):
+        paths = [os.path.abspath(self.module.__file__), dropdb.DEFAULT_PATH, ehb.default_path(),
+                 calibration.default_path()]
+        if self.source:
+            paths.append(self.source)
+        return [p for p in paths if p]
+
+    def _load(self, reload_module):
+        if reload_module:
+            ehb._rates = None
+            dropdb._db = None
+            calibration._current = None
+            self.module = importlib.reload(self.module)
+        if self.source is None:
+            return self.module.tiles
+        if self.kind == "board":
+            return self.module.load_board(self.source)
+        loader = {"text": self.module.board_from_text, "pdf": self.module.board_from_pdf}[self.kind]
+        return loader(self.source, **self.load_kwargs)
+
+    def refresh(self, reload_module=True):
+        """Reload the board and bring everything up to date; returns a one-line report."""
+        started = time.perf_counter()
+        board = self._load(reload_module)
+        old = {t["tile"]: t for t in self.board or []}
+        changed = [t for t in board if t["category"] == "obtain"
+                   and (t["tile"] not in old or estimate_key(t) != estimate_key(old[t["tile"]]))]
+        relayout = self.board is None or layout_key(board) != layout_key(self.board)
+        if not relayout and not changed:
+            self.board = board
+            return f"no estimate changed; {self.output} kept"
+        if relayout:
+            self.arrays = board_sim.BoardArrays(board)
+            self.spreads = self.module.tile_spreads(board)
+            what = "layout changed, board rebuilt" if self.board else f"{len(board)} tiles"
+        else:
+            for t in changed:
+                self.arrays.update_tile(t)
+            self.spreads.update(self.module.tile_spreads(changed))
+            what = f"{len(changed)} tiles re-estimated"
+        self.board = board
+        res = board_sim.simulate(self.arrays, self.playthroughs, stream=self.seed, **self.sim_kwargs)
+        before, self.hours = self.hours, np.median(res.hours)
+        self.module.write_workbook(board, self.output, self.spreads)
+
+        report = f"{what}; median event {self.hours:.1f} hrs"
+        if before is not None:
+            report += f" ({self.hours - before:+.1f})"
+        moved = [f"#{t['tile']} {old[t['tile']]['median_hours']:g} -> {t['median_hours']:g}h"
+                 for t in changed[:5] if t["tile"] in old]
+        if moved:
+            report += "; " + ", ".join(moved) + (" ..." if len(changed) > 5 else "")
+        return report + f"; {self.output} in {time.perf_counter() - started:.2f}s"
+
+
+def mtimes(paths):
+    out = {}
+    for p in paths:
+        try:
+            out[p] = os.stat(p).st_mtime_ns
+        except OSError:
+            out[p] = None
+    return out
+
+
+def watch(estimator, interval=POLL_SECONDS, cycles=None):
+    """Poll the estimator's inputs forever (or for `cycles` polls), refreshing on every change."""
+    print(estimator.refresh(reload_module=False), flush=True)
+    seen = mtimes(estimator.watched())
+    polls = 0
+    while cycles is None or polls < cycles:
+        time.sleep(interval)
+        polls += 1
+        now = mtimes(estimator.watched())
+        if now == seen:
+            continue
+        # only a board-file edit leaves the module and its cached data alone
+        reload_module = any(now[p] != seen.get(p) for p in now if p != estimator.source)
+        seen = now
+        try:
+            print(estimator.refresh(reload_module), flush=True)
+        except Exception:
+            traceback.print_exc()
+            print("Keeping the last good estimates; waiting for the next change", flush=True)
@@ -0,0 +1,163 @@
+# Drop-rate database (drops.npz) built from locally saved OSRS wiki pages.
+#   python vibeslop.py --build-dropdb pages/
+# Without a database every lookup returns its default, so the hand-set rates keep working.
+import html
+import os
+import re
+from html.parser import HTMLParser
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(HERE, "drops.npz")
+RARITY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*/\s*(\d[\d,]*(?:\.\d+)?)")
+TITLE_RE = re.compile(r"<title>(.*?)(?:\s+-\s+OSRS Wiki)?\s*</title>", re.S)
+
+
+def name_key(name):
+    return re.sub(r"\s+", " ", name.replace(" ", " ")).strip().lower()
+
+
+def parse_rarity(text):
+    """'1/128', '~3/1,419', 'Always' -> per-kill chance, or None if there is none."""
+    text = text.strip()
+    if text.lower().startswith("always"):
+        return 1.0
+    m = RARITY_RE.search(text)
+    if not m:
+        return None
+    return float(m.group(1)) / float(m.group(2).replace(",", ""))
+
+
+class _DropTableParser(HTMLParser):
+    """Collects (item, rarity text) from <table class="... item-drops ..."> rows."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._table = 0  # nesting depth inside an item-drops table
+        self._cells = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "table":
+            if self._table or "item-drops" in (attrs.get("class") or ""):
+                self._table += 1
+        elif not self._table:
+            return
+        elif tag == "tr":
+            self._cells = []
+        elif tag in ("td", "th") and self._cells is not None:
+            self._cell = []
+            self._cells.append(self._cell)
+        elif tag == "a" and self._cell is not None and not self._cell and attrs.get("title"):
+            self._cell.append(attrs["title"])
+
+    def handle_endtag(self, tag):
+        if tag == "table" and self._table:
+            self._table -= 1
+        elif tag == "tr" and self._cells is not None:
+            self._row(self._cells)
+            self._cells = self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _row(self, cells):
+        # Item drops rows are: image, item, quantity, rarity, price, ...
+        texts = ["".join(c).strip() for c in cells]
+        if len(texts) < 4 or not texts[1]:
+            return
+        self.rows.append((cells[1][0].strip() if cells[1] else texts[1], texts[3]))
+
+
+def parse_page(path):
+    """[(item, source, rate), ...] for one saved wiki page; the source is the page title."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        page = f.read()
+    # Saved pages are mostly navigation and scripts; only the span holding the
+    # drop tables goes through the (slow) HTML parser
+    parser = _DropTableParser()
+    first = page.find("item-drops")
+    if first >= 0:
+        parser.feed(page[page.rfind("<table", 0, first):page.rfind("</table>") + len("</table>")])
+    m = TITLE_RE.search(page)
+    source = (m and html.unescape(m.group(1)).strip()) or os.path.splitext(os.path.basename(path))[0]
+    out = []
+    for item, rarity in parser.rows:
+        rate = parse_rarity(rarity)
+        if rate is not None:
+            out.append((name_key(item), name_key(source), rate))
+    return out
+
+
+def build(pages_dir, out_path=DEFAULT_PATH, workers=None):
+    """Parse every saved page in pages_dir in parallel and write the database; returns the row count."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    paths = sorted(os.path.join(pages_dir, n) for n in os.listdir(pages_dir)
+                   if n.lower().endswith((".html", ".htm")))
+    rates = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rows in pool.map(parse_page, paths, chunksize=max(1, len(paths) // (8 * (os.cpu_count() or 1)))):
+            for item, source, rate in rows:
+                rates[item, source] = min(rates.get((item, source), 0.0) + rate, 1.0)
+
+    items = sorted({i for i, _ in rates})
+    sources = sorted({s for _, s in rates})
+    item_idx = {n: i for i, n in enumerate(items)}
+    source_idx = {n: i for i, n in enumerate(sources)}
+    keys = sorted(rates)
+    np.savez_compressed(out_path,
+                        items=np.array(items), sources=np.array(sources),
+                        item=np.array([item_idx[i] for i, _ in keys], dtype=np.int32),
+                        source=np.array([source_idx[s] for _, s in keys], dtype=np.int32),
+                        rate=np.array([rates[k] for k in keys]))
+    return len(keys)
+
+
+class DropDB:
+    """rate(item, source) lookups over a database written by build()."""
+
+    def __init__(self, path):
+        with np.load(path) as data:
+            items, sources = data["items"].tolist(), data["sources"].tolist()
+            item, source, rate = data["item"], data["source"], data["rate"]
+        self.by_key = {}
+        self.by_item = {}
+        for i, s, r in zip(item.tolist(), source.tolist(), rate.tolist()):
+            self.by_key[items[i], sources[s]] = r
+            self.by_item.setdefault(items[i], []).append((sources[s], r))
+
+    def rate(self, item, source=None):
+        """Chance per kill of `item` from `source`, or from its best source; None if unknown."""
+        item = name_key(item)
+        if source is not None:
+            return self.by_key.get((item, name_key(source)))
+        found = self.by_item.get(item)
+        return max(r for _, r in found) if found else None
+
+    def sources(self, item):
+        """[(source, rate), ...] for item, best first."""
+        return sorted(self.by_item.get(name_key(item), []), key=lambda x: -x[1])
+
+
+_db = None
+
+
+def database():
+    """The DropDB at DROPDB_FILE (default drops.npz here), or None if there isn't one."""
+    global _db
+    if _db is None:
+        path = os.environ.get("DROPDB_FILE", DEFAULT_PATH)
+        _db = DropDB(path) if os.path.exists(path) else False
+    return _db or None
+
+
+def drop_rate(item, source=None, default=None):
+    """Per-kill chance of item (from source, or its best source), or default if it isn't in the database."""
+    db = database()
+    rate = db.rate(item, source) if db else None
+    return default if rate is None else rate
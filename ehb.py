@@ -0,0 +1,89 @@
+# Kill rates from a locally saved EHB export (EHB_FILE, default ehb.json / ehb.csv here), e.g.
+#   {"bosses": [{"boss": "sarachnis", "rate": 67}, ...]},  {"sarachnis": 67, ...}  or a boss,rate CSV
+# The parsed table is pickled under .cache/ by the file's path, size and mtime.
+import csv
+import hashlib
+import json
+import os
+import pickle
+import re
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, ".cache")
+NAME_COLUMNS = ("boss", "metric", "name")
+RATE_COLUMNS = ("rate", "ehb", "kph")
+
+
+def boss_key(name):
+    """'Kree'Arra' -> 'kreearra', 'Alchemical Hydra' -> 'alchemical_hydra' (WOM metric style)."""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower().replace("'", "")).strip("_")
+
+
+def default_path():
+    path = os.environ.get("EHB_FILE")
+    if path:
+        return path
+    for name in ("ehb.json", "ehb.csv"):
+        if os.path.exists(os.path.join(HERE, name)):
+            return os.path.join(HERE, name)
+    return None
+
+
+def _pick(row, columns):
+    for c in columns:
+        if c in row:
+            return row[c]
+    raise ValueError(f"EHB row {row} has none of {columns}")
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def parse(path):
+    """Read an EHB export into {boss_key: kills per hour}."""
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = [{k.strip().lower(): v for k, v in row.items()} for row in csv.DictReader(f)]
+        else:
+            rows = json.load(f)
+    if isinstance(rows, dict):
+        rows = rows.get("bosses", rows)
+    if isinstance(rows, dict):
+        return {boss_key(k): _number(v) for k, v in rows.items()}
+    return {boss_key(_pick(r, NAME_COLUMNS)): _number(_pick(r, RATE_COLUMNS)) for r in rows}
+
+
+def load(path, cache_dir=CACHE_DIR):
+    """parse(path) through the pickle cache."""
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}".encode()
+    cache = os.path.join(cache_dir, f"ehb-{hashlib.sha1(key).hexdigest()[:16]}.pickle")
+    try:
+        with open(cache, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    rates = parse(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache, "wb") as f:
+        pickle.dump(rates, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return rates
+
+
+_rates = None
+
+
+def rates():
+    """The current EHB table ({} when there is no export)."""
+    global _rates
+    if _rates is None:
+        path = default_path()
+        _rates = load(path) if path else {}
+    return _rates
+
+
+def kill_rate(boss, default):
+    """Kills per hour for `boss` from the EHB export, or `default` if it isn't listed."""
+    return rates().get(boss_key(boss), default)
@@ -0,0 +1,64 @@
+# Negative binomial quantiles without scipy (same definition as nbinom.ppf), by integer bisection
+# over a log-space binomial sum; non-integer or large r falls back to scipy.
+import numpy as np
+
+R_MAX = 64  # beyond this many drops the finite sum gets long; scipy is fine there
+
+
+def nbinom_sf(k, r, p):
+    """P(K > k) for K ~ NB(r, p) failures, integer r; k, r, p broadcast together."""
+    k, r, p = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(r, dtype=np.int64),
+                                  np.asarray(p, dtype=float))
+    n = k + r
+    # j = 0 term, no drops in n kills: (1-p)^n through log1p so tiny p keeps its
+    # digits, or directly when 1-p is exact (p = 1/2, 1/4, ...) so ties stay exact
+    exact = 1.0 - (1.0 - p) == p
+    term = np.where(exact, np.power(1.0 - p, n), np.exp(n * np.log1p(-p)))
+    ratio = p / (1.0 - p)
+    total = term.copy()
+    for j in range(1, int(r.max(initial=1))):
+        term = term * (np.maximum(n - j + 1, 0.0) / j) * ratio
+        total += np.where(j < r, term, 0.0)
+    return np.where(k < 0, 1.0, np.minimum(total, 1.0))
+
+
+def nbinom_cdf(k, r, p):
+    return 1.0 - nbinom_sf(k, r, p)
+
+
+def nbinom_ppf(q, r, p):
+    """Smallest integer k with P(K <= k) >= q, as nbinom.ppf(q, r, p); float array (or scalar)."""
+    q, r, p = np.broadcast_arrays(np.asarray(q, dtype=float), np.asarray(r, dtype=float),
+                                  np.asarray(p, dtype=float))
+    if q.size and (np.any(r != np.round(r)) or r.max() > R_MAX or np.any(r < 1)):
+        from scipy.stats import nbinom
+        return nbinom.ppf(q, r, p)
+    shape = q.shape
+    q, r, p = q.ravel(), r.ravel().astype(np.int64), p.ravel()
+    out = np.full(q.shape, np.nan)
+    out[q == 0] = -1.0
+    out[q == 1] = np.inf
+    todo = np.flatnonzero((q > 0) & (q < 1) & (p > 0) & (p <= 1))
+    out[todo[p[todo] == 1]] = 0.0
+    todo = todo[p[todo] < 1]
+    if todo.size:
+        q, r, p = q[todo], r[todo], p[todo]
+        # Invariant: cdf(lo) < q <= cdf(hi)
+        mean = r * (1 - p) / p
+        hi = np.ceil(mean + 10 * np.sqrt(mean / p) + 10)
+        while True:
+            short = nbinom_cdf(hi, r, p) < q
+            if not short.any():
+                break
+            hi[short] = 2 * hi[short] + 1
+        lo = np.full(q.shape, -1.0)
+        while True:
+            open_ = hi - lo > 1
+            if not open_.any():
+                break
+            mid = np.floor((lo + hi) / 2)
+            ok = nbinom_cdf(mid, r, p) >= q
+            hi = np.where(open_ & ok, mid, hi)
+            lo = np.where(open_ & ~ok, mid, lo)
+        out[todo] = hi
+    return out.reshape(shape)[()]
@@ -0,0 +1,340 @@
+# Board ingest straight from tile-descriptions.pdf, without a PDF library.
+# Only classic xref tables are read; extracted lines are cached under .cache/ by the PDF's sha256.
+import hashlib
+import os
+import re
+import zlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, ".cache")
+READ_CHUNK = 1 << 16
+MARKER_RE = re.compile(r"[A-Z]{2,4}")  # short all-caps cell on its own, e.g. SIT
+TOKEN_RE = re.compile(rb"""
+    (?P<ws>\s+|%[^\r\n]*)
+  | (?P<dict><<|>>)
+  | (?P<array>[\[\]])
+  | (?P<name>/[^\s/<>\[\]()%{}]*)
+  | (?P<hex><[0-9A-Fa-f\s]*>)
+  | (?P<str>\()
+  | (?P<word>[^\s/<>\[\]()%{}]+)
+""", re.X)
+ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+class Ref:
+    def __init__(self, num):
+        self.num = num
+
+
+def _literal(data, i):
+    """Parse a (...) string starting just after the '('; returns (bytes, end index)."""
+    out, depth = bytearray(), 1
+    while True:
+        c = data[i:i + 1]
+        i += 1
+        if c == b"\\":
+            e = data[i:i + 1]
+            i += 1
+            if e in ESCAPES:
+                out += ESCAPES[e]
+            elif e and e in b"01234567":
+                digits = re.match(rb"[0-7]{1,3}", data[i - 1:i + 2]).group()
+                out.append(int(digits, 8) & 0xFF)
+                i += len(digits) - 1
+            elif e not in b"\r\n":
+                out += e  # unknown escapes (\8, \q, ...) stand for the character itself
+        elif c == b"(":
+            depth += 1
+            out += c
+        elif c == b")":
+            depth -= 1
+            if not depth:
+                return bytes(out), i
+            out += c
+        elif not c:
+            return bytes(out), i
+        else:
+            out += c
+
+
+def tokens(data):
+    """PDF syntax tokens: ('name', b'Font1'), ('str', b'...'), ('num', 1.0), ('op', b'Tj'), ..."""
+    i, n = 0, len(data)
+    while i < n:
+        m = TOKEN_RE.match(data, i)
+        if not m:
+            i += 1
+            continue
+        kind, text = m.lastgroup, m.group()
+        i = m.end()
+        if kind == "ws":
+            continue
+        if kind == "str":
+            s, i = _literal(data, i)
+            yield "str", s
+        elif kind == "hex":
+            h = re.sub(rb"\s", b"", text[1:-1])
+            yield "str", bytes.fromhex((h + b"0" * (len(h) % 2)).decode())
+        elif kind == "name":
+            yield "name", text[1:]
+        elif kind in ("dict", "array"):
+            yield kind, text
+        else:
+            try:
+                yield "num", float(text)
+            except ValueError:
+                yield "op", text
+
+
+def parse_objects(toks):
+    """Turn tokens into Python values (dict / list / Ref / ...) up to the first operator."""
+    stack = [[]]
+    for kind, value in toks:
+        if kind in ("dict", "array") and value in (b"<<", b"["):
+            stack.append([])
+        elif kind == "dict":
+            items = stack.pop()
+            stack[-1].append({items[k]: items[k + 1] for k in range(0, len(items) - 1, 2)})
+        elif kind == "array":
+            items = stack.pop()
+            stack[-1].append(items)
+        elif kind == "op" and value == b"R":
+            stack[-1].pop()  # generation number
+            stack[-1].append(Ref(int(stack[-1].pop())))
+        elif kind == "op" and len(stack) == 1:
+            return stack[0], value
+        else:
+            stack[-1].append(value.decode("latin-1") if kind == "name" else value)
+    return stack[0], None
+
+
+class PdfReader:
+    """Random access to the objects of an uncompressed-xref PDF through its xref table."""
+
+    def __init__(self, f):
+        self.f = f
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 1024))
+        tail = f.read()
+        starts = re.findall(rb"startxref\s+(\d+)", tail)
+        if not starts:
+            raise ValueError(f"{getattr(f, 'name', 'input')}: not a PDF (no startxref)")
+        self.offsets = {}
+        f.seek(int(starts[-1]))
+        buf = f.read(READ_CHUNK)
+        if not buf.lstrip().startswith(b"xref"):
+            kind = "a cross-reference stream" if re.search(rb"/Type\s*/XRef\b", buf) else "no xref table"
+            raise ValueError(f"{getattr(f, 'name', 'input')}: unsupported PDF ({kind}); only classic "
+                             "uncompressed xref tables can be read, re-export or save it as PDF 1.4")
+        while b"trailer" not in buf:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            buf += chunk
+        xref, _, rest = buf.partition(b"trailer")
+        nums = xref.split()[1:]  # drop the 'xref' keyword
+        k = 0
+        while k + 1 < len(nums):
+            first, count = int(nums[k]), int(nums[k + 1])
+            k += 2
+            for j in range(count):
+                off, _, use = nums[k:k + 3]
+                if use == b"n":
+                    self.offsets[first + j] = int(off)
+                k += 3
+        (self.trailer,), _ = parse_objects(tokens(rest[:rest.find(b"startxref")]))
+        if "XRefStm" in self.trailer:
+            # Hybrid file: some objects are only listed in a cross-reference stream
+            raise ValueError(f"{getattr(f, 'name', 'input')}: unsupported PDF (hybrid xref with object streams); "
+                             "only classic uncompressed xref tables can be read")
+
+    def _header(self, num):
+        """(object value, file offset of its stream data or None)."""
+        self.f.seek(self.offsets[num])
+        buf = b""
+        while not re.search(rb"\bendobj\b|\bstream\r?\n", buf):
+            chunk = self.f.read(READ_CHUNK)
+            if not chunk:
+                break
+            buf += chunk
+        body = buf.split(b"obj", 1)[1]
+        m = re.search(rb"\bendobj\b|\bstream\r?\n", body)
+        (value,), _ = parse_objects(tokens(body[:m.start()]))
+        stream_at = None
+        if m.group().startswith(b"stream"):
+            stream_at = self.offsets[num] + len(buf.split(b"obj", 1)[0]) + 3 + m.end()
+        return value, stream_at
+
+    def get(self, value):
+        while isinstance(value, Ref):
+            value = self._header(value.num)[0]
+        return value
+
+    def stream(self, ref):
+        """Decoded stream data of object `ref`, inflated chunk by chunk as it is read."""
+        obj, at = self._header(ref.num)
+        length = int(self.get(obj["Length"]))
+        self.f.seek(at)
+        inflate = zlib.decompressobj() if obj.get("Filter") == "FlateDecode" else None
+        out = []
+        while length > 0:
+            chunk = self.f.read(min(READ_CHUNK, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            out.append(inflate.decompress(chunk) if inflate else chunk)
+        if inflate:
+            out.append(inflate.flush())
+        return b"".join(out)
+
+    def pages(self):
+        """Yield page dicts in document order, walking the page tree lazily."""
+        def walk(node):
+            node = self.get(node)
+            if node.get("Type") == "Pages":
+                for kid in self.get(node["Kids"]):
+                    yield from walk(kid)
+            else:
+                yield node
+        yield from walk(self.get(self.trailer["Root"])["Pages"])
+
+
+def to_unicode(cmap):
+    """{glyph code: text} from a ToUnicode CMap stream."""
+    table = {}
+    toks = list(tokens(cmap))
+    i = 0
+    while i < len(toks):
+        kind, value = toks[i]
+        if kind == "op" and value in (b"beginbfchar", b"beginbfrange"):
+            j = i + 1
+            while toks[j] != ("op", b"end" + value[5:]):
+                j += 1
+            body = toks[i + 1:j]
+            if value == b"beginbfchar":
+                for (_, src), (_, dst) in zip(body[0::2], body[1::2]):
+                    table[int.from_bytes(src, "big")] = dst.decode("utf-16-be")
+            else:
+                k = 0
+                while k < len(body):
+                    lo, hi = int.from_bytes(body[k][1], "big"), int.from_bytes(body[k + 1][1], "big")
+                    if body[k + 2][0] == "array":  # [<dst> <dst> ...]
+                        k += 3
+                        for code in range(lo, hi + 1):
+                            table[code] = body[k][1].decode("utf-16-be")
+                            k += 1
+                        k += 1
+                    else:
+                        start = int.from_bytes(body[k + 2][1], "big")
+                        for code in range(lo, hi + 1):
+                            table[code] = chr(start + code - lo)
+                        k += 3
+            i = j
+        i += 1
+    return table
+
+
+def page_text(reader, page):
+    """[(x, y, font size, text), ...] for every text object drawn on a page."""
+    fonts = {}
+    for name, ref in reader.get(reader.get(page.get("Resources", {})).get("Font", {})).items():
+        font = reader.get(ref)
+        cmap = to_unicode(reader.stream(font["ToUnicode"])) if "ToUnicode" in font else {}
+        fonts[name] = (cmap, 2 if font.get("Encoding") == "Identity-H" else 1)
+    contents = page["Contents"]
+    contents = contents if isinstance(contents, list) else [contents]
+    data = b"".join(reader.stream(ref) for ref in contents)
+
+    def decode(raw, font):
+        cmap, width = fonts.get(font, ({}, 1))
+        codes = [int.from_bytes(raw[k:k + width], "big") for k in range(0, len(raw), width)]
+        return "".join(cmap.get(c, chr(c) if width == 1 else "") for c in codes)
+
+    out, operands, font, size, x, y = [], [], None, 0.0, 0.0, 0.0
+    text = None
+    toks = tokens(data)
+    for kind, value in toks:
+        if kind == "array" and value == b"[":
+            arr, _ = [], None
+            for k2, v2 in toks:
+                if k2 == "array":
+                    break
+                arr.append(v2)
+            operands.append(arr)
+            continue
+        if kind != "op":
+            operands.append(value.decode("latin-1") if kind == "name" else value)
+            continue
+        if value == b"BT":
+            text = []
+        elif value == b"Tf":
+            font, size = operands[-2], operands[-1]
+        elif value == b"Tm":
+            x, y = operands[-2], operands[-1]
+        elif value == b"Td" and text is not None:
+            x, y = x + operands[-2], y + operands[-1]
+        elif value == b"Tj" and text is not None:
+            text.append(decode(operands[-1], font))
+        elif value == b"TJ" and text is not None:
+            text.append("".join(decode(p, font) for p in operands[-1] if isinstance(p, bytes)))
+        elif value == b"ET" and text is not None:
+            s = "".join(text).strip()
+            if s:
+                out.append((x, y, size, s))
+            text = None
+        operands = []
+    return out
+
+
+def page_tiles(items):
+    """Group a page's text into (tile number, description).
+
+    Tile numbers are the digit-only texts left of every other text; each
+    other line joins the row whose number is vertically nearest. A marker
+    in its own column between the two (the "SIT" column) is appended in
+    parentheses, as the board writes it.
+    """
+    words = [it for it in items if not it[3].isdigit()]
+    if not words:
+        return []
+    left = min(x for x, y, size, s in words)
+    anchors = sorted((y, int(s)) for x, y, size, s in items if s.isdigit() and x < left)
+    rows = {num: [] for _, num in anchors}
+    marks = {num: [] for _, num in anchors}
+    for x, y, size, s in sorted(items, key=lambda it: (it[1], it[0])):
+        if not anchors or (s.isdigit() and x < left):
+            continue
+        _, num = min(anchors, key=lambda a: abs(a[0] - y))
+        (marks if MARKER_RE.fullmatch(s) else rows)[num].append(s)
+    return [(num, " ".join(rows[num] + [f"({m})" for m in marks[num]])) for _, num in anchors if rows[num]]
+
+
+def extract_lines(path):
+    """Stream the PDF page by page into "N. description" lines."""
+    lines = []
+    with open(path, "rb") as f:
+        reader = PdfReader(f)
+        for page in reader.pages():
+            lines += [f"{num}. {desc}" for num, desc in page_tiles(page_text(reader, page))]
+    return lines
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def extract_board(path, cache_dir=CACHE_DIR):
+    """Board listing text for the PDF at path, from the cache when this exact file was seen before."""
+    cache = os.path.join(cache_dir, f"board-{file_hash(path)[:16]}.txt")
+    if os.path.exists(cache):
+        with open(cache, encoding="utf-8") as f:
+            return f.read()
+    text = "\n".join(extract_lines(path)) + "\n"
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache, "w", encoding="utf-8") as f:
+        f.write(text)
+    return text
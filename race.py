@@ -0,0 +1,66 @@
+# Race mode: K teams play the same board at once, e.g.
+#   [{"name": "Us", "speed": 1.1, "skip_threshold": 10},
+#    {"name": "Them", "speed": 1.0, "tile_speed": {"252": 1.5}}]
+import json
+
+import numpy as np
+
+import board_sim
+
+RACE_CHUNK = 250_000  # races simulated per batch, bounds memory at K * RACE_CHUNK rows
+
+
+def load_teams(path):
+    with open(path) as f:
+        teams = json.load(f)
+    for i, team in enumerate(teams):
+        team.setdefault("name", f"Team {i + 1}")
+    return teams
+
+
+def speed_table(arrays, teams):
+    """(teams, tiles) kph multipliers for board_sim.simulate."""
+    table = np.ones((len(teams), arrays.last_tile + 1))
+    for i, team in enumerate(teams):
+        table[i] *= team.get("speed", 1.0)
+        for tile, mult in team.get("tile_speed", {}).items():
+            table[i, int(tile)] = mult
+    return table
+
+
+class RaceResult:
+    """win_prob[k] and place_prob[k, j] (team k finishing in place j+1) over all races."""
+
+    def __init__(self, teams, races, wins, places, hours_sum):
+        self.teams = teams
+        self.races = races
+        self.win_prob = wins / races
+        self.place_prob = places / races
+        self.mean_hours = hours_sum / races
+
+
+def race(arrays, teams, races, dice=6, skips=3, sit_hours=0.0, rng=None, chunk=RACE_CHUNK):
+    """Simulate `races` races between `teams`, every team x race as one batched simulation."""
+    rng = np.random.default_rng(rng)
+    k = len(teams)
+    speed = speed_table(arrays, teams)
+    default = arrays.default_skip_threshold()
+    thresholds = np.array([team.get("skip_threshold", default) for team in teams], dtype=float)
+
+    wins = np.zeros(k)
+    places = np.zeros((k, k))
+    hours_sum = np.zeros(k)
+    done = 0
+    while done < races:
+        m = min(chunk, races - done)
+        group = np.repeat(np.arange(k), m)
+        res = board_sim.simulate(arrays, k * m, dice=dice, skips=skips, sit_hours=sit_hours,
+                                 threshold=thresholds[group], rng=rng, speed=speed, group=group)
+        hours = res.hours.reshape(k, m)
+        # place[k, race] = 0 for the winner, 1 for second, ...
+        place = np.argsort(np.argsort(hours, axis=0), axis=0)
+        wins += np.bincount(hours.argmin(axis=0), minlength=k)
+        places += np.bincount((np.arange(k)[:, None] * k + place).ravel(), minlength=k * k).reshape(k, k)
+        hours_sum += hours.sum(axis=1)
+        done += m
+    return RaceResult(teams, races, wins, places, hours_sum)
@@ -0,0 +1,259 @@
+# Skip policy minimizing a quantile or expected shortfall of event hours,
+# by dynamic programming over (tile, skips left, remaining time budget).
+import numpy as np
+
+OBJECTIVES = ("quantile", "shortfall")
+
+
+class RiskPolicy:
+    """Skip decisions for a team aiming at `budget` total hours.
+
+    skip_table[s, tile, b] is the decision with s skips left and b grid steps
+    of budget remaining; once the budget is blown the team falls back to the
+    mean-optimal decision skip_mean[s, tile]. value is the optimized quantile
+    or expected shortfall, baseline the same statistic for the median-ranked
+    threshold policy.
+    """
+
+    def __init__(self, objective, level, dt, budget, skip_table, skip_mean, value, baseline):
+        self.objective = objective
+        self.level = level
+        self.dt = dt
+        self.budget = budget
+        self.skip_table = skip_table
+        self.skip_mean = skip_mean
+        self.value = value
+        self.baseline = baseline
+
+    def skip(self, skips_left, dest, hours):
+        """board_sim.simulate policy hook: which of these teams should skip `dest`."""
+        s = np.minimum(skips_left, self.skip_table.shape[0] - 1)
+        b = np.rint((self.budget - hours) / self.dt).astype(np.int64)
+        over = b < 0
+        b = np.clip(b, 0, self.skip_table.shape[2] - 1)
+        return np.where(over, self.skip_mean[s, dest], self.skip_table[s, dest, b])
+
+    def skip_below(self, tile, skips_left):
+        """Largest remaining budget (hours, up to the planning budget) at which the policy skips `tile`."""
+        reachable = int(round(self.budget / self.dt)) + 1
+        b = np.flatnonzero(self.skip_table[min(skips_left, self.skip_table.shape[0] - 1), tile, :reachable])
+        return b[-1] * self.dt if b.size else None
+
+
+def _fft_size(n):
+    """Smallest 2^a 3^b 5^c >= n."""
+    best = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            p = p35
+            while p < n:
+                p *= 2
+            best = min(best, p)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+class _Grid:
+    """Per-tile completion time on the budget grid, from the simulator's inverse-CDF tables."""
+
+    def __init__(self, arrays, dt, bins):
+        size, q = arrays.icdf.shape
+        k = np.rint(arrays.icdf / dt).astype(np.int64)
+        self.mean = k.mean(axis=1) * dt
+        pmf = np.zeros((size, bins))
+        rows = np.repeat(np.arange(size), q)
+        inside = k.ravel() < bins
+        np.add.at(pmf, (rows[inside], k.ravel()[inside]), 1.0 / q)
+        # Only bins + support - 1 points of the linear convolution are needed,
+        # so most tiles get a much shorter FFT than 2 * bins
+        support = np.minimum(k.max(axis=1), bins - 1) + 1
+        self.nfft = [_fft_size(bins + int(n) - 1) for n in support]
+        self.pmf_f = [np.fft.rfft(pmf[t, :support[t]], self.nfft[t]) for t in range(size)]
+
+        # Tail mass P(k > b) and tail moment E[k; k > b] (in steps) for the
+        # shortfall objective, where overshooting the budget still costs time
+        ks = np.sort(k, axis=1)
+        b = np.arange(bins)
+        idx = np.stack([np.searchsorted(row, b, side="right") for row in ks])
+        csum = np.concatenate([np.zeros((size, 1)), np.cumsum(ks, axis=1)], axis=1)
+        self.tail_mass = (q - idx) / q
+        self.tail_moment = (csum[:, -1:] - np.take_along_axis(csum, idx, axis=1)) / q
+
+
+class _Board:
+    def __init__(self, arrays, dice, skips, sit_hours, dt):
+        self.arrays = arrays
+        self.end = arrays.last_tile
+        self.dice = dice
+        self.skips = skips
+        self.smax = skips + int(arrays.skip_change.clip(min=0).sum())
+        self.sit_steps = np.where(arrays.sit, int(round(sit_hours / dt)), 0)
+        self.sit_cost = self.sit_steps * dt
+        # Landing on `landed` moves you to dest; d is the die face
+        self.moves = [[(pos + d, arrays.target[pos + d]) for d in range(1, dice + 1) if pos + d <= self.end]
+                      for pos in range(self.end + 1)]
+        s = np.arange(self.smax + 1)
+        self.after_change = [np.clip(s + c, 0, self.smax) for c in arrays.skip_change]
+
+
+def _mean_dp(board, fixed, tol, max_iter):
+    """Expected remaining hours after finishing / on landing on each tile."""
+    arrays = board.arrays
+    size = board.end + 1
+    after = np.zeros((board.smax + 1, size))
+    land = np.zeros((board.smax + 1, size))
+    skip = np.zeros((board.smax + 1, size), dtype=bool)
+    tile_mean = arrays.icdf.mean(axis=1)
+    for _ in range(max_iter):
+        old = land.copy()
+        for pos in range(board.end, -1, -1):
+            acc = np.zeros(board.smax + 1)
+            for landed, dest in board.moves[pos]:
+                acc += board.sit_cost[landed]
+                if dest <= board.end:
+                    acc += land[:, dest]
+            after[:, pos] = acc / board.dice
+            if arrays.obtain[pos]:
+                do = tile_mean[pos] + after[:, pos]
+                skp = np.concatenate([[np.inf], after[:-1, pos]])
+                skip[:, pos] = fixed[:, pos] if fixed is not None else skp < do
+                land[:, pos] = np.where(skip[:, pos], skp, do)
+            else:
+                land[:, pos] = after[board.after_change[pos], pos]
+        if np.abs(land - old).max() < tol:
+            break
+    return land, skip
+
+
+def _grid_dp(board, grid, objective, dt, bins, mean_land, fixed, tol, max_iter):
+    """Budget-indexed recursion; returns (start curve, skip table)."""
+    arrays = board.arrays
+    size = board.end + 1
+    n_s = board.smax + 1
+    b = np.arange(bins)
+    maximize = objective == "quantile"
+    land = np.zeros((n_s, size, bins))
+    skip = np.zeros((n_s, size, bins), dtype=bool)
+    start = None
+
+    def finished(c):
+        if maximize:
+            return (b >= c).astype(float)
+        return np.maximum(c - b, 0) * dt
+
+    def shifted(dest, c):
+        if c == 0:
+            return land[:, dest]
+        out = np.empty((n_s, bins))
+        out[:, c:] = land[:, dest, :bins - c]
+        out[:, :c] = 0.0 if maximize else mean_land[:, dest, None] + (c - b[:c]) * dt
+        return out
+
+    def update(pos):
+        """Recompute land[:, pos] from the tiles reachable from it; returns the largest change."""
+        nonlocal start
+        # Faces that roll past the last tile finish the event
+        acc = np.tile((board.dice - len(board.moves[pos])) * finished(0), (n_s, 1))
+        for landed, dest in board.moves[pos]:
+            c = board.sit_steps[landed]
+            acc += finished(c) if dest > board.end else shifted(dest, c)
+        after = acc / board.dice
+        if pos == 0:
+            start = after[board.skips]
+            return 0.0
+        if not arrays.obtain[pos]:
+            new = after[board.after_change[pos]]
+        else:
+            nfft = grid.nfft[pos]
+            do = np.fft.irfft(np.fft.rfft(after, nfft, axis=1) * grid.pmf_f[pos], nfft, axis=1)[:, :bins]
+            if maximize:
+                do = np.clip(do, 0.0, 1.0)
+                skp = np.vstack([np.full(bins, -np.inf), after[:-1]])
+                choose = skp > do + 1e-12
+            else:
+                after_mean = mean_land_after(board, mean_land, pos)
+                do += (after_mean[:, None] * grid.tail_mass[pos]
+                       + dt * (grid.tail_moment[pos] - b * grid.tail_mass[pos]))
+                skp = np.vstack([np.full(bins, np.inf), after[:-1]])
+                choose = skp < do - 1e-12
+            if fixed is not None:
+                choose = np.broadcast_to(fixed[:, pos, None], (n_s, bins))
+            skip[:, pos] = choose
+            new = np.where(choose, skp, do)
+        change = np.abs(new - land[:, pos]).max()
+        land[:, pos] = new
+        return change
+
+    # A descending sweep sees every ladder's destination already solved; only
+    # snakes point back at stale tiles. Snakes are short, so once a snake's
+    # destination is updated we re-sweep just its span until it settles.
+    moving = {p for p in range(1, size) if arrays.target[p] != p}
+    snakes = {}
+    for src in range(1, size):
+        if arrays.target[src] < src:
+            snakes.setdefault(arrays.target[src], []).append(src)
+    for _ in range(max_iter):
+        change = 0.0
+        for pos in range(board.end, -1, -1):
+            if pos in moving:
+                continue  # never landed on, you are already at its target
+            change = max(change, update(pos))
+            for src in snakes.get(pos, []):
+                while True:
+                    local = max(update(p) for p in range(src - 1, pos - 1, -1) if p not in moving)
+                    if local < tol:
+                        break
+        if change < tol:
+            break
+    return start, skip
+
+
+def mean_land_after(board, mean_land, pos):
+    """Expected remaining hours right after finishing `pos`, for every skip count."""
+    acc = np.zeros(board.smax + 1)
+    for landed, dest in board.moves[pos]:
+        acc += board.sit_cost[landed]
+        if dest <= board.end:
+            acc += mean_land[:, dest]
+    return acc / board.dice
+
+
+def _statistic(objective, level, start, dt):
+    """(value, budget) for a start curve: the quantile, or ES with its optimal budget."""
+    if objective == "quantile":
+        hit = np.flatnonzero(start >= level)
+        b = hit[0] if hit.size else len(start) - 1
+        return b * dt, b * dt
+    es = np.arange(len(start)) * dt + start / (1 - level)
+    b = int(es.argmin())
+    return es[b], b * dt
+
+
+def solve(arrays, objective="quantile", level=0.9, dice=6, skips=3, sit_hours=0.0, threshold=None,
+          dt=0.5, bins=2048, tol=1e-6, max_iter=100):
+    """Solve for the skip policy optimizing a quantile or expected shortfall of event time.
+
+    level is the quantile (0.9 = P90) or the shortfall level (0.9 = mean of
+    the worst 10% of events). dt * bins must comfortably exceed that many
+    hours. The threshold policy (default threshold from board_sim) is
+    evaluated on the same grid for comparison.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}")
+    board = _Board(arrays, dice, skips, sit_hours, dt)
+    grid = _Grid(arrays, dt, bins)
+    if threshold is None:
+        threshold = arrays.default_skip_threshold()
+    fixed = (np.arange(board.smax + 1)[:, None] > 0) & arrays.obtain & (arrays.median_hours >= threshold)
+
+    mean_land, skip_mean = _mean_dp(board, None, tol, max_iter)
+    start, skip_table = _grid_dp(board, grid, objective, dt, bins, mean_land, None, tol, max_iter)
+    value, budget = _statistic(objective, level, start, dt)
+
+    base_mean, _ = _mean_dp(board, fixed, tol, max_iter)
+    base_start, _ = _grid_dp(board, grid, objective, dt, bins, base_mean, fixed, tol, max_iter)
+    baseline, _ = _statistic(objective, level, base_start, dt)
+    return RiskPolicy(objective, level, dt, budget, skip_table, skip_mean, value, baseline)
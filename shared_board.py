@@ -0,0 +1,63 @@
+# BoardArrays copied once into shared memory, so worker processes attach views instead of unpickling copies.
+#   with SharedBoard(arrays) as shared: pool.map(work, [shared.handle] * workers)   # work calls attach(handle)
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import board_sim
+
+ALIGN = 64  # byte alignment of each array in the block
+
+
+class BoardHandle:
+    """Picklable description of a SharedBoard: block name, array layout and the non-array attributes."""
+
+    def __init__(self, name, layout, scalars):
+        self.name = name
+        self.layout = layout  # [(attribute, dtype str, shape, offset)]
+        self.scalars = scalars
+
+
+class SharedBoard:
+    """Copy of a BoardArrays in one shared memory block."""
+
+    def __init__(self, arrays):
+        fields = {k: v for k, v in vars(arrays).items() if isinstance(v, np.ndarray)}
+        layout, size = [], 0
+        for name, a in fields.items():
+            layout.append((name, a.dtype.str, a.shape, size))
+            size += -(-max(a.nbytes, 1) // ALIGN) * ALIGN
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        for name, dtype, shape, offset in layout:
+            np.ndarray(shape, dtype, buffer=self.shm.buf, offset=offset)[...] = fields[name]
+        scalars = {k: v for k, v in vars(arrays).items() if not isinstance(v, np.ndarray)}
+        self.handle = BoardHandle(self.shm.name, layout, scalars)
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_attached = {}  # block name -> BoardArrays, so a worker maps each block once
+
+
+def attach(handle):
+    """BoardArrays view of a SharedBoard's block (zero-copy, read-only), cached per process."""
+    arrays = _attached.get(handle.name)
+    if arrays is None:
+        shm = shared_memory.SharedMemory(name=handle.name)
+        arrays = board_sim.BoardArrays.__new__(board_sim.BoardArrays)
+        vars(arrays).update(handle.scalars)
+        for name, dtype, shape, offset in handle.layout:
+            view = np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)
+            view.flags.writeable = False
+            setattr(arrays, name, view)
+        arrays.shm = shm  # keeps the mapping alive as long as the views
+        _attached[handle.name] = arrays
+    return arrays
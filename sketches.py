@@ -0,0 +1,147 @@
+# Bounded-memory aggregation of simulated playthroughs: quantile sketches, histograms and
+# exact counters whose size is fixed up front, so merging worker results is an element-wise sum.
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import board_sim
+import shared_board
+
+CHUNK = 50_000  # playthroughs simulated (and held in memory) at a time per worker
+
+
+class QuantileSketch:
+    """Counts of values in buckets (gamma^(k-1), gamma^k], gamma = (1 + alpha) / (1 - alpha).
+
+    Values below min_value share the lowest bucket and values above
+    max_value the highest one, so the bucket array never grows.
+    """
+
+    def __init__(self, alpha=0.005, min_value=1e-3, max_value=1e6):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = np.log(self.gamma)
+        self.offset = int(np.floor(np.log(min_value) / self.log_gamma))
+        self.counts = np.zeros(int(np.ceil(np.log(max_value) / self.log_gamma)) - self.offset + 1, dtype=np.int64)
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def add(self, values):
+        keys = np.ceil(np.log(np.maximum(values, 1e-300)) / self.log_gamma).astype(np.int64) - self.offset
+        self.counts += np.bincount(np.clip(keys, 0, self.counts.size - 1), minlength=self.counts.size)
+
+    def merge(self, other):
+        if other.counts.shape != self.counts.shape or other.gamma != self.gamma:
+            raise ValueError("can only merge sketches with the same alpha and range")
+        self.counts += other.counts
+        return self
+
+    def quantile(self, p):
+        """Value at quantile level(s) p, within relative error alpha of the exact order statistic."""
+        cum = np.cumsum(self.counts)
+        rank = np.floor(np.asarray(p, dtype=float) * (cum[-1] - 1))
+        key = np.searchsorted(cum, rank, side="right") + self.offset
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+class Histogram:
+    """Counts of integers in [0, bins); larger values land in the last bin."""
+
+    def __init__(self, bins):
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def add(self, values):
+        self.counts += np.bincount(np.minimum(values, self.counts.size - 1), minlength=self.counts.size)
+
+    def merge(self, other):
+        if other.counts.shape != self.counts.shape:
+            raise ValueError("can only merge histograms with the same bins")
+        self.counts += other.counts
+        return self
+
+    def frequencies(self):
+        return self.counts / max(self.counts.sum(), 1)
+
+
+class Aggregate:
+    """Everything the reports need from a stream of SimResults, in constant memory."""
+
+    def __init__(self, tiles, skips=3, max_rolls=400, alpha=0.005):
+        self.n = 0
+        self.hours_sum = 0.0
+        self.hours_sq = 0.0
+        self.hours = QuantileSketch(alpha)
+        self.skips_used = Histogram(skips + 2)  # last bin: more than the starting skips (via +1 SKIP tiles)
+        self.rolls = Histogram(max_rolls)
+        self.visits = np.zeros(tiles, dtype=np.int64)
+        self.skipped = np.zeros(tiles, dtype=np.int64)
+
+    def add(self, res):
+        self.n += res.hours.size
+        self.hours_sum += float(res.hours.sum())
+        self.hours_sq += float(np.square(res.hours).sum())
+        self.hours.add(res.hours)
+        self.skips_used.add(res.skips_used)
+        self.rolls.add(res.rolls)
+        self.visits += res.visits
+        self.skipped += res.skipped
+        return self
+
+    def merge(self, other):
+        self.n += other.n
+        self.hours_sum += other.hours_sum
+        self.hours_sq += other.hours_sq
+        self.hours.merge(other.hours)
+        self.skips_used.merge(other.skips_used)
+        self.rolls.merge(other.rolls)
+        self.visits += other.visits
+        self.skipped += other.skipped
+        return self
+
+    @property
+    def mean_hours(self):
+        return self.hours_sum / self.n
+
+    @property
+    def std_hours(self):
+        return np.sqrt(max(self.hours_sq / self.n - self.mean_hours ** 2, 0.0))
+
+    def visit_freq(self):
+        """Expected visits to each tile per playthrough."""
+        return self.visits / max(self.n, 1)
+
+    def skip_freq(self):
+        """Fraction of playthroughs that skip each tile."""
+        return self.skipped / max(self.n, 1)
+
+
+def _aggregate(arrays, n, seed, batch, kwargs):
+    if isinstance(arrays, shared_board.BoardHandle):
+        arrays = shared_board.attach(arrays)
+    rng = np.random.default_rng(seed)
+    agg = Aggregate(arrays.last_tile + 1, skips=np.max(kwargs.get("skips", 3)))
+    for start in range(0, n, batch):
+        agg.add(board_sim.simulate(arrays, min(batch, n - start), rng=rng, **kwargs))
+    return agg
+
+
+def stream(arrays, n, workers=1, batch=CHUNK, rng=None, **kwargs):
+    """Simulate n playthroughs (kwargs go to board_sim.simulate) into one Aggregate.
+
+    Each worker process runs its own independent seed stream over its share
+    of n and the partial aggregates are merged at the end.
+    """
+    seeds = np.random.SeedSequence(rng if not isinstance(rng, np.random.Generator)
+                                   else int(rng.integers(2 ** 63))).spawn(max(workers, 1))
+    shares = [n // len(seeds) + (k < n % len(seeds)) for k in range(len(seeds))]
+    if len(seeds) == 1:
+        return _aggregate(arrays, n, seeds[0], batch, kwargs)
+    with shared_board.SharedBoard(arrays) as shared, ProcessPoolExecutor(max_workers=len(seeds)) as pool:
+        parts = list(pool.map(_aggregate, [shared.handle] * len(seeds), shares, seeds,
+                              [batch] * len(seeds), [kwargs] * len(seeds)))
+    total = parts[0]
+    for part in parts[1:]:
+        total.merge(part)
+    return total
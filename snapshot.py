@@ -0,0 +1,99 @@
+# Run-to-run diff of estimates and the skip ranking.
+#   python vibeslop.py --snapshot before.npz; ...; python vibeslop.py --diff before.npz [after.npz | export.db]
+import sqlite3
+
+import numpy as np
+
+import whatif
+
+TIER_BOUNDS = np.array([below for below, _ in whatif.SKIP_TIERS])
+TIER_LABELS = np.array([label for _, label in whatif.SKIP_TIERS] + [""])
+
+
+def tiers(rank):
+    """Index into TIER_LABELS for 0-based ranks (len(SKIP_TIERS) = no tier)."""
+    return np.searchsorted(TIER_BOUNDS, rank, side="right")
+
+
+class Snapshot:
+    """Obtain tiles of one run, sorted by tile number."""
+
+    def __init__(self, tile, hours, rank, description):
+        order = np.argsort(tile, kind="stable")
+        self.tile = np.asarray(tile, dtype=np.int64)[order]
+        self.hours = np.asarray(hours, dtype=float)[order]
+        self.rank = np.asarray(rank, dtype=np.int64)[order]
+        self.description = np.asarray(description, dtype=str)[order]
+
+    @classmethod
+    def from_ranked(cls, obtain_tiles):
+        """From rank_skips output (best skip first)."""
+        return cls([t["tile"] for t in obtain_tiles], [t["median_hours"] for t in obtain_tiles],
+                   np.arange(len(obtain_tiles)), [t["description"] for t in obtain_tiles])
+
+    def save(self, path):
+        np.savez(path, tile=self.tile, hours=self.hours, rank=self.rank, description=self.description)
+
+
+def load(path):
+    """Snapshot from a .npz written by Snapshot.save or a --sqlite database."""
+    if path.endswith(".db") or path.endswith(".sqlite"):
+        conn = sqlite3.connect(path)
+        try:
+            rows = conn.execute("SELECT tile, median_hours, description FROM tiles "
+                                "WHERE category = 'obtain' ORDER BY median_hours DESC, tile").fetchall()
+        finally:
+            conn.close()
+        tile, hours, desc = zip(*rows) if rows else ((), (), ())
+        return Snapshot(tile, hours, np.arange(len(rows)), desc)
+    with np.load(path) as data:
+        return Snapshot(data["tile"], data["hours"], data["rank"], data["description"])
+
+
+class Diff:
+    """Tiles in both snapshots (arrays aligned on tile) plus the tiles only one of them has."""
+
+    def __init__(self, old, new):
+        self.tile, i, j = np.intersect1d(old.tile, new.tile, assume_unique=True, return_indices=True)
+        self.description = new.description[j]
+        self.old_hours, self.new_hours = old.hours[i], new.hours[j]
+        self.old_rank, self.new_rank = old.rank[i], new.rank[j]
+        self.old_tier, self.new_tier = tiers(self.old_rank), tiers(self.new_rank)
+        self.removed = np.setdiff1d(old.tile, new.tile, assume_unique=True)
+        self.added = np.setdiff1d(new.tile, old.tile, assume_unique=True)
+
+    @property
+    def hours_changed(self):
+        return ~np.isclose(self.old_hours, self.new_hours, rtol=0, atol=0.005)
+
+    @property
+    def rank_changed(self):
+        return self.old_rank != self.new_rank
+
+    @property
+    def tier_changed(self):
+        return self.old_tier != self.new_tier
+
+    def report(self, limit=20):
+        """Printable lines: tier changes first, then the largest hour changes."""
+        lines = [f"{self.hours_changed.sum()} tiles changed hours, {self.rank_changed.sum()} moved rank, "
+                 f"{self.tier_changed.sum()} changed tier; {self.added.size} added, {self.removed.size} removed"]
+        for k in np.flatnonzero(self.tier_changed)[np.argsort(self.new_rank[self.tier_changed], kind="stable")]:
+            lines.append(f"  Tile {self.tile[k]}: {TIER_LABELS[self.old_tier[k]] or '-'} -> "
+                         f"{TIER_LABELS[self.new_tier[k]] or '-'} (rank {self.old_rank[k] + 1} -> {self.new_rank[k] + 1})")
+        changed = np.flatnonzero(self.hours_changed)
+        changed = changed[np.argsort(-np.abs(self.new_hours - self.old_hours)[changed], kind="stable")]
+        for k in changed[:limit]:
+            lines.append(f"  Tile {self.tile[k]}: {self.description[k]} - {self.old_hours[k]:.2f} -> "
+                         f"{self.new_hours[k]:.2f} hrs, rank {self.old_rank[k] + 1} -> {self.new_rank[k] + 1}")
+        if changed.size > limit:
+            lines.append(f"  ... {changed.size - limit} more")
+        if self.added.size:
+            lines.append(f"  Added: {', '.join(map(str, self.added))}")
+        if self.removed.size:
+            lines.append(f"  Removed: {', '.join(map(str, self.removed))}")
+        return lines
+
+
+def diff(old, new):
+    return Diff(old, new)
@@ -0,0 +1,83 @@
+# Estimates as a SQLite database (tiles, pools, tile_sim, summary), for the clan bot and dashboards.
+#   python vibeslop.py --sqlite estimates.db
+import os
+import sqlite3
+
+import numpy as np
+
+import board_sim
+
+QUANTILE_COLUMNS = [f"p{p * 100:g}_hours" for p in board_sim.REPORT_QUANTILES]
+SCHEMA = f"""
+CREATE TABLE tiles (
+    tile INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    median_hours REAL,
+    confidence TEXT,
+    notes TEXT,
+    {", ".join(f"{c} REAL" for c in QUANTILE_COLUMNS)}
+);
+CREATE INDEX tiles_category ON tiles (category, median_hours);
+CREATE INDEX tiles_confidence ON tiles (confidence, median_hours);
+CREATE INDEX tiles_hours ON tiles (median_hours);
+CREATE TABLE pools (
+    pool TEXT NOT NULL,
+    name TEXT NOT NULL,
+    unique_rate REAL,
+    ehb REAL,
+    median_kc INTEGER,
+    hours_1 REAL,
+    hours_2 REAL,
+    hours_3 REAL,
+    PRIMARY KEY (pool, name)
+);
+CREATE TABLE tile_sim (
+    tile INTEGER PRIMARY KEY,
+    visit_freq REAL,
+    skip_freq REAL
+);
+CREATE TABLE summary (
+    name TEXT PRIMARY KEY,
+    value REAL
+);
+"""
+
+
+def tile_rows(board):
+    obtain = [t for t in board if t["category"] == "obtain"]
+    quantiles = {t["tile"]: row for t, row in zip(obtain, board_sim.tile_quantiles(obtain) if obtain else [])}
+    for t in sorted(board, key=lambda t: t["tile"]):
+        q = quantiles.get(t["tile"])
+        yield (t["tile"], t["description"], t["category"],
+               t["median_hours"] if t["category"] == "obtain" else None,
+               t["confidence"], t["notes"], *([None] * len(QUANTILE_COLUMNS) if q is None else q.round(2).tolist()))
+
+
+def pool_rows(pools):
+    for pool, members in pools.items():
+        for b in members:
+            yield (pool, b.name, b.unique_rate, b.ehb, int(b.median_kc), b.hours_to_unique,
+                   b.hours_for_two_uniques(), b.hours_for(3))
+
+
+def export(board, path, pools=None, sim=None):
+    """Write board (plus pools {name: [BossOrRaidForUnique]} and a SimResult) to a new SQLite file."""
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(f"INSERT INTO tiles VALUES ({', '.join('?' * (6 + len(QUANTILE_COLUMNS)))})",
+                             tile_rows(board))
+            conn.executemany("INSERT INTO pools VALUES (?, ?, ?, ?, ?, ?, ?, ?)", pool_rows(pools or {}))
+            if sim is not None:
+                n = sim.hours.size
+                conn.executemany("INSERT INTO tile_sim VALUES (?, ?, ?)",
+                                 ((t, sim.visits[t] / n, sim.skipped[t] / n) for t in np.flatnonzero(sim.visits).tolist()))
+                summary = [("playthroughs", n), ("mean_hours", float(sim.hours.mean()))]
+                summary += [(c, float(h)) for c, h in zip(QUANTILE_COLUMNS, np.quantile(sim.hours, board_sim.REPORT_QUANTILES))]
+                conn.executemany("INSERT INTO summary VALUES (?, ?)", summary)
+    finally:
+        conn.close()
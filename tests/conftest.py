@@ -0,0 +1,30 @@
+# Shared fixtures: the repo root on sys.path and a small hand-made board.
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["CALIBRATION_FILE"] = os.path.join(ROOT, "tests", "no-calibration.json")  # never a local calibration
+
+import vibeslop  # noqa: E402
+
+
+@pytest.fixture
+def small_board():
+    """20 tiles: obtain tiles with and without a drop model, a ladder, a snake, a free tile and a SIT tile."""
+    board = []
+    for num in range(1, 21):
+        if num == 4:
+            vibeslop.add_movement(num, "Advance to Tile #12", 12, board=board)
+        elif num == 15:
+            vibeslop.add_movement(num, "Go back to Tile #9", 9, board=board)
+        elif num == 7:
+            vibeslop.add_free(num, "Free Tile +1 SKIP", board=board)
+        elif num % 3 == 0:
+            vibeslop.add_tile(num, f"Obtain {num % 4 + 1}x Item {num}", num * 0.5, board=board,
+                              drops=num % 4 + 1, rate=1 / (20 * num), kph=30, activity=f"boss{num % 2}")
+        else:
+            vibeslop.add_tile(num, f"Obtain Item {num}" + (" (SIT)" if num == 11 else ""), 1 + num % 5, board=board)
+    return board
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import attempts
+
+
+def test_certain_runs():
+    model = attempts.AttemptModel(30)
+    assert model.median_hours == 0.5 and model.mean_hours == pytest.approx(0.5)
+    assert attempts.AttemptModel(30, drops=3).median_hours == 1.5
+
+
+def test_mean_matches_the_renewal_formula():
+    model = attempts.AttemptModel(75, sd=8, success=0.8, drop=0.5, drops=2, fail_minutes=60, fail_sd=25)
+    p = 0.8 * 0.5
+    miss = 0.8 * 0.5 * 75 + 0.2 * 60  # expected minutes lost to attempts that don't pay out, per attempt
+    assert model.mean_hours == pytest.approx(2 * (75 + miss / p) / 60, rel=0.01)
+    assert model.pmf.sum() == pytest.approx(1, abs=1e-9)
+
+
+def test_median_matches_a_direct_simulation():
+    model = attempts.AttemptModel(60, sd=10, success=0.5, fail_minutes=20, fail_sd=5)
+    rng = np.random.default_rng(0)
+    tries = rng.geometric(0.5, 20_000)
+    fails = np.array([rng.normal(20, 5, k - 1).clip(0.5).sum() for k in tries])
+    total = (fails + rng.normal(60, 10, fails.size)) / 60
+    assert model.median_hours == pytest.approx(np.median(total), rel=0.03)
+
+
+def test_models_are_cached_and_validated():
+    assert attempts.model({"minutes": 35, "sd": 5}) is attempts.model({"sd": 5, "minutes": 35})
+    with pytest.raises(ValueError):
+        attempts.AttemptModel(30, success=0)
@@ -0,0 +1,75 @@
+import numpy as np
+
+import board_sim
+import vibeslop
+
+
+def test_tile_quantiles_match_tile_hours_at(small_board):
+    obtain = [t for t in small_board if t["category"] == "obtain"]
+    ps = np.array([0.1, 0.5, 0.9])
+    batched = board_sim.tile_quantiles(obtain, ps)
+    for t, row in zip(obtain, batched):
+        np.testing.assert_allclose(row, board_sim.tile_hours_at(t, ps), rtol=1e-12)
+        assert abs(board_sim.tile_hours_at(t, 0.5) - t["median_hours"]) < 1e-9
+
+
+def test_board_arrays_resolve_movement(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    assert arrays.target[4] == 12 and arrays.target[15] == 9
+    assert arrays.skip_change[7] == 1
+    assert arrays.sit[11] and not arrays.sit[10]
+    assert arrays.obtain.sum() == sum(t["category"] == "obtain" for t in small_board)
+
+
+def test_free_board_takes_no_time():
+    board = []
+    for num in range(1, 11):
+        vibeslop.add_free(num, "Free Tile", board=board)
+    res = board_sim.simulate(board_sim.BoardArrays(board), 100, rng=0)
+    assert not res.hours.any()
+
+
+def test_sweep_rows_follow_the_rules(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    rows = board_sim.sweep(arrays, 2000, dice=(4, 8), sit_hours=(0.0, 10.0), rng=1)
+    assert [(r["dice"], r["sit_hours"]) for r in rows] == [(4, 0.0), (4, 10.0), (8, 0.0), (8, 10.0)]
+    by = {(r["dice"], r["sit_hours"]): r["mean_hours"] for r in rows}
+    assert by[4, 10.0] > by[4, 0.0] and by[8, 10.0] > by[8, 0.0]
+    assert by[8, 0.0] < by[4, 0.0]  # bigger dice land on fewer tiles
+
+
+def test_stream_rows_do_not_depend_on_the_batch(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    few = board_sim.simulate(arrays, 50, stream=7)
+    many = board_sim.simulate(arrays, 200, stream=7)
+    np.testing.assert_array_equal(few.hours, many.hours[:50])
+    np.testing.assert_array_equal(few.rolls, many.rolls[:50])
+
+
+def test_compare_pairs_reduce_variance(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    same = board_sim.compare(arrays, 1000, {"threshold": 3.0}, {"threshold": 3.0}, rng=0)
+    assert same.diff == 0 and same.stderr == 0
+    cmp = board_sim.compare(arrays, 4000, {"threshold": 2.0}, {"threshold": 5.0}, rng=0)
+    assert cmp.speedup > 1
+    indep = board_sim.compare(arrays, 4000, {"threshold": 2.0}, {"threshold": 5.0}, crn=False,
+                              antithetic=False, control=False, rng=1)
+    assert abs(cmp.diff - indep.diff) < 4 * np.hypot(cmp.stderr, indep.stderr)
+
+
+def test_quantile_ci_brackets_the_estimate():
+    hours = np.sort(np.random.default_rng(0).exponential(10, 10000))
+    est, lo, hi = board_sim.quantile_ci(hours, 0.9, 1.96)
+    assert lo < est < hi
+    assert lo < 10 * np.log(10) < hi
+
+
+def test_adaptive_stops_at_the_precision(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    res = board_sim.adaptive(arrays, precision=0.5, skip_precision=0.02, batch=500, rng=0)
+    assert res.converged
+    for est, lo, hi in res.quantiles.values():
+        assert (hi - lo) / 2 <= 0.5 and lo <= est <= hi
+    assert res.skip_halfwidth.max() <= 0.02
+    capped = board_sim.adaptive(arrays, precision=0.01, batch=500, max_playthroughs=2000, rng=0)
+    assert not capped.converged and capped.n == 2000
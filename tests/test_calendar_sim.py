@@ -0,0 +1,39 @@
+import numpy as np
+
+import board_sim
+import calendar_sim
+
+
+def test_sessions_follow_weekdays_and_wrap_midnight():
+    roster = {"days": 7, "start_weekday": 4,
+              "members": [{"windows": [[20, 2]], "weekdays": [5, 6]}, {"windows": [[9, 10]], "reliability": 0.5}]}
+    slots = calendar_sim.sessions(roster)
+    assert [(s[1], s[2]) for s in slots if s[0] == 0] == [(44, 50), (68, 74)]  # Saturday and Sunday evenings
+    assert sum(s[0] == 1 for s in slots) == 7 and all(s[3] == 0.5 for s in slots if s[0] == 1)
+
+
+def test_capacity_curve_and_finish_times():
+    times, work = calendar_sim.capacity_curve([(0, 4, 1.0), (2, 6, 2.0)])
+    np.testing.assert_allclose(times, [0, 0, 2, 4, 6])
+    np.testing.assert_allclose(work, [0, 0, 2, 8, 12])  # 1/h, then 3/h, then 2/h
+    np.testing.assert_allclose(calendar_sim.finish_times(times, work, np.array([1.0, 5.0, 12.0, 13.0])),
+                               [1, 3, 6, np.inf])
+
+
+def test_an_always_online_member_finishes_in_play_time(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    roster = {"days": 30, "members": [{"windows": [[0, 24]]}]}
+    res = calendar_sim.capacity_calendar(arrays, roster, 500, rng=0)
+    np.testing.assert_allclose(res.finish, res.play_hours)
+    assert res.p_finish == 1
+    absent = calendar_sim.capacity_calendar(arrays, {"days": 30, "members": []}, 10, rng=0)
+    assert absent.p_finish == 0 and np.isinf(absent.finish_quantile(0.5))
+
+
+def test_unreliable_members_finish_later(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    steady = {"days": 30, "members": [{"windows": [[18, 22]]}] * 3}
+    flaky = {"days": 30, "members": [{"windows": [[18, 22]], "reliability": 0.5}] * 3}
+    a = calendar_sim.capacity_calendar(arrays, steady, 2000, rng=0)
+    b = calendar_sim.capacity_calendar(arrays, flaky, 2000, rng=0)
+    assert b.finish_quantile(0.5) > a.finish_quantile(0.5)
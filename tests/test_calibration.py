@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+import pytest
+
+import attempts
+import calibration
+import vibeslop
+
+
+@pytest.fixture
+def log_board():
+    board = []
+    vibeslop.add_tile(1, "Obtain 2x Vorkath Head", 3.0, board=board, drops=2, rate=1 / 50, kph=30, activity="vorkath")
+    vibeslop.add_tile(2, "Obtain 1x Zulrah Unique", 6.0, board=board, drops=1, rate=1 / 128, kph=35, activity="zulrah")
+    vibeslop.add_tile(3, "Obtain 1x Pet", 4.0, board=board)
+    vibeslop.add_movement(4, "Advance to Tile #6", 6, board=board)
+    return board
+
+
+def check_gradient(obs, theta):
+    ll, grad = obs.log_likelihood(theta)
+    h = 1e-6
+    for k in range(theta.size):
+        step = np.zeros(theta.size)
+        step[k] = h
+        numeric = (obs.log_likelihood(theta + step)[0] - obs.log_likelihood(theta - step)[0]) / (2 * h)
+        assert grad[k] == pytest.approx(numeric, rel=1e-5, abs=1e-5)
+
+
+def test_gradient_matches_finite_differences(log_board):
+    rng = np.random.default_rng(0)
+    rows = [{"tile": t, "hours": h} for t, h in zip(rng.choice([1, 2, 3], 60), rng.gamma(2, 2, 60))]
+    obs = calibration.Observations(log_board, rows)
+    assert obs.n == 60 and obs.activities == ["vorkath", "zulrah"]
+    for theta in (np.zeros(3), np.array([0.3, -0.4, 0.2])):
+        check_gradient(obs, theta)
+
+
+def test_gradient_with_attempt_tiles(log_board):
+    model = {"minutes": 75, "sd": 8, "success": 0.8, "fail_minutes": 60, "fail_sd": 25}
+    vibeslop.add_tile(5, "Obtain 1x Infernal Cape", 3.0, board=log_board, attempts=model, activity="inferno")
+    rng = np.random.default_rng(2)
+    rows = [{"tile": t, "hours": h} for t, h in zip(rng.choice([1, 2, 3, 5], 80), rng.gamma(4, 0.8, 80))]
+    obs = calibration.Observations(log_board, rows)
+    assert obs.att.sum() > 0 and obs.pmf.size == attempts.model(model).pmf.size
+    # the attempt density is linear between grid points, so step off the kinks
+    check_gradient(obs, np.array([0.1, -0.2, 0.15, 0.05]) + 1e-3 * np.pi)
+
+
+def test_rows_match_by_description_or_tile(log_board):
+    rows = [{"description": "obtain 2x  vorkath head", "hours": "2.5"}, {"tile": "3", "hours": 1},
+            {"tile": 4, "hours": 1}, {"description": "Obtain 1x Dragon Pickaxe", "hours": 2}, {"tile": 2, "hours": 0}]
+    obs = calibration.Observations(log_board, rows)
+    assert obs.n == 2 and len(obs.unmatched) == 3
+
+
+def test_fit_recovers_the_team_speed(log_board):
+    rng = np.random.default_rng(1)
+    pet = log_board[2]
+    rows = [{"tile": 3, "hours": h} for h in rng.exponential(pet["median_hours"] / np.log(2) / 2.0, 2000)]
+    fitted = calibration.fit(log_board, rows)
+    assert fitted.team_speed == pytest.approx(2.0, rel=0.1)
+    assert fitted.activities == {}
+
+
+def test_current_announces_a_calibration(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "calibration.json"
+    monkeypatch.setenv("CALIBRATION_FILE", str(path))
+    monkeypatch.setattr(calibration, "_current", None)
+    assert calibration.current().team_speed == 1.0
+    assert capsys.readouterr().out == ""
+    path.write_text(json.dumps({"team_speed": 1.25, "activities": {"dt2": 0.9}}))
+    monkeypatch.setattr(calibration, "_current", None)
+    assert calibration.speed("dt2") == pytest.approx(1.125)
+    assert f"Using calibration from {path}" in capsys.readouterr().out
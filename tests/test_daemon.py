@@ -0,0 +1,33 @@
+import json
+
+import daemon
+import vibeslop
+
+
+def test_refresh_redoes_only_what_changed(tmp_path, small_board):
+    path = tmp_path / "board.json"
+    vibeslop.dump_board(small_board, str(path))
+    est = daemon.Estimator(str(path), output=str(tmp_path / "out.xlsx"), playthroughs=500)
+    assert est.refresh(reload_module=False).startswith(f"{len(small_board)} tiles")
+    assert est.refresh(reload_module=False).startswith("no estimate changed")
+
+    entries = json.loads(path.read_text())["tiles"]
+    edited = next(e for e in entries if "hours" in e)
+    edited["hours"] *= 2
+    path.write_text(json.dumps(entries))
+    report = est.refresh(reload_module=False)
+    assert report.startswith("1 tiles re-estimated") and f"#{edited['tile']}" in report
+    assert est.spreads == vibeslop.tile_spreads(est.board)
+
+    path.write_text(json.dumps([e for e in entries if e["tile"] != edited["tile"]]))
+    assert est.refresh(reload_module=False).startswith("layout changed")
+
+
+def test_watch_keeps_the_last_good_board(tmp_path, small_board, capsys, monkeypatch):
+    path = tmp_path / "board.json"
+    vibeslop.dump_board(small_board, str(path))
+    est = daemon.Estimator(str(path), output=str(tmp_path / "out.xlsx"), playthroughs=200)
+    monkeypatch.setattr(daemon.time, "sleep", lambda seconds: path.write_text("[{"))  # a half-typed edit
+    daemon.watch(est, interval=0, cycles=1)
+    assert "Keeping the last good estimates" in capsys.readouterr().out
+    assert len(est.board) == len(small_board)
@@ -0,0 +1,41 @@
+import dropdb
+
+PAGE = """<html><head><title>{title} - OSRS Wiki</title></head><body>
+<table class="wikitable item-drops"><tr><th></th><th>Item</th><th>Quantity</th><th>Rarity</th></tr>
+{rows}</table></body></html>"""
+ROW = '<tr><td><img></td><td><a title="{item}">{item}</a></td><td>{qty}</td><td>{rarity}</td></tr>'
+
+
+def write_page(path, title, rows):
+    path.write_text(PAGE.format(title=title, rows="\n".join(ROW.format(item=i, qty=q, rarity=r) for i, q, r in rows)))
+
+
+def test_parse_rarity():
+    assert dropdb.parse_rarity("1/128") == 1 / 128
+    assert dropdb.parse_rarity("~3/1,419") == 3 / 1419
+    assert dropdb.parse_rarity("Always") == 1.0
+    assert dropdb.parse_rarity("Varies") is None
+
+
+def test_build_and_look_up(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    write_page(pages / "vorkath.html", "Vorkath", [("Dragonbone necklace", 1, "1/1,000"),
+                                                   ("Vorkath&#39;s head", 1, "1/50"),
+                                                   ("Rune kiteshield", 2, "1/10"), ("Rune kiteshield", 4, "1/20")])
+    write_page(pages / "zulrah.htm", "Zulrah", [("Tanzanite fang", 1, "1/1,024"), ("Rune kiteshield", 1, "1/5")])
+    (pages / "readme.txt").write_text("ignored")
+    out = tmp_path / "drops.npz"
+    assert dropdb.build(str(pages), str(out), workers=1) == 5
+    db = dropdb.DropDB(str(out))
+    assert db.rate("Vorkath's head", "vorkath") == 1 / 50
+    assert db.rate("rune kiteshield", "Vorkath") == 1 / 10 + 1 / 20  # quantities of one roll are summed
+    assert db.rate("Rune kiteshield") == 1 / 5
+    assert db.sources("Rune kiteshield") == [("zulrah", 1 / 5), ("vorkath", 1 / 10 + 1 / 20)]
+    assert db.rate("Tanzanite fang", "vorkath") is None
+
+
+def test_drop_rate_default_without_a_database(tmp_path, monkeypatch):
+    monkeypatch.setenv("DROPDB_FILE", str(tmp_path / "missing.npz"))
+    monkeypatch.setattr(dropdb, "_db", None)
+    assert dropdb.drop_rate("Tanzanite fang", default=0.5) == 0.5
@@ -0,0 +1,41 @@
+import json
+import os
+
+import ehb
+
+
+def test_boss_key():
+    assert ehb.boss_key("Kree'Arra") == "kreearra"
+    assert ehb.boss_key("Alchemical Hydra") == "alchemical_hydra"
+    assert ehb.boss_key("  TzKal-Zuk ") == "tzkal_zuk"
+
+
+def test_parse_every_layout(tmp_path):
+    layouts = {
+        "wom.json": json.dumps({"bosses": [{"boss": "sarachnis", "rate": 67}, {"boss": "Vorkath", "rate": 32.5}]}),
+        "list.json": json.dumps([{"metric": "Sarachnis", "ehb": 67}, {"name": "vorkath", "kph": "32.5"}]),
+        "map.json": json.dumps({"Sarachnis": 67, "vorkath": 32.5}),
+        "rates.csv": "Boss, Rate\nSarachnis,67\nVorkath,32.5\n",
+    }
+    for name, text in layouts.items():
+        (tmp_path / name).write_text(text)
+        assert ehb.parse(str(tmp_path / name)) == {"sarachnis": 67, "vorkath": 32.5}, name
+
+
+def test_load_caches_until_the_file_changes(tmp_path):
+    path = tmp_path / "ehb.json"
+    path.write_text(json.dumps({"zulrah": 35}))
+    cache = tmp_path / "cache"
+    assert ehb.load(str(path), cache_dir=str(cache)) == {"zulrah": 35}
+    assert len(os.listdir(cache)) == 1
+    path.write_text(json.dumps({"zulrah": 40, "vorkath": 30}))
+    assert ehb.load(str(path), cache_dir=str(cache)) == {"zulrah": 40, "vorkath": 30}
+
+
+def test_kill_rate_falls_back_to_the_default(tmp_path, monkeypatch):
+    path = tmp_path / "ehb.json"
+    path.write_text(json.dumps({"zulrah": 40}))
+    monkeypatch.setenv("EHB_FILE", str(path))
+    monkeypatch.setattr(ehb, "_rates", None)
+    assert ehb.kill_rate("Zulrah", 35) == 40
+    assert ehb.kill_rate("Vorkath", 30) == 30
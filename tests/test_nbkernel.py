@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from scipy.stats import nbinom
+
+import nbkernel
+
+
+def test_agrees_with_scipy_on_a_grid():
+    q = np.array([0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999])[:, None, None]
+    r = np.arange(1, 11)[None, :, None]
+    p = np.array([0.5, 0.1, 1 / 50, 1 / 128, 1 / 512, 1 / 5000, 1 / 32768])[None, None, :]
+    ours, theirs = np.broadcast_arrays(nbkernel.nbinom_ppf(q, r, p), nbinom.ppf(q, r, p))
+    # Where the exact cdf lands on q (0.1 at r=1, p=0.1; dyadic levels at p=1/2) either side of the tie
+    # is a rounding error away, and the two may pick different neighbours
+    tie = np.isclose(nbinom.cdf(np.minimum(ours, theirs), r, p), q, rtol=0, atol=1e-12)
+    assert np.all((ours == theirs) | (tie & (np.abs(ours - theirs) == 1)))
+
+
+def test_agrees_with_scipy_at_the_simulator_levels():
+    u = (np.arange(1024) + 0.5) / 1024
+    for r, p in [(1, 1 / 33), (5, 1 / 33), (3, 1 / 400), (2, 1 / 5000)]:
+        np.testing.assert_array_equal(nbkernel.nbinom_ppf(u, r, p), nbinom.ppf(u, r, p))
+
+
+@pytest.mark.parametrize("q, r, p", [(0.5, 2.5, 0.01), (0.9, 400, 0.2)])
+def test_non_integer_and_large_r_fall_back_to_scipy(q, r, p):
+    assert nbkernel.nbinom_ppf(q, r, p) == nbinom.ppf(q, r, p)
+
+
+def test_scalars_and_broadcasting():
+    assert np.ndim(nbkernel.nbinom_ppf(0.5, 3, 0.1)) == 0
+    assert nbkernel.nbinom_ppf([0.5, 0.9], [[1], [2]], 0.1).shape == (2, 2)
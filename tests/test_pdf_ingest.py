@@ -0,0 +1,41 @@
+import io
+import os
+
+import pytest
+
+import pdf_ingest
+import tile_parser
+
+PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tile-descriptions.pdf")
+
+
+def test_literal_strings():
+    assert pdf_ingest._literal(b"a\\8)", 0) == (b"a8", 4)
+    assert pdf_ingest._literal(b"x\\101\\12y) tail", 0) == (b"xA\ny", 10)
+    assert pdf_ingest._literal(b"(nested) \\(paren\\)) tail", 0)[0] == b"(nested) (paren)"
+    assert pdf_ingest._literal(b"line\\\nwrap\\t)", 0)[0] == b"linewrap\t"
+
+
+def test_parse_objects():
+    toks = pdf_ingest.tokens(b"<< /Type /Page /Kids [3 0 R 4 0 R] /Count 2 >> obj")
+    (value,), op = pdf_ingest.parse_objects(toks)
+    assert op == b"obj"
+    assert value["Type"] == "Page" and value["Count"] == 2
+    assert [ref.num for ref in value["Kids"]] == [3, 4]
+
+
+def test_unsupported_files_are_rejected():
+    with pytest.raises(ValueError, match="not a PDF"):
+        pdf_ingest.PdfReader(io.BytesIO(b"hello world"))
+    stream = b"%PDF-1.5\n1 0 obj << /Type /XRef /Size 1 >> stream\nendstream endobj\nstartxref\n9\n%%EOF\n"
+    with pytest.raises(ValueError, match="cross-reference stream"):
+        pdf_ingest.PdfReader(io.BytesIO(stream))
+
+
+@pytest.mark.skipif(not os.path.exists(PDF), reason="tile-descriptions.pdf not present")
+def test_extract_board(tmp_path):
+    text = pdf_ingest.extract_board(PDF, cache_dir=str(tmp_path))
+    reqs = tile_parser.parse_board(text)
+    assert [r.tile for r in reqs] == list(range(1, 321))
+    assert len(os.listdir(tmp_path)) == 1
+    assert pdf_ingest.extract_board(PDF, cache_dir=str(tmp_path)) == text
@@ -0,0 +1,27 @@
+import numpy as np
+
+import board_sim
+import race
+
+
+def test_speed_table_overrides_single_tiles(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    table = race.speed_table(arrays, [{"speed": 2.0, "tile_speed": {"6": 0.5}}, {}])
+    assert table.shape == (2, arrays.last_tile + 1)
+    assert table[0, 6] == 0.5 and table[0, 5] == 2.0 and (table[1] == 1).all()
+
+
+def test_faster_team_wins_more(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    teams = [{"name": "Fast", "speed": 1.5}, {"name": "Slow"}]
+    res = race.race(arrays, teams, 4000, skips=0, rng=0, chunk=1500)  # no skips: only speed differs
+    np.testing.assert_allclose(res.win_prob.sum(), 1)
+    np.testing.assert_allclose(res.place_prob.sum(axis=0), 1)
+    np.testing.assert_allclose(res.place_prob.sum(axis=1), 1)
+    assert res.win_prob[0] > 0.6 and res.mean_hours[0] < res.mean_hours[1]
+
+
+def test_identical_teams_split_the_wins(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    res = race.race(arrays, [{}, {}], 4000, rng=1)
+    assert abs(res.win_prob[0] - 0.5) < 0.05
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+import board_sim
+import risk_policy
+
+
+def test_policy_beats_threshold_and_matches_simulation(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    policy = risk_policy.solve(arrays, "quantile", 0.9, skips=1, dt=0.25, bins=1024)
+    assert policy.value <= policy.baseline + 1e-9
+    sim = board_sim.simulate(arrays, 20000, skips=1, policy=policy, rng=0)
+    assert np.quantile(sim.hours, 0.9) == pytest.approx(policy.value, rel=0.1)
+
+
+def test_shortfall_is_at_least_the_quantile(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    q = risk_policy.solve(arrays, "quantile", 0.9, dt=0.25, bins=1024)
+    es = risk_policy.solve(arrays, "shortfall", 0.9, dt=0.25, bins=1024)
+    assert es.value >= q.value - 0.25
+
+
+def test_unknown_objective(small_board):
+    with pytest.raises(ValueError):
+        risk_policy.solve(board_sim.BoardArrays(small_board), "mean")
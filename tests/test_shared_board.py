@@ -0,0 +1,30 @@
+import pickle
+
+import numpy as np
+
+import board_sim
+import shared_board
+import sketches
+
+
+def test_attached_views_match_the_board(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    with shared_board.SharedBoard(arrays) as shared:
+        handle = pickle.loads(pickle.dumps(shared.handle))
+        assert len(pickle.dumps(handle)) < 4096
+        view = shared_board.attach(handle)
+        for name, value in vars(arrays).items():
+            if isinstance(value, np.ndarray):
+                np.testing.assert_array_equal(getattr(view, name), value)
+                assert not getattr(view, name).flags.writeable
+        assert view.last_tile == arrays.last_tile
+        res = board_sim.simulate(view, 200, rng=0)
+        np.testing.assert_array_equal(res.hours, board_sim.simulate(arrays, 200, rng=0).hours)
+        shared_board._attached.pop(handle.name).shm.close()
+
+
+def test_stream_workers_share_one_board(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    agg = sketches.stream(arrays, 3001, workers=2, batch=1000, rng=0)
+    assert agg.n == 3001
+    assert agg.visits.sum() > 3001
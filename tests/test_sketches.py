@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import board_sim
+import sketches
+
+
+def test_quantiles_within_alpha():
+    values = np.random.default_rng(0).lognormal(4, 1, 50000)
+    sketch = sketches.QuantileSketch(alpha=0.01)
+    sketch.add(values)
+    ps = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+    exact = np.sort(values)[np.floor(ps * (values.size - 1)).astype(int)]
+    np.testing.assert_allclose(sketch.quantile(ps), exact, rtol=0.01)
+
+
+def test_merged_sketches_equal_one_sketch():
+    values = np.random.default_rng(1).exponential(300, 30000)
+    whole = sketches.QuantileSketch()
+    whole.add(values)
+    parts = [sketches.QuantileSketch() for _ in range(3)]
+    for part, chunk in zip(parts, np.array_split(values, 3)):
+        part.add(chunk)
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    ps = np.linspace(0, 1, 11)
+    np.testing.assert_allclose(merged.quantile(ps), whole.quantile(ps))
+    exact = np.sort(values)[np.floor(ps * (values.size - 1)).astype(int)]
+    np.testing.assert_allclose(merged.quantile(ps)[1:], exact[1:], rtol=whole.alpha)
+    with pytest.raises(ValueError):
+        merged.merge(sketches.QuantileSketch(alpha=0.01))
+
+
+def test_aggregate_matches_the_raw_results(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    results = [board_sim.simulate(arrays, 3000, rng=seed) for seed in (0, 1)]
+    one = sketches.Aggregate(arrays.last_tile + 1)
+    for res in results:
+        one.add(res)
+    halves = [sketches.Aggregate(arrays.last_tile + 1).add(res) for res in results]
+    merged = halves[0].merge(halves[1])
+    hours = np.concatenate([r.hours for r in results])
+    for agg in (one, merged):
+        assert agg.n == hours.size
+        assert agg.mean_hours == pytest.approx(hours.mean())
+        assert agg.std_hours == pytest.approx(hours.std())
+        np.testing.assert_array_equal(agg.skipped, results[0].skipped + results[1].skipped)
+        assert agg.skips_used.counts.sum() == hours.size
+    np.testing.assert_array_equal(one.hours.counts, merged.hours.counts)
+
+
+def test_stream_in_batches(small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    agg = sketches.stream(arrays, 10001, batch=2000, rng=0)
+    assert agg.n == 10001
+    ref = board_sim.simulate(arrays, 50000, rng=1).hours
+    assert agg.hours.quantile(0.5) == pytest.approx(np.median(ref), rel=0.05)
@@ -0,0 +1,43 @@
+import numpy as np
+
+import snapshot
+import sqlite_export
+import vibeslop
+
+
+def edited_board(board, tile, hours):
+    out = [dict(t) for t in board]
+    next(t for t in out if t["tile"] == tile)["median_hours"] = hours
+    return out
+
+
+def test_tiers():
+    np.testing.assert_array_equal(snapshot.tiers(np.array([0, 2, 3, 9, 10, 19, 20, 300])), [0, 0, 1, 1, 2, 2, 3, 3])
+
+
+def test_diff_of_an_edit(tmp_path):
+    before = snapshot.Snapshot.from_ranked(vibeslop.rank_skips(vibeslop.tiles))
+    before.save(tmp_path / "before.npz")
+    loaded = snapshot.load(str(tmp_path / "before.npz"))
+    np.testing.assert_array_equal(loaded.tile, before.tile)
+    assert snapshot.diff(loaded, before).report()[0].startswith("0 tiles changed hours, 0 moved rank")
+
+    last = vibeslop.rank_skips(vibeslop.tiles)[-1]
+    board = [t for t in edited_board(vibeslop.tiles, last["tile"], 10_000) if t["tile"] != before.tile[0]]
+    d = snapshot.diff(loaded, snapshot.Snapshot.from_ranked(vibeslop.rank_skips(board)))
+    k = np.flatnonzero(d.tile == last["tile"])[0]
+    assert d.hours_changed.sum() == 1 and d.new_rank[k] == 0 and d.old_tier[k] == 3 and d.new_tier[k] == 0
+    assert d.removed.tolist() == [before.tile[0]] and d.added.size == 0
+    assert d.rank_changed.sum() > 1
+    report = d.report()
+    assert report[1].startswith(f"  Tile {last['tile']}: - -> TOP 3 SKIP")
+    assert report[-1] == f"  Removed: {before.tile[0]}"
+
+
+def test_sqlite_exports_diff_like_snapshots(tmp_path):
+    db = str(tmp_path / "estimates.db")
+    sqlite_export.export(vibeslop.tiles, db)
+    from_db = snapshot.load(db)
+    from_run = snapshot.Snapshot.from_ranked(vibeslop.rank_skips(vibeslop.tiles))
+    d = snapshot.diff(from_db, from_run)
+    assert not d.hours_changed.any() and d.added.size == d.removed.size == 0
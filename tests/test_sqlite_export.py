@@ -0,0 +1,34 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+import board_sim
+import sqlite_export
+import vibeslop
+
+
+def test_export_round_trip(tmp_path, small_board):
+    path = str(tmp_path / "estimates.db")
+    sim = board_sim.simulate(board_sim.BoardArrays(small_board), 1000, rng=0)
+    (tmp_path / "estimates.db").write_text("stale")  # replaced, not appended to
+    sqlite_export.export(small_board, path, {"raid": vibeslop.RAIDS}, sim)
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute("SELECT tile, category, median_hours, p50_hours FROM tiles ORDER BY tile").fetchall()
+        assert [r[0] for r in rows] == sorted(t["tile"] for t in small_board)
+        for tile, category, median, p50 in rows:
+            assert (median is None) == (p50 is None) == (category != "obtain")
+            if median is not None:
+                assert p50 == pytest.approx(median, abs=0.01)
+        assert conn.execute("SELECT COUNT(*) FROM pools WHERE pool = 'raid'").fetchone()[0] == len(vibeslop.RAIDS)
+        summary = dict(conn.execute("SELECT name, value FROM summary"))
+        assert summary["playthroughs"] == 1000
+        assert summary["p90_hours"] == pytest.approx(np.quantile(sim.hours, 0.9))
+        skip = dict(conn.execute("SELECT tile, skip_freq FROM tile_sim"))
+        assert sum(skip.values()) == pytest.approx(sim.skipped.sum() / 1000)
+        plan = " ".join(r[-1] for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT tile FROM tiles WHERE category = 'obtain' ORDER BY median_hours DESC"))
+        assert "tiles_category" in plan
+    finally:
+        conn.close()
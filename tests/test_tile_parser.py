@@ -0,0 +1,38 @@
+import tile_parser
+
+LISTING = """\
+Tile descriptions
+1. Obtain 3x Warrior, Berserker, Seer or Archer Ring
+2. Obtain 100x Soaked Page or 1x Tackle Box, Tome of Water or Dragon Harpoon from Tempoross
+4. Advance to Tile #12
+Tile #3: Free Tile +1 SKIP
+5. Obtain 1 x Pet (no chompy chick or skotizo) (SIT)
+6. Obtain 1x TzHaar Weapon/Armour
+"""
+
+
+def test_alternatives_share_a_quantity():
+    assert tile_parser.parse_alternatives("3x Warrior, Berserker, Seer or Archer Ring") == [
+        (3, ["Warrior", "Berserker", "Seer", "Archer Ring"])]
+    assert tile_parser.parse_alternatives("100x Soaked Page or 1x Tackle Box, Tome of Water or Dragon Harpoon") == [
+        (100, ["Soaked Page"]), (1, ["Tackle Box", "Tome of Water", "Dragon Harpoon"])]
+    assert tile_parser.parse_alternatives("3x Abyssal Whip or 1x Unsired") == [(3, ["Abyssal Whip"]), (1, ["Unsired"])]
+    assert tile_parser.parse_alternatives("Dragon Pickaxe") == [(1, ["Dragon Pickaxe"])]
+
+
+def test_slashes_and_parentheses():
+    assert tile_parser.item_names("TzHaar Weapon/Armour") == ["TzHaar Weapon", "TzHaar Armour"]
+    assert tile_parser.item_names("Pet (no chompy/skotizo)") == ["Pet (no chompy/skotizo)"]
+    assert tile_parser.split_alternatives("Pet (no chompy chick or skotizo) or Jar") == [
+        "Pet (no chompy chick or skotizo)", "Jar"]
+
+
+def test_parse_board():
+    reqs = tile_parser.parse_board(LISTING)
+    assert [r.tile for r in reqs] == [1, 2, 3, 4, 5, 6]
+    by = {r.tile: r for r in reqs}
+    assert by[4].kind == "movement" and by[4].target == 12
+    assert by[3].kind == "free" and by[3].skip_change == 1
+    assert by[5].kind == "obtain" and by[5].sit
+    assert by[5].alternatives == [(1, ["Pet (no chompy chick or skotizo)"])]
+    assert by[6].alternatives == [(1, ["TzHaar Weapon", "TzHaar Armour"])]
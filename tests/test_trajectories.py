@@ -0,0 +1,42 @@
+import numpy as np
+
+import board_sim
+import trajectories
+
+
+def record(path, arrays, sizes, chunk_records=1000):
+    results = []
+    with trajectories.TrajectoryWriter(str(path), chunk_records=chunk_records) as writer:
+        for seed, n in enumerate(sizes):
+            results.append(board_sim.simulate(arrays, n, rng=seed, recorder=writer))
+    return results, trajectories.TrajectoryStore(str(path))
+
+
+def test_store_reproduces_the_simulation(tmp_path, small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    results, store = record(tmp_path / "runs", arrays, [300, 200])
+    assert store.playthroughs == 500 and store.n_chunks > 1
+    hours = np.concatenate([r.hours for r in results])
+    np.testing.assert_allclose(store.hours(), hours, rtol=1e-5)
+    visits = sum(r.visits for r in results)
+    skipped = sum(r.skipped for r in results)
+    np.testing.assert_array_equal(store.tile_counts(), visits[:store.tile_counts().size])
+    np.testing.assert_array_equal(store.tile_counts(skip=True), skipped[:store.tile_counts(skip=True).size])
+
+
+def test_queries_on_a_subset(tmp_path, small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    results, store = record(tmp_path / "runs", arrays, [400])
+    tile = int(np.argmax(results[0].skipped))
+    mask = store.playthrough_mask(tile, skip=True)
+    assert 0 < mask.sum() <= results[0].skipped[tile]
+    np.testing.assert_allclose(store.hours(mask), results[0].hours[mask], rtol=1e-5)
+    assert store.tile_counts(mask, skip=True)[tile] == results[0].skipped[tile]
+
+
+def test_writer_clears_an_old_recording(tmp_path, small_board):
+    arrays = board_sim.BoardArrays(small_board)
+    record(tmp_path / "runs", arrays, [500], chunk_records=100)
+    _, store = record(tmp_path / "runs", arrays, [10], chunk_records=100)
+    assert store.playthroughs == 10
+    assert len([n for n in (tmp_path / "runs").iterdir() if n.name.startswith("chunk-")]) == store.n_chunks
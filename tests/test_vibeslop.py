@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pytest
+
+import board_sim
+import nbkernel
+import tile_parser
+import vibeslop
+
+
+def test_dumped_board_loads_back(tmp_path):
+    path = tmp_path / "main.json"
+    vibeslop.dump_board(vibeslop.tiles, path)
+    loaded = {t["tile"]: t for t in vibeslop.load_board(path)}
+    for t in vibeslop.tiles:
+        assert loaded[t["tile"]]["category"] == t["category"]
+        assert loaded[t["tile"]]["median_hours"] == t["median_hours"]
+
+
+def test_batch_writes_a_workbook_per_board(tmp_path, small_board):
+    boards = tmp_path / "boards"
+    boards.mkdir()
+    vibeslop.dump_board(small_board, boards / "small.json")
+    vibeslop.dump_board(vibeslop.tiles, boards / "main.json")
+    (boards / "notes.txt").write_text("not a board")
+    summaries = vibeslop.run_batch(boards, tmp_path / "out")
+    assert [s["board"] for s in summaries] == ["main", "small"]
+    small = summaries[1]
+    hours = sorted((t["median_hours"] for t in small_board if t["category"] == "obtain"), reverse=True)
+    assert small["total_hours"] == pytest.approx(sum(hours))
+    assert small["after_skips"] == pytest.approx(sum(hours[3:]))
+    assert sorted(os.listdir(tmp_path / "out")) == ["board_comparison.xlsx", "main_estimates.xlsx",
+                                                    "small_estimates.xlsx"]
+
+
+def test_pool_curves_agree_with_scipy():
+    from scipy.stats import nbinom
+    for boss in vibeslop.SLAYER_BOSSES + vibeslop.RAIDS:
+        for n in (2, 3, boss.n_max):
+            kills = np.ceil(nbinom.ppf(0.5, n, boss.unique_rate))
+            assert boss.hours_for(n) == pytest.approx(kills / boss.ehb)
+
+
+def test_pool_picks_the_fastest_member():
+    pool = vibeslop.RAID_POOL
+    for n in range(1, vibeslop.UNIQUES_N_MAX + 1):
+        member, hours = pool.fastest(n)
+        assert hours == min(m.hours_for(n) for m in pool.members) == member.hours_for(n)
+    assert np.all(np.diff(pool.best_hours) > 0)
+    with pytest.raises(ValueError):
+        pool.fastest(vibeslop.UNIQUES_N_MAX + 1)
+
+
+def test_activity_hours_from_its_kill_table():
+    act = vibeslop.Activity("test", 1 / 50, 10, n_max=5)
+    assert act.median_kills(1) == int(np.ceil(nbkernel.nbinom_ppf(0.5, 1, 1 / 50)))
+    assert act.hours(3) == round(act.median_kills(3) / 10, 2)
+    assert np.all(np.diff(act.kills_table) > 0)
+    assert vibeslop.Activity("geo", 1 / 50, 10, geometric_1x=True).median_kills(1) == 35  # ceil(log .5 / log .98)
+    with pytest.raises(ValueError):
+        act.hours(6)
+
+
+def test_catalog_entries_resolve_in_board_files():
+    board = vibeslop.board_from_entries([{"tile": 1, "description": "Obtain 2x Raid Drop", "activity": "raid",
+                                          "count": 2},
+                                         {"tile": 2, "description": "Moons", "activity": "moons_hours", "count": 3}])
+    assert board[0]["median_hours"] == round(vibeslop.RAID_POOL.fastest_hours(2), 2)
+    assert board[1]["median_hours"] == vibeslop.MOONS.hours(3)
+
+
+def test_item_key():
+    assert vibeslop.item_key("Drop from Zulrah Unique Table")[0] == "zulrah unique"
+    assert vibeslop.item_key("Tertiary Drop from Zalcano")[0] == "zalcano tertiary"
+    assert vibeslop.item_key("Piece of Ancestral Set")[0] == "ancestral piece"
+    assert vibeslop.item_key("Abyssal Whips")[0] == "abyssal whip"
+    assert vibeslop.item_key("Raid Drop from ANY Raid")[0] == "raid drop"
+
+
+def test_text_tiles_resolve_through_the_item_models():
+    def entry(description):
+        return vibeslop.requirement_entry(tile_parser.parse_description(1, description), {})
+
+    assert entry("Obtain 2x Raid Drop")["activity"] == "raid"
+    assert "attempts" in entry("Obtain 1x Fire Cape")
+    whip = entry("Obtain 3x Abyssal Whip or 1x Unsired")  # the faster alternative wins
+    assert whip["drops"] == 1 and "unsired" in whip["notes"]
+    assert entry("Obtain 1x Speed Trial Completion") is None
+
+
+def test_board_text_needs_unknown_hours_for_unresolved_tiles(tmp_path):
+    path = tmp_path / "board.txt"
+    path.write_text("1. Obtain 1x Unsired\n2. Advance to Tile #4\n3. Obtain 1x Speed Trial Completion\n4. Free Tile\n")
+    with pytest.raises(ValueError):
+        vibeslop.board_from_text(str(path))
+    board = {t["tile"]: t for t in vibeslop.board_from_text(str(path), unknown_hours=5)}
+    assert board[3]["median_hours"] == 5 and board[3]["confidence"] == "low"
+    assert board[2]["target"] == 4 and board[4]["category"] == "free"
+    assert board[1]["rate"] == 1 / 100
+
+
+def test_workbook_spread_columns(tmp_path, small_board):
+    import openpyxl
+
+    path = tmp_path / "estimates.xlsx"
+    vibeslop.write_workbook(small_board, path)
+    ws = openpyxl.load_workbook(path)["Tile Estimates"]
+    headers = [c.value for c in ws[1]]
+    assert headers[6:] == vibeslop.SPREAD_HEADERS
+    p90 = 6 + vibeslop.SPREAD_HEADERS.index("P90 Hours")
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        tile = next(t for t in small_board if t["tile"] == row[0])
+        if tile["category"] == "obtain":
+            assert row[p90] == round(float(board_sim.tile_hours_at(tile, 0.9)), 2)
+            assert list(row[6:]) == sorted(row[6:])
+        else:
+            assert all(v is None for v in row[6:])
+
+
+def test_source_catalog_picks_the_fastest_eligible_source():
+    catalog = vibeslop.SourceCatalog()
+    fast = catalog.add(vibeslop.BossOrRaidForUnique("Fast Boss", 1 / 100, 50), "pet", "wilderness")
+    slow = catalog.add(vibeslop.BossOrRaidForUnique("Slow Boss", 1 / 100, 10), "pet")
+    catalog.add(vibeslop.BossOrRaidForUnique("Guess Boss", 1 / 100, 20), "pet", guess=True)
+    choice = catalog.solve("pet", 2)
+    assert choice.source is fast and choice.candidates == 3
+    assert choice.hours == pytest.approx(fast.hours_for(2))
+    assert catalog.solve("pet", exclude=["wilderness"]).source.name == "Guess Boss"
+    assert catalog.solve("pet", exclude=["wilderness"]).guessed
+    catalog.exclude_by_default("pet", "fast", "guess")
+    assert catalog.solve("pet").source is slow
+    with pytest.raises(ValueError):
+        catalog.solve("pet", exclude=["boss"])
@@ -0,0 +1,53 @@
+import pytest
+
+import vibeslop
+import whatif
+
+
+def ranking(board):
+    return [t["tile"] for t in vibeslop.rank_skips(board)]
+
+
+def test_top_matches_rank_skips_after_changes():
+    board = [dict(t) for t in vibeslop.tiles]
+    w = whatif.WhatIf(board)
+    assert [t["tile"] for t in w.top(len(board))] == ranking(board)
+
+    activity = next(a for a, tiles in w.by_activity.items() if len(tiles) > 1 and all(
+        w.tiles[t]["rate"] for t in tiles))
+    w.set_kph(activity, 1000)
+    tile = next(iter(w.tiles))
+    w.set_hours(tile, 500)
+    w.apply(f"{w.order[-1]}.hours=0.01")
+    edited = [w.tiles.get(t["tile"], t) for t in board]
+    assert [t["tile"] for t in w.top(len(board))] == ranking(edited)
+    assert w.rank(tile) == 0 and w.tiers()["TOP 3 SKIP"][0] == tile
+
+
+def test_set_rate_and_kph_scale_hours():
+    board = []
+    vibeslop.add_tile(1, "Obtain 1x Thing", 10.0, board=board, drops=1, rate=1 / 100, kph=20, activity="thing")
+    vibeslop.add_tile(2, "Obtain 2x Thing", 18.0, board=board, drops=2, rate=1 / 100, kph=20, activity="thing")
+    vibeslop.add_tile(3, "Obtain 1x Other", 5.0, board=board)
+    w = whatif.WhatIf(board)
+    w.set_kph("thing", 40)
+    assert [w.tiles[t]["median_hours"] for t in (1, 2)] == [5.0, 9.0]
+    w.set_rate(1, 1 / 200)
+    assert w.tiles[1]["median_hours"] == pytest.approx(
+        5.0 * whatif.median_kills(1, 1 / 200) / whatif.median_kills(1, 1 / 100), abs=0.01)
+    with pytest.raises(ValueError):
+        w.set_rate(3, 1 / 10)  # no drop model
+    with pytest.raises(KeyError):
+        w.select("nothing")
+
+
+def test_scenarios_undo():
+    w = whatif.WhatIf(vibeslop.tiles)
+    before = [t["tile"] for t in w.top(20)]
+    hours = {t: dict(w.tiles[t]) for t in w.tiles}
+    with w.scenario():
+        w.set_hours(before[0], 0.0)
+        w.set_hours(before[-1], 10_000)
+        assert [t["tile"] for t in w.top(20)] != before
+    assert [t["tile"] for t in w.top(20)] == before
+    assert {t: dict(w.tiles[t]) for t in w.tiles} == hours
@@ -0,0 +1,87 @@
+# Board text ("12. Obtain 3x Antler Guard", "27. Advance to Tile #37", ...) -> Requirements.
+# Turning a requirement into hours is up to the caller (vibeslop.board_from_text).
+import re
+
+import board_sim
+
+LINE_RE = re.compile(r"^\s*(?:Tile\s*#?)?(\d+)\s*[.:)\t-]?\s+(\S.*?)\s*$", re.I)
+MOVE_RE = re.compile(r"^(?:Advance|Go back|Move)\s+to\s+Tile\s*#?(\d+)", re.I)
+FREE_RE = re.compile(r"Free Tile|Roll Again", re.I)
+OBTAIN_RE = re.compile(r"^(?:Obtain\s+)?(.+)$", re.I)
+ALT_SPLIT_RE = re.compile(r"\s+or\s+|\s*,\s+", re.I)
+QUANTITY_RE = re.compile(r"^(\d+)\s*x?\s+(.+)$", re.I)
+SLASH_RE = re.compile(r"[\w']+(?:/[\w']+)+")
+
+
+class Requirement:
+    """One parsed tile.
+
+    kind is "movement", "free" or "obtain"; alternatives is a list of
+    (quantity, [item names]) for obtain tiles, any one of which completes it.
+    """
+
+    def __init__(self, tile, description, kind, target=None, alternatives=(), sit=False, skip_change=0):
+        self.tile = tile
+        self.description = description
+        self.kind = kind
+        self.target = target
+        self.alternatives = list(alternatives)
+        self.sit = sit
+        self.skip_change = skip_change
+
+
+def item_names(name):
+    """'TzHaar Weapon/Armour' -> ['TzHaar Weapon', 'TzHaar Armour']; other names unchanged.
+
+    Slashes inside parentheses ("Pet (no chompy/skotizo)") are left alone.
+    """
+    for m in SLASH_RE.finditer(name):
+        if name.count("(", 0, m.start()) == name.count(")", 0, m.start()):
+            head, tail = name[:m.start()], name[m.end():]
+            return [n for word in m.group().split("/") for n in item_names(head + word + tail)]
+    return [name]
+
+
+def split_alternatives(text):
+    """Split on " or " and commas except inside parentheses ("Pet (no chompy chick or skotizo)" is one item)."""
+    parts, start = [], 0
+    for m in ALT_SPLIT_RE.finditer(text):
+        if text.count("(", 0, m.start()) == text.count(")", 0, m.start()):
+            parts.append(text[start:m.start()])
+            start = m.end()
+    return parts + [text[start:]]
+
+
+def parse_alternatives(text):
+    alts = []
+    for part in split_alternatives(text):
+        m = QUANTITY_RE.match(part.strip())
+        if m or not alts:
+            qty, name = (int(m.group(1)), m.group(2)) if m else (1, part.strip())
+            alts.append((qty, item_names(name)))
+        else:
+            alts[-1][1].extend(item_names(part.strip()))
+    return alts
+
+
+def parse_description(tile, description):
+    sit = bool(board_sim.SIT_RE.search(description))
+    skip = board_sim.SKIP_CHANGE_RE.search(description)
+    skip_change = int(skip.group(1)) if skip else 0
+    m = MOVE_RE.match(description)
+    if m:
+        return Requirement(tile, description, "movement", target=int(m.group(1)), sit=sit)
+    if skip or FREE_RE.search(description):
+        return Requirement(tile, description, "free", sit=sit, skip_change=skip_change)
+    text = board_sim.SIT_RE.sub("", OBTAIN_RE.match(description).group(1)).strip()
+    return Requirement(tile, description, "obtain", alternatives=parse_alternatives(text), sit=sit)
+
+
+def parse_board(text):
+    """Requirements for every "N. description" line of a board listing, in tile order."""
+    reqs = []
+    for line in text.splitlines():
+        m = LINE_RE.match(line)
+        if m:
+            reqs.append(parse_description(int(m.group(1)), m.group(2)))
+    return sorted(reqs, key=lambda r: r.tile)
@@ -0,0 +1,121 @@
+# On-disk store of full playthrough trajectories, one fixed-width record per obtain tile landed on,
+# in raw chunk files that TrajectoryStore memory-maps and queries chunk by chunk.
+import json
+import os
+
+import numpy as np
+
+RECORD = np.dtype([("playthrough", "<u4"), ("step", "<u2"), ("tile", "<u2"), ("hours", "<f4"), ("skip", "u1")])
+CHUNK_RECORDS = 1 << 20  # 13 MB per chunk file
+META = "trajectories.json"
+
+
+class TrajectoryWriter:
+    """Recorder for board_sim.simulate that appends records to chunk files under path."""
+
+    def __init__(self, path, chunk_records=CHUNK_RECORDS):
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("chunk-") or name == META:
+                os.remove(os.path.join(path, name))
+        self.path = path
+        self.chunk_records = chunk_records
+        self.playthroughs = 0
+        self.records = 0
+        self.chunks = 0
+        self._buffer = np.empty(chunk_records, dtype=RECORD)
+        self._used = 0
+        self._base = 0
+
+    def begin(self, n):
+        """A simulate call is starting n playthroughs; they get the next n playthrough ids."""
+        self._base = self.playthroughs
+        self.playthroughs += n
+
+    def record(self, rows, step, tile, hours, skip):
+        """One record per landing: rows are playthrough rows of the current simulate call."""
+        done = 0
+        while done < rows.size:
+            take = min(rows.size - done, self.chunk_records - self._used)
+            out = self._buffer[self._used:self._used + take]
+            part = slice(done, done + take)
+            out["playthrough"] = rows[part] + self._base
+            out["step"] = step[part]
+            out["tile"] = tile[part]
+            out["hours"] = hours[part]
+            out["skip"] = skip[part]
+            self._used += take
+            done += take
+            if self._used == self.chunk_records:
+                self._flush()
+
+    def _flush(self):
+        if self._used:
+            self._buffer[:self._used].tofile(os.path.join(self.path, f"chunk-{self.chunks:05d}.bin"))
+            self.records += self._used
+            self.chunks += 1
+            self._used = 0
+
+    def close(self):
+        self._flush()
+        with open(os.path.join(self.path, META), "w") as f:
+            json.dump({"playthroughs": self.playthroughs, "records": self.records, "chunks": self.chunks,
+                       "dtype": RECORD.descr}, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TrajectoryStore:
+    """Read-only, memory-mapped view of a directory written by TrajectoryWriter."""
+
+    def __init__(self, path):
+        with open(os.path.join(path, META)) as f:
+            meta = json.load(f)
+        self.path = path
+        self.playthroughs = meta["playthroughs"]
+        self.records = meta["records"]
+        self.n_chunks = meta["chunks"]
+
+    def chunks(self):
+        """Yield each chunk as a read-only structured memmap."""
+        for k in range(self.n_chunks):
+            yield np.memmap(os.path.join(self.path, f"chunk-{k:05d}.bin"), dtype=RECORD, mode="r")
+
+    def playthrough_mask(self, tile, skip=None):
+        """Boolean array over playthroughs: landed on tile (and skipped it / worked it if skip is given)."""
+        mask = np.zeros(self.playthroughs, dtype=bool)
+        for c in self.chunks():
+            hit = c["tile"] == tile
+            if skip is not None:
+                hit &= c["skip"] == skip
+            mask[c["playthrough"][hit]] = True
+        return mask
+
+    def tile_counts(self, mask=None, skip=None):
+        """Per-tile landing counts over the playthroughs in mask (all if None), optionally skips only."""
+        counts = np.zeros(1 << 16, dtype=np.int64)
+        for c in self.chunks():
+            keep = np.ones(len(c), dtype=bool) if mask is None else mask[c["playthrough"]]
+            if skip is not None:
+                keep &= c["skip"] == skip
+            counts += np.bincount(c["tile"][keep], minlength=counts.size)
+        return counts[:counts.nonzero()[0].max() + 1] if counts.any() else counts[:0]
+
+    def hours(self, mask=None):
+        """Total recorded tile hours of each playthrough (only those in mask when given, in id order)."""
+        chosen = None if mask is None else np.flatnonzero(mask)
+        total = np.zeros(self.playthroughs if chosen is None else chosen.size)
+        for c in self.chunks():
+            rows, hours = c["playthrough"], c["hours"]
+            if chosen is not None:
+                keep = mask[rows]
+                rows, hours = np.searchsorted(chosen, rows[keep]), hours[keep]
+            if rows.size:
+                # A chunk covers a narrow range of ids, so only that range is counted
+                lo, hi = int(rows.min()), int(rows.max())
+                total[lo:hi + 1] += np.bincount(rows - lo, weights=hours, minlength=hi - lo + 1)
+        return total
@@ -1,27 +1,57 @@
 # Any gratuitous commenting is an artifact of vibe-slopping, best ignored
+import argparse
+import json
+import os
+import re
+from functools import lru_cache
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from math import log, ceil
-from scipy.stats import nbinom
+import numpy as np
+import attempts
+import board_sim
+import calibration
+import tile_parser
+import dropdb
+import ehb
+import nbkernel
+import risk_policy
+import whatif
 
 # Helper: median kills for r successes at drop rate p per kill
+# Cached so every tile (and every board in a batch run) asking for the same
+# (r, p) shares one quantile search.
+@lru_cache(maxsize=None)
 def median_kills_nbinom(r, p):
     """Median kills to get r drops at probability p per kill."""
-    return int(ceil(nbinom.ppf(0.5, r, p)))
+    return int(ceil(nbkernel.nbinom_ppf(0.5, r, p)))
 
 # Helper: for "any of N items each at rate p" -> combined rate
-def combined_rate(rates):
-    """Given a list of per-kill probabilities, return P(at least one)."""
+def combined_rate(rates, source=None):
+    """Given a list of per-kill probabilities, return P(at least one).
+
+    Entries may also be item names, looked up in the drop database
+    (dropdb.py) at `source` or at the item's best source.
+    """
     prob_none = 1
     for r in rates:
+        if isinstance(r, str):
+            rate = dropdb.drop_rate(r, source)
+            if rate is None:
+                raise KeyError(f"{r} is not in the drop database")
+            r = rate
         prob_none *= (1 - r)
     return 1 - prob_none
 
 # ============================================================
 # DROP RATE & KILL RATE DATABASE
 # ============================================================
-# Kill rates are in kills/hour (ironman EHB-style estimates for geared players)
+# Kill rates are in kills/hour (ironman EHB-style estimates for geared players);
+# ehb.kill_rate(boss, default) takes them from a saved EHB export when there is one.
+# Every tile farmed at a boss the export covers goes through it; slayer monsters,
+# clues, implings, chests, minigames and other non-boss kill rates (and
+# throughput-limited ones like Obor keys) have no EHB figure and stay hand-set.
 # Drop rates are per-kill probability of the specific item
 
 # NOTE: These are best estimates from known OSRS data.
@@ -29,28 +59,40 @@ def combined_rate(rates):
 
 tiles = []
 
-def add_tile(tile_num, description, median_hours, notes="", confidence="high", category="obtain"):
-    tiles.append({
+# drops/rate/kph are optional: when known they give the simulator the shape of
+# the completion-time distribution (it is rescaled to median_hours either way).
+# attempts (AttemptModel parameters) does the same for run-based tiles.
+# activity names the Activity / pool behind the tile; hours are divided by its
+# calibrated speed factor (1 unless calibration.json says otherwise).
+def add_tile(tile_num, description, median_hours, notes="", confidence="high", category="obtain", board=tiles,
+             drops=None, rate=None, kph=None, activity=None, attempts=None):
+    board.append({
         "tile": tile_num,
         "description": description,
-        "median_hours": round(median_hours, 2),
+        "median_hours": round(median_hours / calibration.speed(activity), 2),
         "notes": notes,
         "confidence": confidence,
         "category": category,
+        "drops": drops,
+        "rate": rate,
+        "kph": kph,
+        "activity": activity,
+        "attempts": attempts,
     })
 
-def add_movement(tile_num, description, target):
-    tiles.append({
+def add_movement(tile_num, description, target, board=tiles):
+    board.append({
         "tile": tile_num,
         "description": description,
         "median_hours": 0,
         "notes": f"Move to tile #{target}",
         "confidence": "n/a",
         "category": "movement",
+        "target": target,
     })
 
-def add_free(tile_num, description):
-    tiles.append({
+def add_free(tile_num, description, board=tiles):
+    board.append({
         "tile": tile_num,
         "description": description,
         "median_hours": 0,
@@ -63,16 +105,188 @@ def add_free(tile_num, description):
 # REUSABLE ESTIMATES FOR RECURRING TILE TYPES
 # ============================================================
 
+# Largest "Nx unique" a pool tile can ask for
+UNIQUES_N_MAX = 10
+
+def check_count(n, n_max, what):
+    """Raise ValueError unless 1 <= n <= n_max (the precomputed tables stop at n_max)."""
+    if not 1 <= n <= n_max:
+        raise ValueError(f"{what}: count must be between 1 and {n_max}, got {n}")
+
 class BossOrRaidForUnique:
-    def __init__(self, name, unique_rate, ehb):
+    def __init__(self, name, unique_rate, ehb, n_max=UNIQUES_N_MAX):
         self.name = name
         self.unique_rate = unique_rate
         self.ehb = ehb
+        self.n_max = n_max
         self.median_kc = ceil(log(0.5) / log(1 - self.unique_rate))
         self.hours_to_unique = self.median_kc / self.ehb
+        self._hours_curve = None
+
+    @property
+    def hours_curve(self):
+        """hours_curve[n - 1] = median hours for n uniques, n = 1..n_max, from one quantile call."""
+        if self._hours_curve is None:
+            kills = np.ceil(nbkernel.nbinom_ppf(0.5, np.arange(1, self.n_max + 1), self.unique_rate))
+            kills[0] = self.median_kc  # 1x has always used the geometric median
+            self._hours_curve = kills / self.ehb
+        return self._hours_curve
+
+    def hours_for(self, n):
+        check_count(n, self.n_max, self.name)
+        return float(self.hours_curve[n - 1])
 
     def hours_for_two_uniques(self):
-        return median_kills_nbinom(2, self.unique_rate) / self.ehb
+        return self.hours_for(2)
+
+class UniquePool:
+    """Bosses/raids that all satisfy the same tile, e.g. "Nx Slayer Boss Drop"."""
+
+    def __init__(self, name, members):
+        self.name = name
+        self.members = members
+        self.hours = np.vstack([m.hours_curve for m in members])  # (members, n_max)
+        self.best = self.hours.argmin(axis=0)
+        self.best_hours = self.hours[self.best, np.arange(self.hours.shape[1])]
+
+    def fastest(self, n):
+        """(member, median hours) of the fastest source for n uniques."""
+        check_count(n, self.hours.shape[1], self.name)
+        return self.members[self.best[n - 1]], float(self.best_hours[n - 1])
+
+    def fastest_hours(self, n):
+        return self.fastest(n)[1]
+
+    def shape(self, n):
+        """add_tile drops/rate/kph/activity kwargs for the fastest source for n uniques."""
+        member = self.fastest(n)[0]
+        return {"drops": n, "rate": member.unique_rate, "kph": member.ehb, "activity": self.name}
+
+class Activity:
+    """One repeatable source of drops: per-kill rate, kills per hour and who does it.
+
+    hours(n) reads a table of median hours for 1..n_max drops that is built
+    once, on first use, from a single vectorized nbinom call.
+    """
+
+    def __init__(self, name, rate, kph, team="solo", geometric_1x=False, n_max=UNIQUES_N_MAX):
+        self.name = name
+        self.rate = rate
+        self.kph = kph
+        self.team = team
+        self.geometric_1x = geometric_1x  # 1x estimate uses ceil(log(.5)/log(1-p)), as the hand-built tiles did
+        self.n_max = n_max
+        self._kills = None
+
+    @property
+    def kills_table(self):
+        """kills_table[n - 1] = median kills for n drops."""
+        if self._kills is None:
+            kills = np.ceil(nbkernel.nbinom_ppf(0.5, np.arange(1, self.n_max + 1), self.rate)).astype(int)
+            if self.geometric_1x:
+                kills[0] = ceil(log(0.5) / log(1 - self.rate))
+            self._kills = kills
+        return self._kills
+
+    def median_kills(self, n):
+        check_count(n, self.n_max, self.name)
+        return int(self.kills_table[n - 1])
+
+    def hours(self, n):
+        return round(self.median_kills(n) / self.kph, 2)
+
+    def shape(self, n):
+        """add_tile drops/rate/kph/activity kwargs for n drops."""
+        return {"drops": n, "rate": self.rate, "kph": self.kph, "activity": self.name}
+
+ACTIVITIES = {}
+
+def register_activity(name, rate, kph, team="solo", **kwargs):
+    ACTIVITIES[name] = Activity(name, rate, kph, team, **kwargs)
+    return ACTIVITIES[name]
+
+class CategoryChoice:
+    """The fastest eligible source for an "Nx <category>" tile, as picked by SourceCatalog.solve."""
+
+    def __init__(self, tag, n, source, kills, hours, candidates, excluded, guessed=False):
+        self.tag = tag
+        self.n = n
+        self.source = source
+        self.kills = kills
+        self.hours = hours
+        self.candidates = candidates  # eligible sources that were compared
+        self.excluded = excluded
+        self.guessed = guessed  # the source's drop rate is an assumption, not a wiki figure
+
+    def shape(self):
+        """add_tile drops/rate/kph/activity kwargs."""
+        return {"drops": self.n, "rate": self.source.unique_rate, "kph": self.source.ehb, "activity": self.tag}
+
+    def notes(self, extra=""):
+        src = self.source
+        note = (f"{src.name}: 1/{1 / src.unique_rate:.0f}, {src.ehb:g} kph, median {self.kills} kc "
+                f"(fastest of {self.candidates} {self.tag} sources")
+        note += f", excluding {'/'.join(self.excluded)})" if self.excluded else ")"
+        if self.guessed:
+            note += ". Drop rate is a guess"
+        return f"{note}. {extra}" if extra else note
+
+class SourceCatalog:
+    """Drop sources (BossOrRaidForUnique) indexed by category tag: "pet", "dt2", "raid kit", ...
+
+    A source can carry several tags ("pet" and "wilderness"); a tag that is
+    not a category can still be used to exclude sources. A category can
+    exclude some sources by default (exclude_by_default), so every board,
+    built-in or parsed, solves it the same way.
+    """
+
+    def __init__(self):
+        self.sources = []
+        self.tags = {}
+        self.default_exclude = {}
+        self.guessed = set()  # names of sources whose drop rate is not sourced
+
+    def add(self, source, *tags, guess=False):
+        self.sources.append((source, set(tags)))
+        for tag in tags:
+            self.tags.setdefault(tag, []).append(len(self.sources) - 1)
+        if guess:
+            self.guessed.add(source.name)
+        return source
+
+    def exclude_by_default(self, tag, *exclude):
+        self.default_exclude[tag] = list(exclude)
+
+    def solve(self, tag, n=1, exclude=()):
+        """Fastest source of n drops for category `tag`, skipping sources whose name or tags match `exclude`.
+
+        All eligible sources are evaluated together: one geometric (1x) or
+        nbinom median per source, the same estimate BossOrRaidForUnique uses.
+        """
+        if n < 1:
+            raise ValueError(f"{tag}: need at least 1 drop, got {n}")
+        exclude = list(dict.fromkeys(x.lower() for x in [*self.default_exclude.get(tag, ()), *exclude]))
+
+        def excluded(i):
+            source, tags = self.sources[i]
+            return any(x in source.name.lower() or x in tags for x in exclude)
+
+        eligible = [i for i in self.tags[tag] if not excluded(i)]
+        if not eligible:
+            raise ValueError(f"every {tag} source is excluded by {exclude}")
+        rates = np.array([self.sources[i][0].unique_rate for i in eligible])
+        kph = np.array([self.sources[i][0].ehb for i in eligible], dtype=float)
+        if n == 1:
+            kills = np.ceil(np.log(0.5) / np.log(1 - rates))
+        else:
+            kills = np.ceil(nbkernel.nbinom_ppf(0.5, n, rates))
+        hours = kills / kph
+        best = int(hours.argmin())
+        source = self.sources[eligible[best]][0]
+        return CategoryChoice(tag, n, source, int(kills[best]), float(hours[best]), len(eligible), exclude,
+                              source.name in self.guessed)
+
+CATALOG = SourceCatalog()
 
 # --- Slayer Boss Drop (best option) ---
 # 1/256 unqiue at shellbane gryphon, 95 ehb, 178 median on rate, 1.8 hour/unique
@@ -84,18 +298,21 @@ class BossOrRaidForUnique:
 # 10/600 unique at araxxor, 38 kph, 42 median on rate, 1.1 hour/unique
 # ~24/2160 unique chance at hydra, 25 EHB, ~62 kills median for unique, 2.5 hours/unique
 SLAYER_BOSSES = [
-    BossOrRaidForUnique("Shellbane Gryphon", 1/256, 95),
-    BossOrRaidForUnique("Grotesque Guardians", 62/3000, 34),
-    BossOrRaidForUnique("Abyssal Sire", 1/100, 39),
-    BossOrRaidForUnique("Kraken", 10/3000, 60),
-    BossOrRaidForUnique("Cerberus", 4/520, 39),
-    BossOrRaidForUnique("Thermonuclear Smoke Devil", 10/2000, 80),
-    BossOrRaidForUnique("Araxxor", 10/600, 38),
-    BossOrRaidForUnique("Alchemical Hydra", 24/2160, 25)
+    BossOrRaidForUnique("Shellbane Gryphon", 1/256, ehb.kill_rate("Shellbane Gryphon", 95)),
+    BossOrRaidForUnique("Grotesque Guardians", 62/3000, ehb.kill_rate("Grotesque Guardians", 34)),
+    BossOrRaidForUnique("Abyssal Sire", 1/100, ehb.kill_rate("Abyssal Sire", 39)),
+    BossOrRaidForUnique("Kraken", 10/3000, ehb.kill_rate("Kraken", 60)),
+    BossOrRaidForUnique("Cerberus", 4/520, ehb.kill_rate("Cerberus", 39)),
+    BossOrRaidForUnique("Thermonuclear Smoke Devil", 10/2000, ehb.kill_rate("Thermonuclear Smoke Devil", 80)),
+    BossOrRaidForUnique("Araxxor", 10/600, ehb.kill_rate("Araxxor", 38)),
+    BossOrRaidForUnique("Alchemical Hydra", 24/2160, ehb.kill_rate("Alchemical Hydra", 25))
 ]
 
-SLAYER_BOSS_1X_HOURS = min(map(lambda boss: boss.hours_to_unique, SLAYER_BOSSES))
-SLAYER_BOSS_2X_HOURS = min(map(lambda boss: boss.hours_for_two_uniques(), SLAYER_BOSSES))
+for boss in SLAYER_BOSSES:
+    CATALOG.add(boss, "slayer boss")
+SLAYER_POOL = UniquePool("slayer_boss", SLAYER_BOSSES)
+SLAYER_BOSS_1X_HOURS = SLAYER_POOL.fastest_hours(1)
+SLAYER_BOSS_2X_HOURS = SLAYER_POOL.fastest_hours(2)
 
 # --- Raid Drop (any raid, unique table) ---
 # While team purple rates go up in group raids, individual doesn't (ignore ToB)
@@ -112,50 +329,40 @@ RAIDS = [
     BossOrRaidForUnique("Trio HMT", 1/23.1, (60 / 24))
 ]
 
-RAID_1X_HOURS = min(map(lambda raid: raid.hours_to_unique, RAIDS))
-RAID_2X_HOURS = min(map(lambda raid: raid.hours_for_two_uniques(), RAIDS))
+for raid in RAIDS:
+    CATALOG.add(raid, "raid")
+RAID_POOL = UniquePool("raid", RAIDS)
+RAID_1X_HOURS = RAID_POOL.fastest_hours(1)
+RAID_2X_HOURS = RAID_POOL.fastest_hours(2)
 
 # --- Barrows Unique ---
 # 24 items, 1/17.42 for any unique per chest (with max reward potential)
 # ~15 chests/hr with Barrows tele + max gear
 # Median for 3 uniques: nbinom(3, 1/17.42)
-p_barrows = 1/17.42
-barrows_kph = 15
-med_3_barrows = int(ceil(nbinom.ppf(0.5, 3, p_barrows)))
-med_4_barrows = int(ceil(nbinom.ppf(0.5, 4, p_barrows)))
-med_5_barrows = int(ceil(nbinom.ppf(0.5, 5, p_barrows)))
-BARROWS_3X_HOURS = round(med_3_barrows / barrows_kph, 2)
-BARROWS_4X_HOURS = round(med_4_barrows / barrows_kph, 2)
-BARROWS_5X_HOURS = round(med_5_barrows / barrows_kph, 2)
+BARROWS = register_activity("barrows", 1/17.42, ehb.kill_rate("barrows_chests", 15))
+BARROWS_3X_HOURS = BARROWS.hours(3)
+BARROWS_4X_HOURS = BARROWS.hours(4)
+BARROWS_5X_HOURS = BARROWS.hours(5)
 
 # --- DK Rings (Warrior, Berserker, Seer, Archer) ---
 # I assume we can get e.g. 2 or 3 b rings and that will count...?
-p_dk_ring = 0.04639
-dk_kph = 66 # 22 kills of each one/hour https://oldschool.runescape.wiki/w/Money_making_guide/Killing_Dagannoth_Kings_(Solo_tribrid)
-med_3_dk = int(ceil(nbinom.ppf(0.5, 3, p_dk_ring)))
-DK_3X_HOURS = round(med_3_dk / dk_kph, 2)
+# 66 kph = 22 kills of each one/hour https://oldschool.runescape.wiki/w/Money_making_guide/Killing_Dagannoth_Kings_(Solo_tribrid)
+DK = register_activity("dk_rings", 0.04639, 66)
+DK_3X_HOURS = DK.hours(3)
 
 # --- Moons of Peril ---
 # 18 kph https://oldschool.runescape.wiki/w/Money_making_guide/Moons_of_Peril
 # 1/19 for unique https://oldschool.runescape.wiki/w/Lunar_Chest
-p_moons = 1/19
-moons_kph = 18
-def moons_hours(n):
-    return round(int(ceil(nbinom.ppf(0.5, n, p_moons))) / moons_kph, 2)
+MOONS = register_activity("moons", 1/19, ehb.kill_rate("lunar_chests", 18))
 
 # --- Hueycoatl ---
 # 1/70 for a unique in a trio
-p_huey = 1/70
-huey_kph = 20
-def huey_hours(n):
-    return round(int(ceil(nbinom.ppf(0.5, n, p_huey))) / huey_kph, 2)
+HUEY = register_activity("huey", 1/70, ehb.kill_rate("hueycoatl", 20), team="trio")
 
 # --- Doom of Mokhaiotl ---
 # Claiming wave 8
-p_doom = 1/50 # Odds of a unique by wave 8
-doom_kph = 6
-def doom_hours(n):
-    return round(int(ceil(nbinom.ppf(0.5, n, p_doom))) / doom_kph, 2)
+# 1/50 = odds of a unique by wave 8
+DOOM = register_activity("doom", 1/50, ehb.kill_rate("doom_of_mokhaiotl", 6))
 
 # --- GWD Drop (unique, no shards) ---
 # Fastest: probably Kree'arra or Zilyana
@@ -169,10 +376,8 @@ def doom_hours(n):
 # Combined: 3/384 + 1/512 = ~1/103
 # ~30 kills/hr with good team/gear
 # Median: ceil(log(0.5)/log(102/103)) = ~71 kills / 30 = 2.4 hr
-p_gwd = 1/103
-gwd_kph = 25
-med_1_gwd = ceil(log(0.5) / log(1 - p_gwd))
-GWD_1X_HOURS = round(med_1_gwd / gwd_kph, 2)
+GWD = register_activity("gwd", 1/103, ehb.kill_rate("commander_zilyana", 25), team="team", geometric_1x=True)
+GWD_1X_HOURS = GWD.hours(1)
 
 # --- Crystal Armour Seed ---
 # From Gauntlet/Corrupted Gauntlet. CG: 1/50, ~6 completions/hr
@@ -182,10 +387,8 @@ GWD_1X_HOURS = round(med_1_gwd / gwd_kph, 2)
 # And from CG 1/50 at 6/hr = 5.7 hr
 # And regular Gauntlet: 1/2000 - way too slow
 # Zalcano might actually be slightly faster but let's say ~5 hours
-p_cg_crystal = 1/50
-cg_kph = 6
-med_1_crystal = ceil(log(0.5) / log(1 - p_cg_crystal))
-CRYSTAL_SEED_1X_HOURS = round(med_1_crystal / cg_kph, 2)
+CG_CRYSTAL = register_activity("cg_crystal_seed", 1/50, ehb.kill_rate("the_corrupted_gauntlet", 6), geometric_1x=True)
+CRYSTAL_SEED_1X_HOURS = CG_CRYSTAL.hours(1)
 
 # --- Ecumenical Key ---
 # Just kill goblins and imps free tile
@@ -200,7 +403,44 @@ ECUMENICAL_3X_HOURS = 1
 # The task says "unique AND secondary unique tables" so secondaries count too
 # Vardorvis with secondary: chromium ingot 1/150 alone makes this fast
 # 40 kph, ~1/150 for ingot -> median ~104 kills / 40 = 2.6 hr for just ingot
-DT2_1X_HOURS = 2.5
+# The other three haven't been worked out: assumed the same ~1/136 combined, they lose on kph anyway
+CATALOG.add(BossOrRaidForUnique("Vardorvis", 1/136, ehb.kill_rate("Vardorvis", 40)), "dt2")
+CATALOG.add(BossOrRaidForUnique("Duke Sucellus", 1/136, ehb.kill_rate("Duke Sucellus", 25)), "dt2", guess=True)
+CATALOG.add(BossOrRaidForUnique("The Leviathan", 1/136, ehb.kill_rate("The Leviathan", 22)), "dt2", guess=True)
+CATALOG.add(BossOrRaidForUnique("The Whisperer", 1/136, ehb.kill_rate("The Whisperer", 18)), "dt2", guess=True)
+DT2_1X = CATALOG.solve("dt2")
+DT2_1X_HOURS = DT2_1X.hours
+
+# --- Wildy Boss Ring (Ring of the Gods, Treasonous Ring, Tyrannical Ring) ---
+# 1/512 from the multi bosses, 1/716 from their singles counterparts (wiki drop tables)
+CATALOG.add(BossOrRaidForUnique("Artio", 1/716, ehb.kill_rate("Artio", 50)), "wildy boss ring", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Calvar'ion", 1/716, ehb.kill_rate("Calvar'ion", 40)), "wildy boss ring", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Spindel", 1/716, ehb.kill_rate("Spindel", 40)), "wildy boss ring", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Callisto", 1/512, ehb.kill_rate("Callisto", 25)), "wildy boss ring", "wilderness", "multi")
+CATALOG.add(BossOrRaidForUnique("Venenatis", 1/512, ehb.kill_rate("Venenatis", 25)), "wildy boss ring", "wilderness", "multi")
+CATALOG.add(BossOrRaidForUnique("Vet'ion", 1/512, ehb.kill_rate("Vet'ion", 20)), "wildy boss ring", "wilderness", "multi")
+
+# --- Raid Kit (Holy/Sanguine/Twisted) ---
+# HMT is much faster but I don't think it's realistic for most of the team, me included,
+# so it is left out of every raid kit tile unless a board asks for it
+# CoX CM: 1/75 per raid for either kit; HMT: 5/300 per raid for either kit
+CATALOG.add(BossOrRaidForUnique("CoX CM", 1/75, ehb.kill_rate("Chambers of Xeric Challenge Mode", 3)), "raid kit")
+CATALOG.add(BossOrRaidForUnique("Trio HMT", 5/300, ehb.kill_rate("Theatre of Blood Hard Mode", 3)), "raid kit", "expert")
+CATALOG.exclude_by_default("raid kit", "expert")
+
+# --- Pet ---
+# Pet rates are the wiki's pet drop rates
+# Chompy chick (1/500 chompies) and Skotizo (1/65) don't count for the board
+CATALOG.add(BossOrRaidForUnique("Chompy bird hunting", 1/500, ehb.kill_rate("Chompy bird hunting", 250)), "pet", "chompy chick")
+CATALOG.add(BossOrRaidForUnique("Skotizo", 1/65, ehb.kill_rate("Skotizo", 4)), "pet")
+CATALOG.add(BossOrRaidForUnique("Chaos Elemental", 1/300, ehb.kill_rate("Chaos Elemental", 48)), "pet", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Chaos Fanatic", 1/1000, ehb.kill_rate("Chaos Fanatic", 60)), "pet", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Scorpia", 1/2016, ehb.kill_rate("Scorpia", 60)), "pet", "wilderness")
+CATALOG.add(BossOrRaidForUnique("Giant Mole", 1/3000, ehb.kill_rate("Giant Mole", 90)), "pet")
+CATALOG.add(BossOrRaidForUnique("Sarachnis", 1/3000, ehb.kill_rate("Sarachnis", 67)), "pet")
+CATALOG.add(BossOrRaidForUnique("Kalphite Queen", 1/3000, ehb.kill_rate("Kalphite Queen", 40)), "pet")
+CATALOG.add(BossOrRaidForUnique("Zulrah", 1/4000, ehb.kill_rate("Zulrah", 35)), "pet")
+CATALOG.add(BossOrRaidForUnique("TzTok-Jad", 1/200, ehb.kill_rate("TzTok-Jad", 1)), "pet")
 
 # --- Zulrah Unique (include mutagens) ---
 # Zulrah uniques: Tanzanite fang, Magic fang, Serpentine visage each 1/512
@@ -211,10 +451,8 @@ DT2_1X_HOURS = 2.5
 # Actually Zulrah uniques (from unique table) are 1/512 each for the 3 items
 # and 1/3277 each for the 2 mutagens (not 1/6553, that might be outdated)
 # Let me use: combined = 3/512 + 2/3277 ≈ 0.00586 + 0.00061 = 0.00647 ≈ 1/155
-p_zulrah = 1/155
-zulrah_kph = 35
-med_1_zulrah = ceil(log(0.5) / log(1 - p_zulrah))
-ZULRAH_1X_HOURS = round(med_1_zulrah / zulrah_kph, 2)
+ZULRAH = register_activity("zulrah", 1/155, ehb.kill_rate("zulrah", 35), geometric_1x=True)
+ZULRAH_1X_HOURS = ZULRAH.hours(1)
 
 # --- Vorkath unique ---
 # Vorkath Head 1/50, Jar of Decay 1/2000, Dragonbone Necklace 1/1000, 
@@ -264,123 +502,537 @@ MARKS_25_HOURS = 1.4
 
 ELDER_CUSTODIANS_PER_HOUR = 150
 
+# Named estimates that board definition files can reference with
+# {"activity": NAME} (fixed hours) or {"activity": NAME, "count": N} (callables)
+ACTIVITY_CATALOG = {
+    "SLAYER_BOSS_1X_HOURS": SLAYER_BOSS_1X_HOURS,
+    "SLAYER_BOSS_2X_HOURS": SLAYER_BOSS_2X_HOURS,
+    "RAID_1X_HOURS": RAID_1X_HOURS,
+    "RAID_2X_HOURS": RAID_2X_HOURS,
+    "BARROWS_3X_HOURS": BARROWS_3X_HOURS,
+    "BARROWS_4X_HOURS": BARROWS_4X_HOURS,
+    "BARROWS_5X_HOURS": BARROWS_5X_HOURS,
+    "DK_3X_HOURS": DK_3X_HOURS,
+    "GWD_1X_HOURS": GWD_1X_HOURS,
+    "CRYSTAL_SEED_1X_HOURS": CRYSTAL_SEED_1X_HOURS,
+    "ECUMENICAL_3X_HOURS": ECUMENICAL_3X_HOURS,
+    "DT2_1X_HOURS": DT2_1X_HOURS,
+    "ZULRAH_1X_HOURS": ZULRAH_1X_HOURS,
+    "VORKATH_UNIQUE_HOURS": VORKATH_UNIQUE_HOURS,
+    "TEMPOROSS_HOURS": TEMPOROSS_HOURS,
+    "WINTERTODT_HOURS": WINTERTODT_HOURS,
+    "WHIP_OR_UNSIRED_3X_HOURS": WHIP_OR_UNSIRED_3X_HOURS,
+    "WHIP_OR_UNSIRED_4X_HOURS": WHIP_OR_UNSIRED_4X_HOURS,
+    "CHAMPION_SCROLL_HOURS": CHAMPION_SCROLL_HOURS,
+    "MARKS_25_HOURS": MARKS_25_HOURS,
+    "slayer_boss": SLAYER_POOL.fastest_hours,
+    "raid": RAID_POOL.fastest_hours,
+    # older board files use the helper names
+    "moons_hours": MOONS.hours,
+    "huey_hours": HUEY.hours,
+    "doom_hours": DOOM.hours,
+}
+
+UNIQUE_POOLS = {"slayer_boss": SLAYER_POOL, "raid": RAID_POOL}
+
+# Item names in tile descriptions that mean a registered activity or pool
+ITEM_ACTIVITIES = {
+    "slayer boss drop": "slayer_boss",
+    "raid drop": "raid",
+    "barrows unique": "barrows",
+    "dk ring": "dk_rings",
+    "moons of peril unique": "moons",
+    "hueycoatl unique": "huey",
+    "doom unique": "doom",
+    "gwd drop": "gwd",
+    "crystal armour seed": "cg_crystal_seed",
+    "zulrah unique": "zulrah",
+    "doom of mokhaiotl unique": "doom",
+    # category tiles, solved over CATALOG
+    "pet": "pet",
+    "dt2 boss drop": "dt2",
+    "dt2 boss unique": "dt2",
+    "raid kit": "raid kit",
+    "wildy boss ring": "wildy boss ring",
+}
+
+# Qualifiers on a tile's item that item_key strips before the lookup:
+#   "Raid Drop from ANY Raid (UNIQUE TABLE ONLY)"     -> raid drop
+#   "Slayer Boss Drop (UNIQUE TABLE ONLY) MUST BE A BOSS SLAYER MONSTER WITHIN THE SLAYER SKILL TAB"
+#   "Unique from Hueycoatl", "Uniques from Moons of Peril" -> hueycoatl unique, moons of peril unique
+#   "Drop from any DT2 Boss Unique and Secondary Unique Tables" -> dt2 boss drop
+#   "Any GWD Drop (UNIQUE TABLE ONLY NO SHARDS)", "Odium Shard (any)", "(GOOD) (LUCK)"
+#   "Tertiary Drop from Zalcano", "Drop from Nightmare Unique Table" -> zalcano tertiary, nightmare unique
+#   "Piece of Ancient Ceremonial Robes Set"            -> ancient ceremonial robe piece
+# A plural last word is made singular ("Fire Capes" -> fire cape).
+# "(no a/b)" or "(no a or b)" names sources to leave out of a category tile. On a
+# registered activity ("Barrows Unique (no bolt racks)", "(no pet)") its rate
+# already follows the board's table definition, so the exclusion is dropped.
+CAPS_TAIL_RE = re.compile(r"(?<=\))\s+[A-Z][A-Z\s]+$")
+PAREN_TAIL_RE = re.compile(r"\s*\(([^()]*)\)\s*$")
+FROM_RE = re.compile(r"^(.*?)\s+from\s+(?:any\s+)?(.+)$", re.IGNORECASE)
+TABLES_RE = re.compile(r"\s+(unique\s+)?(?:and\s+secondary\s+unique\s+)?tables?$", re.IGNORECASE)
+PIECE_RE = re.compile(r"^piece\s+of\s+(.+?)\s+set$", re.IGNORECASE)
+ANY_RE = re.compile(r"^any\s+", re.IGNORECASE)
+PLURAL_RE = re.compile(r"(?<=[^aiosu'\s])s$")
+EXCLUDE_SPLIT_RE = re.compile(r"\s*(?:/|,|\bor\b)\s*", re.IGNORECASE)
+GENERIC_ITEMS = {"unique", "uniques", "drop", "drops"}
+
+def item_key(name):
+    """(ITEM_ACTIVITIES lookup key, [excluded sources]) for an item name with its qualifiers removed."""
+    exclude = []
+    name = CAPS_TAIL_RE.sub("", name.strip())
+    m = PAREN_TAIL_RE.search(name)
+    while m:
+        inner = m.group(1).strip()
+        if inner.lower().startswith("no "):
+            exclude = [x for x in EXCLUDE_SPLIT_RE.split(inner[3:]) if x] + exclude
+        name = name[:m.start()]
+        m = PAREN_TAIL_RE.search(name)
+    m = FROM_RE.match(name)
+    if m:
+        head, tables = m.group(1), TABLES_RE.search(m.group(2))
+        source = PLURAL_RE.sub("", m.group(2)[:tables.start()] if tables else m.group(2))
+        words = head.lower().split()
+        if head.lower() in GENERIC_ITEMS:
+            name = f"{source} {'unique' if tables and tables.group(1) else head.lower().rstrip('s')}"
+        elif len(words) > 1 and words[-1] in GENERIC_ITEMS and source.lower() not in head.lower():
+            name = f"{source} {' '.join(words[:-1])}"  # "Tertiary Drop from Zalcano"
+        else:
+            name = head
+    m = PIECE_RE.match(name)
+    if m:
+        name = f"{PLURAL_RE.sub('', m.group(1))} piece"
+    return PLURAL_RE.sub("", " ".join(ANY_RE.sub("", name).lower().split())), exclude
+
+# Drop models for items that board text names, so a board can be built from its
+# text: {item: ((source, rate per kill, kph), ...)}, kph through
+# ehb.kill_rate(source, kph). The rates are the ones the built-in tiles were
+# estimated from. Items a built-in tile names on its own ("Obtain 3x Antler
+# Guard") are indexed from that tile's rate and kph by item_index(), and a
+# drops.npz (dropdb.py) adds its wiki sources. With a rate of 1, kph is items
+# per hour (pages, marks, pearls).
+ITEM_DROPS = {
+    "soaked page": (("Tempoross", 1, 78),),  # ~6.5 per permit, 12 permits/hr
+    "tackle box": (("Tempoross", 1/400, 12),),
+    "tome of water": (("Tempoross", 1/400, 12),),
+    "dragon harpoon": (("Tempoross", 1/800, 12),),
+    "burnt page": (("Wintertodt", 1, 78),),  # ~6.5 per crate, 12 crates/hr
+    "tome of fire": (("Wintertodt", 1/1000, 12),),
+    "dragon axe": (("Wintertodt", 1/10000, 12),),
+    "abyssal whip": (("Abyssal demon", 1/512, 280),),
+    "unsired": (("Abyssal Sire", 1/100, 28),),
+    "barronite handle": (("Rubble golem", 1/150, 180),),
+    "barronite guard": (("Chaos golem", 1/150, 180),),
+    "barronite head": (("Flawed golem", 1/150, 180),),
+    "blue egg sack": (("Grubby chest", 1/40, 60),),
+    "orange egg sack": (("Grubby chest", 1/40, 60),),
+    "ancient ceremonial robe piece": (("Blood reaver", 1/640, 120),),
+    "silver coffin lock": (("Shade catacomb chests", 1/120, 60),),
+    "golden coffin lock": (("Shade catacomb chests", 1/120, 60),),
+    "ice elemental staff crown": (("Royal Titans", 1/150, 55),),
+    "fire elemental staff crown": (("Royal Titans", 1/150, 55),),
+    "green abyssal dye": (("Guardians of the Rift", 1/1200, 30),),
+    "red abyssal dye": (("Guardians of the Rift", 1/1200, 30),),
+    "blue abyssal dye": (("Guardians of the Rift", 1/1200, 30),),
+    "claws of callisto": (("Artio", 1/618, 50), ("Callisto", 1/618, 25)),
+    "fang of venenatis": (("Spindel", 1/618, 40), ("Venenatis", 1/618, 25)),
+    "skull of vetion": (("Calvar'ion", 1/618, 40), ("Vet'ion", 1/618, 20)),
+    "crystal weapon seed": (("Corrupted Gauntlet", 1/50, 6),),
+    "enhanced crystal weapon seed": (("Corrupted Gauntlet", 1/400, 6),),
+    "spirit shield": (("Corporeal Beast", 1/64, 7),),
+    "holy elixir": (("Corporeal Beast", 1/171, 7),),
+    "sigil": (("Corporeal Beast", 1/585, 7),),  # arcane, spectral and elysian together
+    "oathplate piece": (("Yama", 4.4/600, 8),),  # with the horn, the 5.4/600 of tile 245
+    "soulflame horn": (("Yama", 1/600, 8),),
+    "gnome scarf": (("Gnome Restaurant", 1/50, 30),),  # ~0.6 of each an hour, 30 deliveries/hr
+    "gnome goggles": (("Gnome Restaurant", 1/50, 30),),
+    "mint cake": (("Gnome Restaurant", 1/50, 30),),
+    "ranger boots": (("Medium clue", 1/283.6, 10),),
+    "climbing boots": (("Medium clue", 1/283.6, 10),),
+    "holy sandals": (("Medium clue", 1/283.6, 10),),
+    "spiked manacles": (("Medium clue", 1/283.6, 10),),
+    "wizard boots": (("Medium clue", 1/283.6, 10),),
+    "vorkath head": (("Vorkath", 1/50, 30),),
+    "jar of decay": (("Vorkath", 1/3000, 30),),
+    "dragonbone necklace": (("Vorkath", 1/1000, 30),),
+    "draconic visage": (("Vorkath", 1/5000, 30),),
+    "skeletal visage": (("Vorkath", 1/5000, 30),),
+    "vorki": (("Vorkath", 1/3000, 30),),
+    "zombie helmet": (("Armoured zombie", 1/600, 400),),
+    "blood quartz": (("Vardorvis", 1/207, 40),),
+    "ice quartz": (("Duke Sucellus", 1/207, 25),),
+    "shadow quartz": (("The Whisperer", 1/207, 18),),
+    "smoke quartz": (("The Leviathan", 1/207, 22),),
+    "dt2 vestige": (("Vardorvis", 1/1088, 40), ("Duke Sucellus", 1/1088, 25),
+                    ("The Leviathan", 1/1088, 22), ("The Whisperer", 1/1088, 18)),
+    "ecumenical key": (("Wilderness God Wars Dungeon", 1/40, 110),),
+    "champion scroll": (("Goblin", 1/5000, 500),),
+    "mark of grace": (("Ardougne Rooftop Course", 1, 17.5),),
+    "molch pearl": (("Aerial fishing", 1, 8),),
+}
+
+# Item lists that together are a registered activity or category tile
+ITEM_SETS = {
+    frozenset({"warrior ring", "berserker ring", "seer ring", "archer ring"}): "dk_rings",
+    frozenset({"ring of the god", "treasonous ring", "tyrannical ring"}): "wildy boss ring",
+    frozenset({"holy kit", "sang kit", "twisted kit"}): "raid kit",
+}
+
+# Run-based items: attempts.AttemptModel arguments for one of them (drops = quantity)
+ITEM_ATTEMPTS = {
+    "fire cape": {"minutes": 35, "sd": 5},
+    "inferno cape": {"minutes": 75, "sd": 8, "success": 0.8, "fail_minutes": 60, "fail_sd": 25},
+}
+
+_item_index = None
+
+def item_index():
+    """{item key: [(source, rate, kph), ...]} from ITEM_DROPS and the built-in tiles that name one item."""
+    global _item_index
+    if _item_index is None:
+        index, from_tile = {}, set()
+        for item, sources in ITEM_DROPS.items():
+            index[item_key(item)[0]] = [(s, rate, ehb.kill_rate(s, kph)) for s, rate, kph in sources]
+        for t in tiles:
+            if t["category"] != "obtain" or not t["rate"] or t.get("activity"):
+                continue
+            alts = tile_parser.parse_description(t["tile"], t["description"]).alternatives
+            if len(alts) == 1 and len(alts[0][1]) == 1:
+                key = item_key(alts[0][1][0])[0]
+                if key not in from_tile:  # the first tile naming an item sets its rate
+                    from_tile.add(key)
+                    index.setdefault(key, []).append((f"built-in tile {t['tile']}", t["rate"], t["kph"]))
+        _item_index = index
+    return _item_index
+
+def known_item(key):
+    return (key in item_index() or key in ITEM_ACTIVITIES or key in ITEM_ATTEMPTS
+            or any(key in items for items in ITEM_SETS))
+
+def alternative_keys(names):
+    """item_key of each name in one alternative, a bare word completed from the last name when
+    that makes a known item ("Silver or Golden Coffin Locks": silver coffin lock, golden coffin lock)."""
+    keys = [item_key(n)[0] for n in names]
+    last = keys[-1].split()
+    for i, k in enumerate(keys):
+        if " " not in k and not known_item(k):
+            keys[i] = next((c for c in (f"{k} {' '.join(last[j:])}" for j in range(1, len(last))) if known_item(c)), k)
+    return keys
+
+# ============================================================
+# BOARD DEFINITION FILES (for --batch)
+# ============================================================
+# A board file is JSON: either a list of tile entries or {"tiles": [...]}.
+# Each entry has "tile" and "description" plus one of:
+#   {"move": 11}                                  movement tile
+#   {"free": true}                                free / roll again
+#   {"hours": 2.5}                                hand-set estimate (may add rate/drops for shape, and
+#                                                 "activity" to pick its calibration factor)
+#   {"activity": "RAID_1X_HOURS"}                 named estimate from ACTIVITY_CATALOG
+#   {"activity": "slayer_boss", "count": 3}       catalog helper taking a count
+#   {"activity": "moons", "count": 3}             registered activity (ACTIVITIES), count defaults to 1
+#   {"activity": "raid", "count": 2}              fastest source in a UNIQUE_POOLS pool
+#   {"activity": "pet", "exclude": ["chompy"]}    fastest CATALOG source with that tag (count defaults to 1)
+#   {"rate": "1/33", "kph": 40, "drops": 5}       drop-rate estimate (drops defaults to 1)
+#   {"attempts": {"minutes": 75, "sd": 8, "success": 0.8, "drops": 5}}
+#                                                 run-based estimate (attempts.AttemptModel arguments)
+# "notes" and "confidence" are optional and passed through.
+
+def parse_rate(rate):
+    """Accept 0.03, "1/33" or "3/1419" and return a per-kill probability."""
+    if isinstance(rate, str) and "/" in rate:
+        num, den = rate.split("/")
+        return float(num) / float(den)
+    return float(rate)
+
+def drop_hours(drops, p, kph):
+    """Median hours for `drops` drops at rate p, same math as the hand-built tiles."""
+    if p >= 1:
+        return drops / kph, drops
+    if drops == 1:
+        med = ceil(log(0.5) / log(1 - p))
+    else:
+        med = median_kills_nbinom(drops, p)
+    return med / kph, med
+
+def load_board(path):
+    """Build a tiles list (same dicts as add_tile) from a board definition file."""
+    with open(path) as f:
+        spec = json.load(f)
+    return board_from_entries(spec["tiles"] if isinstance(spec, dict) else spec, path)
+
+def board_from_entries(entries, path="<board>"):
+    board = []
+    for e in entries:
+        num, desc = e["tile"], e["description"]
+        notes = e.get("notes", "")
+        conf = e.get("confidence", "high")
+        if "move" in e:
+            add_movement(num, desc, e["move"], board=board)
+        elif e.get("free"):
+            add_free(num, desc, board=board)
+        elif "hours" in e:
+            rate = parse_rate(e["rate"]) if "rate" in e else None
+            add_tile(num, desc, e["hours"], notes, conf, board=board,
+                     drops=e.get("drops"), rate=rate, kph=e.get("kph"), activity=e.get("activity"),
+                     attempts=e.get("attempts"))
+        elif "attempts" in e:
+            model = attempts.model(e["attempts"])
+            add_tile(num, desc, model.median_hours, notes or model.notes(), conf, board=board, attempts=e["attempts"])
+        elif e.get("activity") in CATALOG.tags:
+            choice = CATALOG.solve(e["activity"], e.get("count", 1), e.get("exclude", ()))
+            add_tile(num, desc, choice.hours, notes or choice.notes(), conf, board=board, **choice.shape())
+        elif e.get("activity") in UNIQUE_POOLS:
+            pool, n = UNIQUE_POOLS[e["activity"]], e.get("count", 1)
+            member, hours = pool.fastest(n)
+            add_tile(num, desc, hours, notes or f"{member.name} x{n}", conf, board=board, **pool.shape(n))
+        elif e.get("activity") in ACTIVITIES:
+            act, n = ACTIVITIES[e["activity"]], e.get("count", 1)
+            add_tile(num, desc, act.hours(n), notes or f"{act.name} x{n}, {act.kph} kph {act.team}", conf, board=board,
+                     **act.shape(n))
+        elif "activity" in e:
+            est = ACTIVITY_CATALOG[e["activity"]]
+            hours = est(e["count"]) if callable(est) else est
+            add_tile(num, desc, hours, notes or e["activity"], conf, board=board)
+        elif "rate" in e:
+            drops = e.get("drops", 1)
+            hours, med = drop_hours(drops, parse_rate(e["rate"]), e["kph"])
+            add_tile(num, desc, hours, notes or f"{e['rate']} drop, {e['kph']} kph, median {med} kc", conf, board=board,
+                     drops=drops, rate=parse_rate(e["rate"]), kph=e["kph"])
+        else:
+            raise ValueError(f"{path}: tile {num} has no move/free/hours/attempts/activity/rate")
+    return board
+
+def requirement_entry(req, known):
+    """Board-file entry for a parsed tile, or None if nothing can estimate it.
+
+    Obtain tiles resolve, in order: an item (or item list, ITEM_SETS) that is
+    a registered activity, a run-based item (ITEM_ATTEMPTS), then the fastest
+    source over every alternative's items in item_index() and the drop
+    database, with kill rates from ehb. Only tiles with no item model fall
+    back to the same description on the built-in board (`known`, which maps
+    a description, or (tile, description), to a built-in tile).
+    """
+    e = {"tile": req.tile, "description": req.description}
+    if req.kind == "movement":
+        return {**e, "move": req.target}
+    if req.kind == "free":
+        return {**e, "free": True}
+    if len(req.alternatives) == 1:
+        qty, names = req.alternatives[0]
+        keys = alternative_keys(names)
+        if len(names) == 1 and keys[0] in ITEM_ACTIVITIES:
+            e.update(activity=ITEM_ACTIVITIES[keys[0]], count=qty)
+            exclude = item_key(names[0])[1]
+            if exclude and e["activity"] in CATALOG.tags:
+                e["exclude"] = exclude
+            return e
+        if frozenset(keys) in ITEM_SETS:
+            return {**e, "activity": ITEM_SETS[frozenset(keys)], "count": qty}
+        if len(names) == 1 and keys[0] in ITEM_ATTEMPTS:
+            return {**e, "attempts": {**ITEM_ATTEMPTS[keys[0]], "drops": qty}}
+    db = dropdb.database()
+    best = None
+    for qty, names in req.alternatives:
+        by_source, missing = {}, []
+        for name, key in zip(names, alternative_keys(names)):
+            found = list(item_index().get(key, ()))
+            for source, rate in db.sources(ANY_RE.sub("", name)) if db else ():
+                kph = ehb.kill_rate(source, None)
+                if kph is not None:
+                    found.append((source, rate, kph))
+            if not found:
+                missing.append(name)
+            for source, rate, kph in found:
+                by_source.setdefault((source, kph), {})[key] = rate
+        for (source, kph), rates in by_source.items():
+            p = combined_rate(rates.values()) if len(rates) > 1 else next(iter(rates.values()))
+            hours, med = drop_hours(qty, p, kph)
+            if best is None or hours < best[0]:
+                rate = f"{kph:g}/hr" if p == 1 else f"1/{1 / p:.0f}, {kph:g} kph, median {med} kc"
+                notes = f"{qty}x {' or '.join(rates)} from {source}: {rate}"
+                if missing:
+                    notes += f" (no drop rate for {', '.join(missing)})"
+                best = (hours, {**e, "rate": p, "kph": kph, "drops": qty, "notes": notes, "confidence": "medium"})
+    if best is not None:
+        return best[1]
+    t = known.get((req.tile, req.description.lower())) or known.get(req.description.lower())
+    if t is not None:
+        return {**e, "hours": t["median_hours"], "notes": t["notes"], "confidence": t["confidence"],
+                **{k: t[k] for k in ("drops", "rate", "kph") if t[k] is not None}}
+    return None
+
+def board_from_text(path, **kwargs):
+    """Build a tiles list from a numbered board listing ("12. Obtain 3x Antler Guard")."""
+    with open(path) as f:
+        return board_from_listing(f.read(), path, **kwargs)
+
+def board_from_pdf(path, **kwargs):
+    """Build a tiles list from the tile-descriptions PDF (extraction cached by file hash)."""
+    import pdf_ingest
+    return board_from_listing(pdf_ingest.extract_board(path), path, **kwargs)
+
+def board_from_listing(text, path="<text>", unknown_hours=None):
+    """Tiles list from listing text; unknown_hours (low confidence) fills tiles nothing can estimate."""
+    reqs = tile_parser.parse_board(text)
+    # Same tile and description first: repeated descriptions aren't always estimated alike
+    known = {}
+    for t in tiles:
+        if t["category"] == "obtain":
+            known.setdefault(t["description"].lower(), t)
+            known[t["tile"], t["description"].lower()] = t
+    entries = []
+    for r in reqs:
+        e = requirement_entry(r, known)
+        if e is None and unknown_hours is not None:
+            e = {"tile": r.tile, "description": r.description, "hours": unknown_hours,
+                 "notes": "No estimate, --unknown-hours", "confidence": "low"}
+        entries.append(e)
+    missing = [r.tile for r, e in zip(reqs, entries) if e is None]
+    if missing:
+        raise ValueError(f"{path}: no estimate for tiles {missing} (pass --unknown-hours to fill them)")
+    return board_from_entries(entries, path)
+
+def dump_board(board, path):
+    """Write a tiles list as a board definition file (estimates frozen as hours)."""
+    entries = []
+    for t in sorted(board, key=lambda x: x["tile"]):
+        e = {"tile": t["tile"], "description": t["description"]}
+        if t["category"] == "movement":
+            e["move"] = t["target"]
+        elif t["category"] == "free":
+            e["free"] = True
+        else:
+            # Uncalibrated hours: loading the file applies calibration.json again
+            e.update(hours=round(t["median_hours"] * calibration.speed(t.get("activity")), 2),
+                     notes=t["notes"], confidence=t["confidence"])
+            if t["rate"] is not None:
+                e.update(drops=t["drops"], rate=t["rate"], kph=t["kph"])
+            if t.get("activity"):
+                e["activity"] = t["activity"]
+            if t.get("attempts"):
+                e["attempts"] = t["attempts"]
+        entries.append(e)
+    with open(path, "w") as f:
+        json.dump({"tiles": entries}, f, indent=1)
+
 # ============================================================
 # NOW BUILD EVERY TILE
 # ============================================================
 
 # Tile 1: 5x Scurrius' Spine (1/33, ~40 kph)
-p = 1/33; kph = 40
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(1, "Obtain 5x Scurrius' Spine", med/kph, f"1/33 drop, {kph} kph, median {med} kc")
+p = 1/33; kph = ehb.kill_rate("Scurrius", 40)
+med = median_kills_nbinom(5, p)
+add_tile(1, "Obtain 5x Scurrius' Spine", med/kph, f"1/33 drop, {kph} kph, median {med} kc", drops=5, rate=p, kph=kph)
 
 # Tile 2: Tempoross
 add_tile(2, "Obtain 100x Soaked Page or 1x Tempoross unique", TEMPOROSS_HOURS, "100 soaked pages fastest (~6-8/permit, 12 permits/hr)")
 
 # Tile 3: 3x DK Ring
-add_tile(3, "Obtain 3x DK Ring", DK_3X_HOURS, f"Combined ring rate ~1/21.5 per trio, 15 trios/hr, median {med_3_dk} trios")
+add_tile(3, "Obtain 3x DK Ring", DK_3X_HOURS, f"Combined ring rate ~1/21.5 per trio, 15 trios/hr, median {DK.median_kills(3)} trios", **DK.shape(3))
 
 # Tile 4: Movement
 add_movement(4, "Advance to Tile #11", 11)
 
 # Tile 5: 5x Fresh Crab Claw (crawblaw isle crabs)
 p = 1/8; kph = 150
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(5, "Obtain 5x Fresh Crab Claw", med/kph, f"1/8 from level 23 crabclaw isle crabs, {kph} kph, median {med} kc", confidence="high")
+med = median_kills_nbinom(5, p)
+add_tile(5, "Obtain 5x Fresh Crab Claw", med/kph, f"1/8 from level 23 crabclaw isle crabs, {kph} kph, median {med} kc", confidence="high", drops=5, rate=p, kph=kph)
 
 # Tile 6: 3x Barronite piece (Barronite Handle/Guard/Head from Camdozaal, ~1/100 each, combined ~1/33)
 p = 1/150; kph = 180  # mining golems in camdozaal, rough estimate
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(6, "Obtain 3x Barronite piece", med/kph, f"Barrornite guard 1/150 from chaos golems, ~{kph} kph", confidence="high")
+med = median_kills_nbinom(3, p)
+add_tile(6, "Obtain 3x Barronite piece", med/kph, f"Barrornite guard 1/150 from chaos golems, ~{kph} kph", confidence="high", drops=3, rate=p, kph=kph)
 
 # Tile 7: 3x Mudskipper Hat (from Mogres, 1/32)
 p = 1/30; kph = 120
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(7, "Obtain 3x Mudskipper Hat", med/kph, f"1/30 from Mogres, ~{kph} kph, median {med} kc", confidence="high")
+med = median_kills_nbinom(3, p)
+add_tile(7, "Obtain 3x Mudskipper Hat", med/kph, f"1/30 from Mogres, ~{kph} kph, median {med} kc", confidence="high", drops=3, rate=p, kph=kph)
 
 # Tile 8: 4x Left Skull Half (from SS Ankous)
 p = 1/33; kph = 180
-med = int(ceil(nbinom.ppf(0.5, 4, p)))
-add_tile(8, "Obtain 4x Left Skull Half", 3.0, f"1/33.33 from S.S. ankous, ~{kph} kph, median {med} kc", confidence="high")
+med = median_kills_nbinom(4, p)
+add_tile(8, "Obtain 4x Left Skull Half", 3.0, f"1/33.33 from S.S. ankous, ~{kph} kph, median {med} kc", confidence="high", drops=4, rate=p, kph=kph)
 
 # Tile 9: 5x Broken Antler (Custodian stalkers)
 p = 1/20; kph = 150
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(9, "Obtain 5x Broken Antler", med/kph, f"From Custodian Stalkers, ~1/20, ~{kph} kph", confidence="high")
+med = median_kills_nbinom(5, p)
+add_tile(9, "Obtain 5x Broken Antler", med/kph, f"From Custodian Stalkers, ~1/20, ~{kph} kph", confidence="high", drops=5, rate=p, kph=kph)
 
 # Tile 10: 3x Mossy Key (from Bryophyta
-p = 1/16; kph = 80  # Using burning claws on bryophyta, similar to Obor https://oldschool.runescape.wiki/w/Giant_key, "players can kill Obor 120+ times per hour when using burning claws, giving approximately 8 keys per hour."
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(10, "Obtain 3x Mossy Key", med/kph, f"1/16 from bryophyta off-task, ~{kph} burning claw speccing, median {med} kc")
+p = 1/16; kph = ehb.kill_rate("Bryophyta", 80)  # Using burning claws on bryophyta, similar to Obor https://oldschool.runescape.wiki/w/Giant_key, "players can kill Obor 120+ times per hour when using burning claws, giving approximately 8 keys per hour."
+med = median_kills_nbinom(3, p)
+add_tile(10, "Obtain 3x Mossy Key", med/kph, f"1/16 from bryophyta off-task, ~{kph} burning claw speccing, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 11: 25x Mark of Grace
 add_tile(11, "Obtain 25x Mark of Grace", MARKS_25_HOURS, "~17.5 marks/hr on Ardougne")
 
 # Tile 12: 3x Antler Guard (Custodian Stalker)
 p = 1/650; kph = ELDER_CUSTODIANS_PER_HOUR
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(12, "Obtain 3x Antler Guard", med/kph, f"Cannoning Elder custodian stalkers, ~{kph} per hour, median {med} kc", confidence="high")
+med = median_kills_nbinom(3, p)
+add_tile(12, "Obtain 3x Antler Guard", med/kph, f"Cannoning Elder custodian stalkers, ~{kph} per hour, median {med} kc", confidence="high", drops=3, rate=p, kph=kph)
 
 # Tile 13: 1x Squid Beak (from sailing squid)
 # https://oldschool.runescape.wiki/w/Squid_beak
 # https://oldschool.runescape.wiki/w/Raw_jumbo_squid
 p = 1/612; kph = 300 # 300 per hour average btwn comments here https://old.reddit.com/r/2007scape/comments/1qc5p9h/why_do_jumbo_squid_which_heal_17_and_take_69/nzfpnrk/
-med = int(ceil(nbinom.ppf(0.5, 1, p)))
-add_tile(13, "Obtain 1x Squid Beak", med/kph, f"Catching jumbo squid, ~{kph} per hour, median {med} kc", confidence="high")
+med = median_kills_nbinom(1, p)
+add_tile(13, "Obtain 1x Squid Beak", med/kph, f"Catching jumbo squid, ~{kph} per hour, median {med} kc", confidence="high", drops=1, rate=p, kph=kph)
 
 # Tile 14: 3x Barrows Unique
-add_tile(14, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS, f"1/17.42 per chest, {barrows_kph} chests/hr")
+add_tile(14, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS, f"1/17.42 per chest, {BARROWS.kph} chests/hr", **BARROWS.shape(3))
 
 # Tile 15: 1x Ring of the Gods, Treasonous Ring or Tyrannical Ring
 # These drop from wilderness bosses (Vet'ion, Venenatis, Callisto) and their demi-boss counterparts
-p = 1/716; kph = 50
-med = ceil(log(0.5) / log(1 - p))
-add_tile(15, "Obtain 1x Wildy Boss Ring", med/kph, f"1/716 from artio, {kph} kph, median {med} kc")
+ring = CATALOG.solve("wildy boss ring")
+add_tile(15, "Obtain 1x Wildy Boss Ring", ring.hours, ring.notes(), **ring.shape())
 
 # Tile 16: 3x Glacial Temotli (from Amoxliatl)
-p = 1/100; kph = 71
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(16, "Obtain 3x Glacial Temotli", med/kph, f"1/100 from Amoxliatl, {kph} kph, median {med} kc", confidence="high")
+p = 1/100; kph = ehb.kill_rate("Amoxliatl", 71)
+med = median_kills_nbinom(3, p)
+add_tile(16, "Obtain 3x Glacial Temotli", med/kph, f"1/100 from Amoxliatl, {kph} kph, median {med} kc", confidence="high", drops=3, rate=p, kph=kph)
 
 # Tile 17: 1x Warped Sceptre (from Warped Terrorbirds)
 p = 1/320; kph = 120
-med = int(ceil(nbinom.ppf(0.5, 1, p)))
-add_tile(17, "Obtain 1x Warped Sceptre", med/kph, f"1/320 from terrorbirds, {kph} kph, median {med} kc", confidence="high")
+med = median_kills_nbinom(1, p)
+add_tile(17, "Obtain 1x Warped Sceptre", med/kph, f"1/320 from terrorbirds, {kph} kph, median {med} kc", confidence="high", drops=1, rate=p, kph=kph)
 
 # Tile 18: 1x Sulphur Blades (from Sulphur Naguas)
 p = 1/450; kph = 290 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_sulphur_naguas
-med = int(ceil(nbinom.ppf(0.5, 1, p)))
-add_tile(18, "Obtain 1x Sulphur Blades", med/kph, f"1/450 from sulphur naguas, {kph} kph, median {med} kc")
+med = median_kills_nbinom(1, p)
+add_tile(18, "Obtain 1x Sulphur Blades", med/kph, f"1/450 from sulphur naguas, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 19: Movement
 add_movement(19, "Go back to Tile #14", 14)
 
 # Tile 20: 1x Sarachnis Cudgel (1/384 from Sarachnis, ~40 kph)
-p = 1/384; kph = 67
+p = 1/384; kph = ehb.kill_rate("sarachnis", 67)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(20, "Obtain 1x Sarachnis Cudgel", med/kph, f"1/384 from Sarachnis, {kph} kph, median {med} kc")
+add_tile(20, "Obtain 1x Sarachnis Cudgel", med/kph, f"1/384 from Sarachnis, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 21: 3x Giant Key (from Obor)
-p = 1/16; kph = 120
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(21, "Obtain 3x Giant Key", med/kph, f"1/16 from Obor, burning claw spec+desert ammy/house+giantsoul, ~{kph} kph, median {med} kc")
+p = 1/16; kph = ehb.kill_rate("Obor", 120)
+med = median_kills_nbinom(3, p)
+add_tile(21, "Obtain 3x Giant Key", med/kph, f"1/16 from Obor, burning claw spec+desert ammy/house+giantsoul, ~{kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 22: 5x Steel Ring (Deranged Arch)
 p = 1/44; kph = 95
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(22, "Obtain 5x Steel Ring", med/kph, f"1/44 from Deranged arch, ~{kph} kph, median {med} kc")
+med = median_kills_nbinom(5, p)
+add_tile(22, "Obtain 5x Steel Ring", med/kph, f"1/44 from Deranged arch, ~{kph} kph, median {med} kc", drops=5, rate=p, kph=kph)
 
 # Tile 23: 3x Alchemist's Signet (from elder custodian stalkers)
 p = 1/62; kph = ELDER_CUSTODIANS_PER_HOUR
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(23, "Obtain 3x Alchemist's Signet", med/kph, f"1/62 from elder custodian stalkers, ~{kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(23, "Obtain 3x Alchemist's Signet", med/kph, f"1/62 from elder custodian stalkers, ~{kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 24: 5x Giantsoul Amulet (from Giant bosses area?)
-p = 1/32; kph = 55 # 1/16 drop rate, 50% contribution from duo https://oldschool.runescape.wiki/w/Royal_Titans#Rewards
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(24, "Obtain 5x Giantsoul Amulet", med/kph, f"1/32 from equal contribution royal titans, ~{kph} kph, median {med} kc")
+p = 1/32; kph = ehb.kill_rate("The Royal Titans", 55) # 1/16 drop rate, 50% contribution from duo https://oldschool.runescape.wiki/w/Royal_Titans#Rewards
+med = median_kills_nbinom(5, p)
+add_tile(24, "Obtain 5x Giantsoul Amulet", med/kph, f"1/32 from equal contribution royal titans, ~{kph} kph, median {med} kc", drops=5, rate=p, kph=kph)
 
 # Tile 25: 1x Raid unique
-add_tile(25, "Obtain 1x Raid Drop (any raid)", RAID_1X_HOURS, "Best via CoX/ToB/ToA team")
+add_tile(25, "Obtain 1x Raid Drop (any raid)", RAID_1X_HOURS, "Best via CoX/ToB/ToA team", **RAID_POOL.shape(1))
 
 # Tile 26: Movement + SIT
 add_movement(26, "Advance to Tile #40 (SIT)", 40)
@@ -399,77 +1051,77 @@ add_movement(27, "Advance to Tile #37", 37)
 add_tile(28, "Obtain 1x Beginner Clue Unique", 0.5, "~15 beginner clues/hr, decent unique chance", confidence="medium")
 
 # Tile 29: 1x Slayer Boss Drop
-add_tile(29, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, "Best via Alchemical Hydra (~1/46 combined unique, 28 kph)", confidence="medium")
+add_tile(29, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, "Best via Alchemical Hydra (~1/46 combined unique, 28 kph)", confidence="medium", **SLAYER_POOL.shape(1))
 
 # Tile 30: 1x Rev Unique (unique or ancient statuette table)
 # Rev orks skulled off-task
 p = 1/1000; kph = 110 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_revenants_(Magic_shortbow)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(30, "Obtain 1x Rev Unique", med/kph, f"Revs ~1/1000 unique from orks, {kph} kph")
+add_tile(30, "Obtain 1x Rev Unique", med/kph, f"Revs ~1/1000 unique from orks, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 31: Tempoross (same as tile 2)
 add_tile(31, "Obtain Tempoross items", TEMPOROSS_HOURS, "Same as tile 2 - 100 soaked pages fastest")
 
 # Tile 32: 3x Black Mask (1/512 from Cave Horrors, ~200 kph)
 p = 1/512; kph = 200
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(32, "Obtain 3x Black Mask", med/kph, f"1/512 from Cave Horrors, {kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(32, "Obtain 3x Black Mask", med/kph, f"1/512 from Cave Horrors, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 33: 1x Raid unique
-add_tile(33, "Obtain 1x Raid Drop", RAID_1X_HOURS, "Best via CoX/ToB/ToA team")
+add_tile(33, "Obtain 1x Raid Drop", RAID_1X_HOURS, "Best via CoX/ToB/ToA team", **RAID_POOL.shape(1))
 
 # Tile 34: 1x Odium Shard (any) - from Crazy Archaeologist, Chaos Fanatic, or Scorpia
 # Crazy Archaeologist: 1/256, ~60 kph
-p = 1/256; kph = 60
+p = 1/256; kph = ehb.kill_rate("Crazy Archaeologist", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(34, "Obtain 1x Odium Shard", med/kph, f"1/256 from Crazy Archaeologist, {kph} kph, median {med} kc")
+add_tile(34, "Obtain 1x Odium Shard", med/kph, f"1/256 from Crazy Archaeologist, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 35: 1x Egg Sack (from grubby chest)
 p = 1/25; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(35, "Obtain 1x orange/blue Egg Sack", med/kph, f"From grubby chest ~1/20, {kph} kph, median {med} kc", confidence="medium")
+add_tile(35, "Obtain 1x orange/blue Egg Sack", med/kph, f"From grubby chest ~1/20, {kph} kph, median {med} kc", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 36: 1x Crystal Armour Seed
-add_tile(36, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, "From CG 1/50, ~6/hr")
+add_tile(36, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, "From CG 1/50, ~6/hr", **CG_CRYSTAL.shape(1))
 
 # Tile 37: 1x Zombie Axe (from armoured zomebies)
 p = 1/800; kph = 400
 med = ceil(log(0.5) / log(1 - p))
-add_tile(37, "Obtain 1x Zombie Axe", med/kph, f"From armoured zombies, {kph} kph, median {med} kc")
+add_tile(37, "Obtain 1x Zombie Axe", med/kph, f"From armoured zombies, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 38: 5x Fresh Crab Shell (from crabs somewhere, similar to claw)
 p = 1/8; kph = 150
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(38, "Obtain 5x Fresh Crab Shell", med/kph, f"1/8 from level 23 crabclaw isle crabs, {kph} kph, median {med} kc", confidence="high")
+med = median_kills_nbinom(5, p)
+add_tile(38, "Obtain 5x Fresh Crab Shell", med/kph, f"1/8 from level 23 crabclaw isle crabs, {kph} kph, median {med} kc", confidence="high", drops=5, rate=p, kph=kph)
 
 # Tile 39: 1x Hill Giant Club (from Obor, 1/118)
 # KPH = time to get new keys from obor with spec/tele tech
 p = 1/118; kph = 12
-med = int(ceil(nbinom.ppf(0.5, 1, p)))
-add_tile(39, "Obtain 1x Hill Giant Club", med/kph, f"1/118 from Obor, {kph} kph, median {med} kc")
+med = median_kills_nbinom(1, p)
+add_tile(39, "Obtain 1x Hill Giant Club", med/kph, f"1/118 from Obor, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 40: Movement (SIT, go back to 38)
 add_movement(40, "Go back to Tile #38 (SIT)", 38)
 
 # Tile 41: 1x Slayer Boss
-add_tile(41, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, "Hydra")
+add_tile(41, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, "Hydra", **SLAYER_POOL.shape(1))
 
 # Tile 42: 1x Elder Chaos Druid Robes piece (from Elder Chaos Druids, 1/1419 each piece, 3 pieces)
 p = 3/1419; kph = 200
 med = ceil(log(0.5) / log(1 - p))
-add_tile(42, "Obtain 1x Elder Chaos Druid Robe piece", med/kph, f"3/1419 combined, {kph} kph, median {med} kc")
+add_tile(42, "Obtain 1x Elder Chaos Druid Robe piece", med/kph, f"3/1419 combined, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 43: 3x Moons of Peril Unique
-add_tile(43, "Obtain 3x Moons of Peril Unique", moons_hours(3), f"~1/19 combined unique, {moons_kph} kph", confidence="high")
+add_tile(43, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), f"~1/19 combined unique, {MOONS.kph} kph", confidence="high", **MOONS.shape(3))
 
 # Tile 44: 1x Raid Drop
-add_tile(44, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(44, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 45: 1x Fedora (from Crazy Archaeologist)
 # Fedora: 1/128 from Crazy Archaeologist, ~60 kph
-p = 1/128; kph = 60
+p = 1/128; kph = ehb.kill_rate("Crazy Archaeologist", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(45, "Obtain 1x Fedora", med/kph, f"1/128 from Crazy Archaeologist, {kph} kph")
+add_tile(45, "Obtain 1x Fedora", med/kph, f"1/128 from Crazy Archaeologist, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 46: Free
 add_free(46, "Free Tile - Roll Again")
@@ -479,17 +1131,17 @@ add_free(46, "Free Tile - Roll Again")
 # ~30 kph at any GWD boss
 p = 3/512; kph = 30
 med = ceil(log(0.5) / log(1 - p))
-add_tile(47, "Obtain 1x Godsword Shard", med/kph, f"3/512 for any shard, {kph} kph at GWD")
+add_tile(47, "Obtain 1x Godsword Shard", med/kph, f"3/512 for any shard, {kph} kph at GWD", drops=1, rate=p, kph=kph)
 
 # Tile 48: 1x Ice or Fire Elemental Staff Crown
 p = 2/150; kph = 55
 med = ceil(log(0.5) / log(1 - p))
-add_tile(48, "Obtain 1x Elemental Staff Crown", med/kph, f"2/150 for either from equal contribution royal titans, ~{kph} kph, median {med} kc")
+add_tile(48, "Obtain 1x Elemental Staff Crown", med/kph, f"2/150 for either from equal contribution royal titans, ~{kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 49: 3x Right Skull Half (S.S. minotaurs)
 p = 1/33; kph = 180
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(49, "Obtain 3x Right Skull Half", med/kph, f"1/33 from S.S. minotaurs, ~{kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(49, "Obtain 3x Right Skull Half", med/kph, f"1/33 from S.S. minotaurs, ~{kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 50: Movement
 add_movement(50, "Advance to Tile #62", 62)
@@ -498,18 +1150,18 @@ add_movement(50, "Advance to Tile #62", 62)
 # Blowpipe blood reavers
 p = 1/640; kph = 120
 med = ceil(log(0.5) / log(1 - p))
-add_tile(51, "Obtain 1x Ancient Ceremonial piece", med/kph, f"1/640 from blood reavers outside nex bank, {kph} kph, median {med} kc", confidence="medium")
+add_tile(51, "Obtain 1x Ancient Ceremonial piece", med/kph, f"1/640 from blood reavers outside nex bank, {kph} kph, median {med} kc", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 52: 3x Amulet of the Damned (from Shade catacombs chests)
 p = 1/15; kph = 60
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(52, "Obtain 3x Amulet of the Damned", med/kph, f"1/15 from shades silver/red chests chests, {kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(52, "Obtain 3x Amulet of the Damned", med/kph, f"1/15 from shades silver/red chests chests, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 53: 1x Pharaoh's Sceptre (from Pyramid Plunder)
 # 1/75 chance per run at 91+ thieving https://oldschool.runescape.wiki/w/Pharaoh%27s_sceptre#Obtaining
 p = 1/75; kph = 8
 med = ceil(log(0.5) / log(1 - p))
-add_tile(53, "Obtain 1x Pharaoh's Sceptre", med/kph, "~1/75 effective per 91 thieving PP run, 8 runs/hr")
+add_tile(53, "Obtain 1x Pharaoh's Sceptre", med/kph, "~1/75 effective per 91 thieving PP run, 8 runs/hr", drops=1, rate=p, kph=kph)
 
 # Tile 54: Movement
 add_movement(54, "Go back to Tile #43", 43)
@@ -521,45 +1173,45 @@ add_tile(55, "Obtain 30 Molch Pearls", 30/8, "~8 pearls/hr from Aerial Fishing",
 # Tile 56: 2x Green/Red/Blue Abyssal Dye
 # From GOTR? Or from Abyssal creatures?
 p = 3/1200; kph = 30 # 30 reward pulls per hour
-med = int(ceil(nbinom.ppf(0.5, 2, p)))
-add_tile(56, "Obtain 2x Abyssal Dye", med/kph, "30 pulls per hour, 1/1200 drop for each dye, 3/1200 for any, {kph} permits/hour, median {med} permits", confidence="medium")
+med = median_kills_nbinom(2, p)
+add_tile(56, "Obtain 2x Abyssal Dye", med/kph, "30 pulls per hour, 1/1200 drop for each dye, 3/1200 for any, {kph} permits/hour, median {med} permits", confidence="medium", drops=2, rate=p, kph=kph)
 
 # Tile 57: 1x Raid Drop
-add_tile(57, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(57, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 58: 1x Brine Sabre (from Brine Rat, 1/512, ~100 kph)
 p = 1/512; kph = 100
 med = ceil(log(0.5) / log(1 - p))
-add_tile(58, "Obtain 1x Brine Sabre", med/kph, f"1/512 from Brine Rats, {kph} kph, median {med} kc")
+add_tile(58, "Obtain 1x Brine Sabre", med/kph, f"1/512 from Brine Rats, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 59: 1x Hueycoatl Unique
-add_tile(59, "Obtain 1x Hueycoatl Unique", huey_hours(1), "Includes hides ~1/70 20 kph trio", confidence="medium")
+add_tile(59, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), "Includes hides ~1/70 20 kph trio", confidence="medium", **HUEY.shape(1))
 
 # Tile 60: 1x GWD Drop
-add_tile(60, "Obtain 1x GWD Drop", GWD_1X_HOURS, f"~1/103 combined at Zilyana, {gwd_kph} kph")
+add_tile(60, "Obtain 1x GWD Drop", GWD_1X_HOURS, f"~1/103 combined at Zilyana, {GWD.kph} kph", **GWD.shape(1))
 
 # Tile 61: 1x Slayer Boss
-add_tile(61, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(61, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 62: 3x DK Ring
-add_tile(62, "Obtain 3x DK Ring", DK_3X_HOURS)
+add_tile(62, "Obtain 3x DK Ring", DK_3X_HOURS, **DK.shape(3))
 
 # Tile 63: 4x Barrows
-add_tile(63, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS)
+add_tile(63, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS, **BARROWS.shape(4))
 
 # Tile 64: 1x Slayer Boss
-add_tile(64, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(64, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 65: 1x Crystal Armour Seed
-add_tile(65, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS)
+add_tile(65, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, **CG_CRYSTAL.shape(1))
 
 # Tile 66: 1x Raid Drop
-add_tile(66, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(66, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 67: 3x Venator Shard (muspah)
-p = 1/100; kph = 25
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(67, "Obtain 3x Venator Shard", med/kph, f"1/100 from muspah, {kph} kph, median {med} kc")
+p = 1/100; kph = ehb.kill_rate("Phantom Muspah", 25)
+med = median_kills_nbinom(3, p)
+add_tile(67, "Obtain 3x Venator Shard", med/kph, f"1/100 from muspah, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 68: Movement
 add_movement(68, "Advance to Tile #76", 76)
@@ -568,54 +1220,54 @@ add_movement(68, "Advance to Tile #76", 76)
 add_tile(69, "Obtain 3x Ecumenical Key", ECUMENICAL_3X_HOURS, "1/40, wildy GWD, kill imps/goblins")
 
 # Tile 70: 1x Dragon Pickaxe (from KBD, Chaos Ele, Venenatis, Vet'ion, Callisto, or KQ)
-p = 1/256; kph = 48
+p = 1/256; kph = ehb.kill_rate("Chaos Elemental", 48)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(70, "Obtain 1x Dragon Pickaxe", med/kph, f"1/256 from chaos ele, {kph} kph, median {med} kc")
+add_tile(70, "Obtain 1x Dragon Pickaxe", med/kph, f"1/256 from chaos ele, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 71: 1x Zenyte Shard (from Demonic Gorillas, 1/300, ~60 kph)
 p = 1/300; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(71, "Obtain 1x Zenyte Shard", med/kph, f"1/300 from Demonic Gorillas, {kph} kph, median {med} kc")
+add_tile(71, "Obtain 1x Zenyte Shard", med/kph, f"1/300 from Demonic Gorillas, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 72: 1x Champion Scroll
 add_tile(72, "Obtain 1x Champion Scroll", CHAMPION_SCROLL_HOURS, "1/5000, cannoning goblins ~500/hr")
 
 # Tile 73: 1x Slayer Boss
-add_tile(73, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(73, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 74: 5x Flippers (from Mogres, 1/64)
 p = 1/64; kph = 40
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(74, "Obtain 5x Flippers", med/kph, f"1/64 from Mogres, {kph} kph, median {med} kc")
+med = median_kills_nbinom(5, p)
+add_tile(74, "Obtain 5x Flippers", med/kph, f"1/64 from Mogres, {kph} kph, median {med} kc", drops=5, rate=p, kph=kph)
 
 # Tile 75: 1x Teleport Anchoring Scroll (Zombie chest)
 p = 1/275; kph = 200
 med = ceil(log(0.5) / log(1 - p))
-add_tile(75, "Obtain 1x Teleport Anchoring Scroll", med / kph, "Looting the zombie pirate's locker, 1/275, 200 kph")
+add_tile(75, "Obtain 1x Teleport Anchoring Scroll", med / kph, "Looting the zombie pirate's locker, 1/275, 200 kph", drops=1, rate=p, kph=kph)
 
 # Tile 76: 1x Hueycoatl Unique
-add_tile(76, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(76, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 77: 1x Raid Drop
-add_tile(77, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(77, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 78: 3x Barrows
-add_tile(78, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS)
+add_tile(78, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS, **BARROWS.shape(3))
 
 # Tile 79: 1x TzHaar weapon/armour
 p = 1/300; kph = 300
 med = ceil(log(0.5) / log(1 - p))
-add_tile(79, "Obtain 1x TzHaar Weapon/Armour", med/kph, f"~1/300 combined obsidian, {kph} kph barraging", confidence="medium")
+add_tile(79, "Obtain 1x TzHaar Weapon/Armour", med/kph, f"~1/300 combined obsidian, {kph} kph barraging", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 80: 1x Shark Paint (1/36 upon completing a port task)
 p = 1/36; kph = 20
 med = ceil(log(0.5) / log(1 - p))
-add_tile(80, "Obtain 1x Shark Paint", med/kph, "1/36 from port tasks, assuming a very slow 20 per hour")
+add_tile(80, "Obtain 1x Shark Paint", med/kph, "1/36 from port tasks, assuming a very slow 20 per hour", drops=1, rate=p, kph=kph)
 
 # Tile 81: 1x Cache of Runes
 p = 3/27; kph = 3
 med = ceil(log(0.5) / log(1 - p))
-add_tile(81, "Obtain 1x Cache of Runes", med/kph, "3/27 from ToA chest, assuming 20 minute 150's")
+add_tile(81, "Obtain 1x Cache of Runes", med/kph, "3/27 from ToA chest, assuming 20 minute 150's", drops=1, rate=p, kph=kph)
 
 # Tile 82: 1x Tertiary Drop from Zalcano
 # Zalcano tertiary: Crystal tool seed (1/200) split 3 ways in a trio, 1/600
@@ -623,15 +1275,15 @@ add_tile(81, "Obtain 1x Cache of Runes", med/kph, "3/27 from ToA chest, assuming
 # Zalcano shard (~1/1000).
 # ~1/540 in a trio
 # ~30 kph
-p = 1/540; kph = 30
+p = 1/540; kph = ehb.kill_rate("Zalcano", 30)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(82, "Obtain 1x Zalcano Tertiary", med/kph, f"Combined ~1/540 in an efficient trio, {kph} kph, median {med} kc")
+add_tile(82, "Obtain 1x Zalcano Tertiary", med/kph, f"Combined ~1/540 in an efficient trio, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 83: 1x DT2 Boss unique + secondary
-add_tile(83, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, "Vardorvis best with chromium ingot 1/150")
+add_tile(83, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes("Chromium ingot 1/150 is most of the rate"), **DT2_1X.shape())
 
 # Tile 84: 1x Slayer Boss
-add_tile(84, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(84, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 85: Movement
 add_movement(85, "Advance to Tile #92", 92)
@@ -639,30 +1291,30 @@ add_movement(85, "Advance to Tile #92", 92)
 # Tile 86: 1x Any Big Fish (1/1000 for bass)
 p = 1/1000; kph = 120
 med = ceil(log(0.5) / log(1 - p))
-add_tile(86, "Obtain 1x Any Big Fish", med/kph, f"Fishing bass at 99, {kph} per hour, {med} fish median", confidence="medium")
+add_tile(86, "Obtain 1x Any Big Fish", med/kph, f"Fishing bass at 99, {kph} per hour, {med} fish median", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 87: 1x Rev Unique
 p = 1/1000; kph = 110 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_revenants_(Magic_shortbow)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(87, "Obtain 1x Rev Unique", med/kph, f"Same as tile 30, Revs ~1/1000 unique from orks, {kph} kph")
+add_tile(87, "Obtain 1x Rev Unique", med/kph, f"Same as tile 30, Revs ~1/1000 unique from orks, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 88: 3x Barrows
-add_tile(88, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS)
+add_tile(88, "Obtain 3x Barrows Unique", BARROWS_3X_HOURS, **BARROWS.shape(3))
 
 # Tile 89: 1x Raid Drop
-add_tile(89, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(89, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 90: 1x Crystal or Enhanced Crystal Weapon Seed (NO LMS)
 # Crystal weapon seed: 1/50 from CG (same as armour seed)
 # Enhanced crystal weapon seed: 1/400 from CG
 # Combined: 1/50 + 1/400 = 9/400 = 1/44.4
 # 6 CG/hr
-p = 9/400; kph = 6
+p = 9/400; kph = ehb.kill_rate("The Corrupted Gauntlet", 6)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(90, "Obtain 1x Crystal/Enhanced Weapon Seed", med/kph, f"Combined ~1/44 from CG, 6 kph")
+add_tile(90, "Obtain 1x Crystal/Enhanced Weapon Seed", med/kph, f"Combined ~1/44 from CG, 6 kph", drops=1, rate=p, kph=kph)
 
 # Tile 91: 1x Hueycoatl Unique
-add_tile(91, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(91, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 92: Wintertodt
 add_tile(92, "Obtain Wintertodt items", WINTERTODT_HOURS, "100 burnt pages fastest")
@@ -671,23 +1323,23 @@ add_tile(92, "Obtain Wintertodt items", WINTERTODT_HOURS, "100 burnt pages faste
 add_tile(93, "Obtain 3x Whip or 1x Unsired", WHIP_OR_UNSIRED_3X_HOURS, "1x Unsired from Sire fastest (~1/100, 28 kph)")
 
 # Tile 94: 3x Moons of Peril
-add_tile(94, "Obtain 3x Moons of Peril Unique", moons_hours(3))
+add_tile(94, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), **MOONS.shape(3))
 
 # Tile 95: 1x Frozen Cache (muspah)
-p = 1/72; kph = 25
+p = 1/72; kph = ehb.kill_rate("Phantom Muspah", 25)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(95, "Obtain 1x Frozen Cache", med/kph, f"From muspah, {kph} kph, {med} median kc")
+add_tile(95, "Obtain 1x Frozen Cache", med/kph, f"From muspah, {kph} kph, {med} median kc", drops=1, rate=p, kph=kph)
 
 # Tile 96: 1x Slayer Boss
-add_tile(96, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(96, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 97: 1x Raid Drop
-add_tile(97, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(97, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 98: 1x Elder Chaos Druid Robe piece
 p = 3/1419; kph = 200
 med = ceil(log(0.5) / log(1 - p))
-add_tile(98, "Obtain 1x Elder Chaos Druid Robe piece", med/kph, f"Same as tile 42, 3/1419 combined, {kph} kph, median {med} kc")
+add_tile(98, "Obtain 1x Elder Chaos Druid Robe piece", med/kph, f"Same as tile 42, 3/1419 combined, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 99: Movement
 add_movement(99, "Go back to Tile #94", 94)
@@ -695,118 +1347,118 @@ add_movement(99, "Go back to Tile #94", 94)
 # Tile 100: 1x Zombie Helmet (from Armoured Zombies)
 p = 1/600; kph = 400
 med = ceil(log(0.5) / log(1 - p))
-add_tile(100, "Obtain 1x Broken Zombie helmet", med/kph, f"From Zemouregal's fort armoured zombies, {kph} kph, median {med} kc")
+add_tile(100, "Obtain 1x Broken Zombie helmet", med/kph, f"From Zemouregal's fort armoured zombies, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 101: 3x Easy Clue Uniques
 p = 247/1080; kph = 10 # https://oldschool.runescape.wiki/w/Reward_casket_(easy)
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(101, "Obtain 3x Easy Clue Uniques", med/kph, f"10 easy clues/hr, 247/1080 chance for a unique from each")
+med = median_kills_nbinom(3, p)
+add_tile(101, "Obtain 3x Easy Clue Uniques", med/kph, f"10 easy clues/hr, 247/1080 chance for a unique from each", drops=3, rate=p, kph=kph)
 
 # Tile 102: 1x Slayer Boss
-add_tile(102, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(102, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 103: 1x Doom of Mokhaiotl Unique
-add_tile(103, "Obtain 1x Doom Unique", doom_hours(1), "~1/50 for any unique by wave 8, 6 kph")
+add_tile(103, "Obtain 1x Doom Unique", DOOM.hours(1), "~1/50 for any unique by wave 8, 6 kph", **DOOM.shape(1))
 
 # Tile 104: 3x Moons of Peril
-add_tile(104, "Obtain 3x Moons of Peril Unique", moons_hours(3))
+add_tile(104, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), **MOONS.shape(3))
 
 # Tile 105: Amoxliatl Speed-Trialist (sub 1 min kill)
 add_tile(105, "Complete Amoxliatl Speed-Trialist", 0.1, "Marked 'Practically Free' - just need sub-1min kill", confidence="high")
 
 # Tile 106: 3x DK Ring
-add_tile(106, "Obtain 3x DK Ring", DK_3X_HOURS)
+add_tile(106, "Obtain 3x DK Ring", DK_3X_HOURS, **DK.shape(3))
 
 # Tile 107: 1x Colored Egg Sack (from grubby chest)
 p = 1/25; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(107, "Obtain 1x orange/blue Egg Sack", med/kph, f"Same as tile 35, from grubby chest ~1/20, {kph} kph, median {med} kc")
+add_tile(107, "Obtain 1x orange/blue Egg Sack", med/kph, f"Same as tile 35, from grubby chest ~1/20, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 108: 1x Gnome Restaurant unique (Gnome Scarf/Goggles/Mint Cake)
 # https://oldschool.runescape.wiki/w/Money_making_guide/Delivering_food_in_Gnome_Restaurant
 add_tile(108, "Obtain 1x Gnome Restaurant unique", 2.0, "0.6 each of scarf/goggles/mint cakes expected in 1 hour of delivery, https://oldschool.runescape.wiki/w/Money_making_guide/Delivering_food_in_Gnome_Restaurant")
 
 # Tile 109: 1x Slayer Boss
-add_tile(109, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(109, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 110: Movement
 add_movement(110, "Advance to Tile #114", 114)
 
 # Tile 111: 1x Crystal Armour Seed
-add_tile(111, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS)
+add_tile(111, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, **CG_CRYSTAL.shape(1))
 
 # Tile 112: 1x Zombie Axe
 p = 1/800; kph = 400
 med = ceil(log(0.5) / log(1 - p))
-add_tile(112, "Obtain 1x Zombie Axe", med/kph, f"Same as tile 37, from armoured zombies, {kph} kph, median {med} kc")
+add_tile(112, "Obtain 1x Zombie Axe", med/kph, f"Same as tile 37, from armoured zombies, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 113: 4x Barrows
-add_tile(113, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS)
+add_tile(113, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS, **BARROWS.shape(4))
 
 # Tile 114: 1x Raid Drop
-add_tile(114, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(114, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 115: 1x Crawling Hand (from Crawling Hands)
 p = 1/500; kph = 300
 med = ceil(log(0.5) / log(1 - p))
-add_tile(115, "Obtain 1x Crawling Hand", med/kph, f"1/300 From Crawling Hand monsters, {kph} kph, {med} kc")
+add_tile(115, "Obtain 1x Crawling Hand", med/kph, f"1/300 From Crawling Hand monsters, {kph} kph, {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 116: Free
 add_free(116, "Free Tile - Roll Again")
 
 # Tile 117: 1x Zulrah Unique
-add_tile(117, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS, "~1/155 combined with mutagens, 35 kph")
+add_tile(117, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS, "~1/155 combined with mutagens, 35 kph", **ZULRAH.shape(1))
 
 # Tile 118: 2x Antler Guard
 p = 1/650; kph = ELDER_CUSTODIANS_PER_HOUR
-med = int(ceil(nbinom.ppf(0.5, 2, p)))
-add_tile(118, "Obtain 2x Antler Guard", med/kph, f"Similar to tile 12, cannoning Elder custodian stalkers, ~{kph} per hour, median {med} kc", confidence="high")
+med = median_kills_nbinom(2, p)
+add_tile(118, "Obtain 2x Antler Guard", med/kph, f"Similar to tile 12, cannoning Elder custodian stalkers, ~{kph} per hour, median {med} kc", confidence="high", drops=2, rate=p, kph=kph)
 
 # Tile 119: 1x Slayer Boss
-add_tile(119, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(119, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 120: 1x Hueycoatl
-add_tile(120, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(120, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 121: 4x Barrows
-add_tile(121, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS)
+add_tile(121, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS, **BARROWS.shape(4))
 
 # Tile 122: 1x Chewed Bones (from Mithril Dragons, 1/42)
 p = 3/128; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(122, "Obtain 1x Chewed Bones", med/kph, f"3/128 from Mithril Dragons, {kph} kph, median {med} kc")
+add_tile(122, "Obtain 1x Chewed Bones", med/kph, f"3/128 from Mithril Dragons, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 123: Free (+1 Skip)
 add_free(123, "Gain +1 SKIP - Roll Again")
 
 # Tile 124: 1x Forgotten Lockbox (Yama)
-p = 1/33; kph = 8 # solo
+p = 1/33; kph = ehb.kill_rate("Yama", 8) # solo
 med = ceil(log(0.5) / log(1 - p))
-add_tile(124, "Obtain 1x Forgotten Lockbox", med/kph, f"1/33 from solo yama, {kph} kph, median {med} kc, duo rate should be similar")
+add_tile(124, "Obtain 1x Forgotten Lockbox", med/kph, f"1/33 from solo yama, {kph} kph, median {med} kc, duo rate should be similar", drops=1, rate=p, kph=kph)
 
 # Tile 125: 1x Raid Drop
-add_tile(125, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(125, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 126: 3x Moons of Peril
-add_tile(126, "Obtain 3x Moons of Peril Unique", moons_hours(3))
+add_tile(126, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), **MOONS.shape(3))
 
 # Tile 127: 1x Slayer Boss
-add_tile(127, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(127, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 128: 1x Skull of Vet'ion/Claws of Callisto/Fang of Venenatis
-p = 1/618; kph = 50
+p = 1/618; kph = ehb.kill_rate("Artio", 50)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(128, "Obtain 1x Wildy Boss Weapon upgrade", med/kph, f"1/618 from artio, {kph} kph")
+add_tile(128, "Obtain 1x Wildy Boss Weapon upgrade", med/kph, f"1/618 from artio, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 129: 1x Earthbound Tecpatl (newer content)
 p = 1/400; kph = 200
 med = ceil(log(0.5) / log(1 - p))
-add_tile(129, "Obtain 1x Earthbound Tecpatl", 2.0, "1/400 from earthen nagua, 200 kph?", confidence="medium")
+add_tile(129, "Obtain 1x Earthbound Tecpatl", 2.0, "1/400 from earthen nagua, 200 kph?", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 130: 3x Dragon Boots (from Spiritual Mages, 1/128)
 p = 1/128; kph = 180  # blowpiping nex spiritual mages
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(130, "Obtain 3x Dragon Boots", med/kph, f"1/128 from Nex Spiritual Mages, {kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(130, "Obtain 3x Dragon Boots", med/kph, f"1/128 from Nex Spiritual Mages, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 131: Movement
 add_movement(131, "Go back to Tile #126", 126)
@@ -815,10 +1467,10 @@ add_movement(131, "Go back to Tile #126", 126)
 add_movement(132, "Advance to Tile #140", 140)
 
 # Tile 133: 1x Doom Unique
-add_tile(133, "Obtain 1x Doom Unique", doom_hours(1))
+add_tile(133, "Obtain 1x Doom Unique", DOOM.hours(1), **DOOM.shape(1))
 
 # Tile 134: 1x Slayer Boss
-add_tile(134, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(134, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 135: Movement
 add_movement(135, "Go back to Tile #121", 121)
@@ -826,15 +1478,15 @@ add_movement(135, "Go back to Tile #121", 121)
 # Tile 136: 1x Medium clue boots (Ranger/Climbing(g)/Holy Sandals/Spiked Manacles/Wizard)
 p = 5/283.6; kph = 10 # 10 clues/hour from eclectics
 med = ceil(log(0.5) / log(1 - p))
-add_tile(136, "Obtain 1x Med Clue Boots", med/kph, f"5/283.6 combined from med caskets, {kph} clues/hr, median {med} caskets")
+add_tile(136, "Obtain 1x Med Clue Boots", med/kph, f"5/283.6 combined from med caskets, {kph} clues/hr, median {med} caskets", drops=1, rate=p, kph=kph)
 
 # Tile 137: 1x Raid Drop
-add_tile(137, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(137, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 138: 1x Granite Maul (from Gargoyles, 1/256, ~200 kph)
 p = 1/256; kph = 200
 med = ceil(log(0.5) / log(1 - p))
-add_tile(138, "Obtain 1x Granite Maul", med/kph, f"1/256 from Gargoyles, {kph} kph, median {med} kc")
+add_tile(138, "Obtain 1x Granite Maul", med/kph, f"1/256 from Gargoyles, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 139: 3x Ecumenical Key
 add_tile(139, "Obtain 3x Ecumenical Key", ECUMENICAL_3X_HOURS)
@@ -843,25 +1495,25 @@ add_tile(139, "Obtain 3x Ecumenical Key", ECUMENICAL_3X_HOURS)
 add_tile(140, "Obtain Tempoross items", TEMPOROSS_HOURS)
 
 # Tile 141: 2x Slayer Boss
-add_tile(141, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(141, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 142: 1x Raid Drop
-add_tile(142, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(142, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 143: 1x GWD Drop
-add_tile(143, "Obtain 1x GWD Drop", GWD_1X_HOURS)
+add_tile(143, "Obtain 1x GWD Drop", GWD_1X_HOURS, **GWD.shape(1))
 
 # Tile 144: 5x Medium Clue Uniques
 # ~10 med clues/hr, ~3/10 for a unique from each casket
 p = 3/10; kph = 8
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(144, "Obtain 5x Medium Clue Uniques", med/kph, f"~3/10 any unique per casket, {kph} clues/hr", confidence="medium")
+med = median_kills_nbinom(5, p)
+add_tile(144, "Obtain 5x Medium Clue Uniques", med/kph, f"~3/10 any unique per casket, {kph} clues/hr", confidence="medium", drops=5, rate=p, kph=kph)
 
 # Tile 145: Movement
 add_movement(145, "Advance to Tile #160", 160)
 
 # Tile 146: 2x Slayer Boss
-add_tile(146, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(146, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 147: 1x Vorkath Unique
 add_tile(147, "Obtain 1x Vorkath Unique", VORKATH_UNIQUE_HOURS, "Head at 1/50 makes this fast, 25 kph")
@@ -870,53 +1522,53 @@ add_tile(147, "Obtain 1x Vorkath Unique", VORKATH_UNIQUE_HOURS, "Head at 1/50 ma
 add_free(148, "Free Tile - Roll Again")
 
 # Tile 149: 1x Raid
-add_tile(149, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(149, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 150: 1x Dragon 2h Sword (from Chaos Elemental/KBD? Actually from Chaos Elemental 1/128, or rare drop table)
 # Dragon 2h sword is an RDT item or from specific bosses
 # Chaos Elemental: 1/128, ~48 kph
-p = 1/64; kph = 48
+p = 1/64; kph = ehb.kill_rate("Chaos Elemental", 48)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(150, "Obtain 1x Dragon 2h Sword", med/kph, f"1/128 from Chaos Elemental, {kph} kph")
+add_tile(150, "Obtain 1x Dragon 2h Sword", med/kph, f"1/128 from Chaos Elemental, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 151: 1x Enhanced Crystal Teleport Seed (thieving)
 add_tile(151, "Obtain 1x Enhanced Crystal Teleport Seed", 2.0, "~1 per hour with thieving outfit, so 2 hours pickpocketing to see a drop https://oldschool.runescape.wiki/w/Money_making_guide/Pickpocketing_elves")
 
 # Tile 152: 1x Zulrah Unique
-add_tile(152, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS)
+add_tile(152, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS, **ZULRAH.shape(1))
 
 # Tile 153: 1x DT2 Boss Drop
-add_tile(153, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(153, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 154: 2x Slayer Boss
-add_tile(154, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(154, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 155: 1x GWD Drop
-add_tile(155, "Obtain 1x GWD Drop", GWD_1X_HOURS)
+add_tile(155, "Obtain 1x GWD Drop", GWD_1X_HOURS, **GWD.shape(1))
 
 # Tile 156: 4x Barrows
-add_tile(156, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS)
+add_tile(156, "Obtain 4x Barrows Unique", BARROWS_4X_HOURS, **BARROWS.shape(4))
 
 # Tile 157: Movement
 add_movement(157, "Go back to Tile #146", 146)
 
 # Tile 158: 1x Raid
-add_tile(158, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(158, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 159: 1x Malediction Shard (from Crazy Arch/Chaos Fanatic/Scorpia)
 # Same rates as Odium Shard
-p = 1/256; kph = 60
+p = 1/256; kph = ehb.kill_rate("Crazy Archaeologist", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(159, "Obtain 1x Malediction Shard", med/kph, f"1/256 from Crazy Archaeologist, {kph} kph")
+add_tile(159, "Obtain 1x Malediction Shard", med/kph, f"1/256 from Crazy Archaeologist, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 160: 1x Raid
-add_tile(160, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(160, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 161: 25x Marks of Grace
 add_tile(161, "Obtain 25x Mark of Grace", MARKS_25_HOURS)
 
 # Tile 162: 2x Slayer Boss
-add_tile(162, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(162, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 163: 1x Elder Chaos Druid Robe
 add_tile(163, "Obtain 1x Elder Chaos Druid Robe", 0.16)
@@ -930,7 +1582,7 @@ add_movement(165, "Advance to Tile #172", 172)
 # Tile 166: 1x Tormented Synapse (Tormented Demons)
 p = 1/500; kph = 55 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_Tormented_Demons
 med = ceil(log(0.5) / log(1 - p))
-add_tile(166, "Obtain 1x Tormented Synapse", med/kph, f"1/500 from TD's, {kph} kph, median {med} kc")
+add_tile(166, "Obtain 1x Tormented Synapse", med/kph, f"1/500 from TD's, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 167: 1x Granite Maul
 add_tile(167, "Obtain 1x Granite Maul", 0.89, "1/256 from Gargoyles, 200 kph")
@@ -939,58 +1591,58 @@ add_tile(167, "Obtain 1x Granite Maul", 0.89, "1/256 from Gargoyles, 200 kph")
 add_tile(168, "Obtain Sceptre pieces (Runed Sceptre)", 1.0, "1/33 drops from easy low HP monsters")
 
 # Tile 169: 4x Moons of Peril
-add_tile(169, "Obtain 4x Moons of Peril Unique", moons_hours(4))
+add_tile(169, "Obtain 4x Moons of Peril Unique", MOONS.hours(4), **MOONS.shape(4))
 
 # Tile 170: 1x Raid
-add_tile(170, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(170, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 171: 3x DK Ring
-add_tile(171, "Obtain 3x DK Ring", DK_3X_HOURS)
+add_tile(171, "Obtain 3x DK Ring", DK_3X_HOURS, **DK.shape(3))
 
 # Tile 172: 3x Whip or 1x Unsired
 add_tile(172, "Obtain 3x Whip or 1x Unsired", WHIP_OR_UNSIRED_3X_HOURS)
 
 # Tile 173: 1x Crystal Armour Seed
-add_tile(173, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS)
+add_tile(173, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, **CG_CRYSTAL.shape(1))
 
 # Tile 174: Movement
 add_movement(174, "Go back to Tile #161", 161)
 
 # Tile 175: 1x Abyssal Dye
 p = 3/1200; kph = 30 # 30 reward pulls per hour
-med = int(ceil(nbinom.ppf(0.5, 1, p)))
-add_tile(56, "Obtain 1x Abyssal Dye", med/kph, "Similar to tile 56, 30 pulls per hour, 1/1200 drop for each dye, 3/1200 per pull, {kph} permits/hour, median {med} permits", confidence="medium")
+med = median_kills_nbinom(1, p)
+add_tile(175, "Obtain 1x Abyssal Dye", med/kph, "Similar to tile 56, 30 pulls per hour, 1/1200 drop for each dye, 3/1200 per pull, {kph} permits/hour, median {med} permits", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 176: 1x Doom Unique
-add_tile(176, "Obtain 1x Doom Unique", doom_hours(1))
+add_tile(176, "Obtain 1x Doom Unique", DOOM.hours(1), **DOOM.shape(1))
 
 # Tile 177: 1x Raid
-add_tile(177, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(177, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 178: 1x Hueycoatl
-add_tile(178, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(178, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 179: 1x Bloody Notes (Shades of Mort'ton chests)
 # 60 chests per hour, ~1/105 from gold chests
 p = 1/105; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(179, "Obtain 1x Bloody Notes", med/kph, f"1/105 from gold catacombs chests, 60 kph")
+add_tile(179, "Obtain 1x Bloody Notes", med/kph, f"1/105 from gold catacombs chests, 60 kph", drops=1, rate=p, kph=kph)
 
 # Tile 180: 1x Zenyte Shard
 p = 1/300; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(180, "Obtain 1x Zenyte Shard", med/kph, f"Same as tile 71, 1/300 from Demonic Gorillas, {kph} kph, median {med} kc")
+add_tile(180, "Obtain 1x Zenyte Shard", med/kph, f"Same as tile 71, 1/300 from Demonic Gorillas, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 181: 1x Burning Claw (from TD's)
 p = 1/501; kph = 55 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_Tormented_Demons
 med = ceil(log(0.5) / log(1 - p))
-add_tile(181, "Obtain 1x burning claw", med/kph, f"1/501 from TD's, {kph} kph, median {med} kc")
+add_tile(181, "Obtain 1x burning claw", med/kph, f"1/501 from TD's, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 182: Movement
 add_movement(182, "Go back to Tile #171", 171)
 
 # Tile 183: 2x Slayer Boss
-add_tile(183, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(183, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 184: 1x Champion Scroll
 add_tile(184, "Obtain 1x Champion Scroll", CHAMPION_SCROLL_HOURS)
@@ -998,16 +1650,16 @@ add_tile(184, "Obtain 1x Champion Scroll", CHAMPION_SCROLL_HOURS)
 # Tile 185: 1x Rev Unique
 p = 1/1000; kph = 110 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_revenants_(Magic_shortbow)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(185, "Obtain 1x Rev Unique", med/kph, f"Same as tile 30, Revs ~1/1000 unique from orks, {kph} kph")
+add_tile(185, "Obtain 1x Rev Unique", med/kph, f"Same as tile 30, Revs ~1/1000 unique from orks, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 186: 1x DT2 Boss Drop
-add_tile(186, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(186, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 187: 1x Raid
-add_tile(187, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(187, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 188: 1x Slayer Boss
-add_tile(188, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(188, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 189: Movement
 add_movement(189, "Advance to Tile #196", 196)
@@ -1016,28 +1668,28 @@ add_movement(189, "Advance to Tile #196", 196)
 add_tile(190, "Obtain Wintertodt items", WINTERTODT_HOURS)
 
 # Tile 191: 3x Venator Shard (muspah)
-p = 1/100; kph = 25
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(191, "Obtain 3x Venator Shard", med/kph, f"same as tile 67, 1/100 from muspah, {kph} kph, median {med} kc")
+p = 1/100; kph = ehb.kill_rate("Phantom Muspah", 25)
+med = median_kills_nbinom(3, p)
+add_tile(191, "Obtain 3x Venator Shard", med/kph, f"same as tile 67, 1/100 from muspah, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 192: 2x Slayer Boss
-add_tile(192, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(192, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 193: 1x Raid
-add_tile(193, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(193, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 194: 1x Elemental Staff Crown
 p = 2/150; kph = 55
 med = ceil(log(0.5) / log(1 - p))
-add_tile(194, "Obtain 1x Elemental Staff Crown", med/kph, f"Same as tile 48, 2/150 for either from equal contribution royal titans, ~{kph} kph, median {med} kc")
+add_tile(194, "Obtain 1x Elemental Staff Crown", med/kph, f"Same as tile 48, 2/150 for either from equal contribution royal titans, ~{kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 195: 1x Zulrah Unique
-add_tile(195, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS)
+add_tile(195, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS, **ZULRAH.shape(1))
 
 # Tile 196: 1x Dragon 2h Sword
-p = 1/64; kph = 48
+p = 1/64; kph = ehb.kill_rate("Chaos Elemental", 48)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(196, "Obtain 1x Dragon 2h Sword", med/kph, f"Same as tile 150, 1/128 from Chaos Elemental, {kph} kph")
+add_tile(196, "Obtain 1x Dragon 2h Sword", med/kph, f"Same as tile 150, 1/128 from Chaos Elemental, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 197: Free
 add_free(197, "Free Tile - Roll Again")
@@ -1046,10 +1698,10 @@ add_free(197, "Free Tile - Roll Again")
 add_movement(198, "Go back to Tile #187", 187)
 
 # Tile 199: 1x Slayer Boss
-add_tile(199, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(199, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 200: 1x Raid
-add_tile(200, "Obtain 1x Raid Drop", RAID_1X_HOURS)
+add_tile(200, "Obtain 1x Raid Drop", RAID_1X_HOURS, **RAID_POOL.shape(1))
 
 # Tile 201: Movement
 add_movement(201, "Advance to Tile #215", 215)
@@ -1057,83 +1709,83 @@ add_movement(201, "Advance to Tile #215", 215)
 # Tile 202: 1x Cache of Runes
 p = 3/27; kph = 3
 med = ceil(log(0.5) / log(1 - p))
-add_tile(202, "Obtain 1x Cache of Runes", med/kph, "Same as tile 81, 3/27 from ToA chest, assuming 20 minute 150's")
+add_tile(202, "Obtain 1x Cache of Runes", med/kph, "Same as tile 81, 3/27 from ToA chest, assuming 20 minute 150's", drops=1, rate=p, kph=kph)
 
 # Tile 203: 2x Slayer Boss
-add_tile(203, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(203, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 204: 3x Silver/Golden Coffin Locks (from Shade catacombs)
 p = 1/60; kph = 60
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(204, "Obtain 3x Coffin Locks", 3.0, "From Shade catacombs, ~1/60 from golden/silver chests")
+med = median_kills_nbinom(3, p)
+add_tile(204, "Obtain 3x Coffin Locks", 3.0, "From Shade catacombs, ~1/60 from golden/silver chests", drops=3, rate=p, kph=kph)
 
 # Tile 205: 1x Ballista Component (from Demonic Gorillas, 1/500ish for any component)
 # Ballista spring, Ballista frame, Ballista limbs, Monkey tail
 p = 1/180; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(205, "Obtain 1x Ballista Component", med/kph, f"~1/180 combined from DGs, {kph} kph")
+add_tile(205, "Obtain 1x Ballista Component", med/kph, f"~1/180 combined from DGs, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 206: 1x GWD Drop
-add_tile(206, "Obtain 1x GWD Drop", GWD_1X_HOURS)
+add_tile(206, "Obtain 1x GWD Drop", GWD_1X_HOURS, **GWD.shape(1))
 
 # Tile 207: 1x Crystal Armour Seed
-add_tile(207, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS)
+add_tile(207, "Obtain 1x Crystal Armour Seed", CRYSTAL_SEED_1X_HOURS, **CG_CRYSTAL.shape(1))
 
 # Tile 208: 2x Raid Drops
-add_tile(208, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(208, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 209: 1x Doom Unique
-add_tile(209, "Obtain 1x Doom Unique", doom_hours(1))
+add_tile(209, "Obtain 1x Doom Unique", DOOM.hours(1), **DOOM.shape(1))
 
 # Tile 210: 5x Medium Clue Uniques
 p = 3/10; kph = 8
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(210, "Obtain 5x Medium Clue Uniques", med/kph, f"Same as tile 144, ~3/10 any unique per casket, {kph} clues/hr")
+med = median_kills_nbinom(5, p)
+add_tile(210, "Obtain 5x Medium Clue Uniques", med/kph, f"Same as tile 144, ~3/10 any unique per casket, {kph} clues/hr", drops=5, rate=p, kph=kph)
 
 # Tile 211: 1x Odium Shard
-p = 1/256; kph = 60
+p = 1/256; kph = ehb.kill_rate("Crazy Archaeologist", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(211, "Obtain 1x Odium Shard", med/kph, f"Same as tile 34, 1/256 from Crazy Archaeologist, {kph} kph, median {med} kc")
+add_tile(211, "Obtain 1x Odium Shard", med/kph, f"Same as tile 34, 1/256 from Crazy Archaeologist, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 212: 1x Slayer Boss
-add_tile(212, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(212, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 213: Movement
 add_movement(213, "Go back to Tile #204", 204)
 
 # Tile 214: 3x Moons of Peril
-add_tile(214, "Obtain 3x Moons of Peril Unique", moons_hours(3))
+add_tile(214, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), **MOONS.shape(3))
 
 # Tile 215: 2x Raid Drops
-add_tile(215, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(215, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 216: 1x Frozen Cache
-p = 1/72; kph = 25
+p = 1/72; kph = ehb.kill_rate("Phantom Muspah", 25)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(216, "Obtain 1x Frozen Cache", med/kph, f"Same as tile 95, From muspah, {kph} kph, {med} median kc")
+add_tile(216, "Obtain 1x Frozen Cache", med/kph, f"Same as tile 95, From muspah, {kph} kph, {med} median kc", drops=1, rate=p, kph=kph)
 
 # Tile 217: 1x Slayer Boss
-add_tile(217, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(217, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 218: 1x Sarachnis Cudgel
-p = 1/384; kph = 67
+p = 1/384; kph = ehb.kill_rate("sarachnis", 67)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(218, "Obtain 1x Sarachnis Cudgel", med/kph, "Same as tile 20, 1/384, 67 kph")
+add_tile(218, "Obtain 1x Sarachnis Cudgel", med/kph, f"Same as tile 20, 1/384, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 219: 1x Wildy boss wep upgrade
-p = 1/618; kph = 50
+p = 1/618; kph = ehb.kill_rate("Artio", 50)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(219, "Obtain 1x Wildy Boss Weapon upgrade", med/kph, f"Same as tile 128, 1/618 from artio, {kph} kph")
+add_tile(219, "Obtain 1x Wildy Boss Weapon upgrade", med/kph, f"Same as tile 128, 1/618 from artio, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 220: 2x Ancient Ceremonial piece
 p = 1/640; kph = 120
-med = int(ceil(nbinom.ppf(0.5, 2, p)))
-add_tile(220, "Obtain 2x Ancient Ceremonial piece", med/kph, f"Similar to tile 51, 1/640 from blood reavers outside nex bank, {kph} kph, median {med} kc", confidence="medium")
+med = median_kills_nbinom(2, p)
+add_tile(220, "Obtain 2x Ancient Ceremonial piece", med/kph, f"Similar to tile 51, 1/640 from blood reavers outside nex bank, {kph} kph, median {med} kc", confidence="medium", drops=2, rate=p, kph=kph)
 
 # Tile 221: 1x Shaman Mask (Ogress shamans)
 p = 1/1200; kph = 120
 med = ceil(log(0.5) / log(1 - p))
-add_tile(221, "Obtain 1x Shaman Mask", med/kph, "1/1200 from ogress shamans/warriors, 120 kph")
+add_tile(221, "Obtain 1x Shaman Mask", med/kph, "1/1200 from ogress shamans/warriors, 120 kph", drops=1, rate=p, kph=kph)
 
 # Tile 222: 1x Dragon Axe (from DKs or Wintertodt)
 # DKs: Dragon axe 1/128 from Dagannoth Rex? Actually it's from all DK kings
@@ -1143,19 +1795,19 @@ add_tile(221, "Obtain 1x Shaman Mask", med/kph, "1/1200 from ogress shamans/warr
 # Or from Wintertodt: 1/10000 per crate - way slower
 p = 3/128; kph = 45
 med = ceil(log(0.5) / log(1 - p))
-add_tile(222, "Obtain 1x Dragon Axe", med/kph, f"1/42.7 combined from DKs, {kph} kph")
+add_tile(222, "Obtain 1x Dragon Axe", med/kph, f"1/42.7 combined from DKs, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 223: SIT (Lose -1 SKIP)
 add_free(223, "Lose -1 SKIP - Roll Again (SIT)")
 
 # Tile 224: 1x Nightmare Unique
 # Using phosani's numbers
-p = 1/113; kph = 9 # https://oldschool.runescape.wiki/w/Phosani%27s_Nightmare#Uniques
+p = 1/113; kph = ehb.kill_rate("Phosani's Nightmare", 9) # https://oldschool.runescape.wiki/w/Phosani%27s_Nightmare#Uniques
 med = ceil(log(0.5) / log(1 - p))
-add_tile(224, "Obtain 1x Nightmare Unique", 11.0, "Phosani's ~1/113 combined unique chance, 9 kph")
+add_tile(224, "Obtain 1x Nightmare Unique", 11.0, "Phosani's ~1/113 combined unique chance, 9 kph", drops=1, rate=p, kph=kph)
 
 # Tile 225: 1x GWD Drop
-add_tile(225, "Obtain 1x GWD Drop", GWD_1X_HOURS)
+add_tile(225, "Obtain 1x GWD Drop", GWD_1X_HOURS, **GWD.shape(1))
 
 # Tile 226: Gnome Restaurant
 add_tile(226, "Obtain 1x Gnome Restaurant unique", 2.0, "Same as tile 108, 0.6 each of scarf/goggles/mint cakes expected in 1 hour of delivery, https://oldschool.runescape.wiki/w/Money_making_guide/Delivering_food_in_Gnome_Restaurant")
@@ -1164,45 +1816,47 @@ add_tile(226, "Obtain 1x Gnome Restaurant unique", 2.0, "Same as tile 108, 0.6 e
 # Vard is the same EHB since the duke changes with a lower axe pc drop rate
 # Whisperer is ~half the EHB rate but the piece is more than half as rare (1/512)
 # Leviathan piece is rarer and he's slower to kill than duke
-p = 1/720; kph = 40 # Duke numbers
+p = 1/720; kph = ehb.kill_rate("Duke Sucellus", 40) # Duke numbers
 med = ceil(log(0.5) / log(1 - p))
-add_tile(227, "Obtain 1x SRA Piece", med/kph, f"Uses duke numbers, 40 kph 1/720")
+add_tile(227, "Obtain 1x SRA Piece", med/kph, f"Uses duke numbers, 40 kph 1/720", drops=1, rate=p, kph=kph)
 
 # Tile 228: 1x TzHaar weapon/armour
 p = 1/300; kph = 300
 med = ceil(log(0.5) / log(1 - p))
-add_tile(228, "Obtain 1x TzHaar Weapon/Armour", med/kph, f"Same as tile 79, ~1/300 combined obsidian, {kph} kph barraging", confidence="medium")
+add_tile(228, "Obtain 1x TzHaar Weapon/Armour", med/kph, f"Same as tile 79, ~1/300 combined obsidian, {kph} kph barraging", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 229: 2x Raid Drops
-add_tile(229, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(229, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 230: 1x Elven Signet (Crystal implings)
 p = 1/128; kph = 12 # Source for 12 imps per hour: https://www.youtube.com/watch?v=luJwoTbBH-o
 med = ceil(log(0.5) / log(1 - p))
-add_tile(230, "Obtain 1x Elven Signet", med/kph, "1/128, 12 imps per hour, might not all be able to do at the same time due to long respawn+world hopping")
+add_tile(230, "Obtain 1x Elven Signet", med/kph, "1/128, 12 imps per hour, might not all be able to do at the same time due to long respawn+world hopping", drops=1, rate=p, kph=kph)
 
 # Tile 231: 10x Fire Capes
-add_tile(231, "Obtain 10x Fire Capes", 5.8, "~35 min per run")
+# ~35 min per run, deaths rare enough to ignore; the runs add up to a narrow distribution
+fire = attempts.AttemptModel(35, sd=5, drops=10)
+add_tile(231, "Obtain 10x Fire Capes", fire.median_hours, fire.notes(), attempts=fire.params())
 
 # Tile 232: Free
 add_free(232, "Free Tile - Roll Again")
 
 # Tile 233: 1x Slayer Boss
-add_tile(233, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(233, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 234: 1x Chewed Bones
 p = 3/128; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(234, "Obtain 1x Chewed Bones", med/kph, f"Same as tile 122, 3/128 from Mithril Dragons, {kph} kph, median {med} kc")
+add_tile(234, "Obtain 1x Chewed Bones", med/kph, f"Same as tile 122, 3/128 from Mithril Dragons, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 235: Movement
 add_movement(235, "Go back to Tile #228", 228)
 
 # Tile 236: 1x Hueycoatl
-add_tile(236, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(236, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 237: 1x DT2 Boss Drop
-add_tile(237, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(237, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 238: Movement (SIT)
 add_movement(238, "Go back to Tile #223 (SIT)", 223)
@@ -1210,16 +1864,16 @@ add_movement(238, "Go back to Tile #223 (SIT)", 223)
 # Tile 239: 1x Tormented Synapse
 p = 1/500; kph = 55 # https://oldschool.runescape.wiki/w/Money_making_guide/Killing_Tormented_Demons
 med = ceil(log(0.5) / log(1 - p))
-add_tile(239, "Obtain 1x Tormented Synapse", med/kph, f"Same as tile 166, 1/500 from TD's, {kph} kph, median {med} kc")
+add_tile(239, "Obtain 1x Tormented Synapse", med/kph, f"Same as tile 166, 1/500 from TD's, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 240: 2x Raid Drops
-add_tile(240, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(240, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 241: 1x Blood Shard (Pickpocketing)
 # I believe killing vyrewatch ends up being ~18 hours on rate
 p = 1/5000; kph = 720
 med = ceil(log(0.5) / log(1 - p))
-add_tile(241, "Obtain 1x Blood Shard", med/kph, f"1/5000 from pickpocketing vyres, {kph} kph, median {med} kc")
+add_tile(241, "Obtain 1x Blood Shard", med/kph, f"1/5000 from pickpocketing vyres, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 242: Movement
 add_movement(242, "Advance to Tile #253", 253)
@@ -1227,34 +1881,34 @@ add_movement(242, "Advance to Tile #253", 253)
 # Tile 243: 1x Sigil/Holy Elixir/Spirit Shield (from Corp)
 # Corp: Holy Elixir 1/171, Spirit Shield 1/64, Sigils (spectral 1/1365, arcane 1/1365, elysian 1/4095)
 # Spirit Shield 1/64 is most common -> combined with elixir: ~1/44
-p = 1/44; kph = 7
+p = 1/44; kph = ehb.kill_rate("Corporeal Beast", 7)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(243, "Obtain 1x Corp Drop", med/kph, f"Spirit Shield 1/64, Elixir 1/171 combined ~1/44, {kph} kph")
+add_tile(243, "Obtain 1x Corp Drop", med/kph, f"Spirit Shield 1/64, Elixir 1/171 combined ~1/44, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 244: 5x Scurrius Spine
-p = 1/33; kph = 40
-med = int(ceil(nbinom.ppf(0.5, 5, p)))
-add_tile(244, "Obtain 5x Scurrius' Spine", med/kph)
+p = 1/33; kph = ehb.kill_rate("Scurrius", 40)
+med = median_kills_nbinom(5, p)
+add_tile(244, "Obtain 5x Scurrius' Spine", med/kph, drops=5, rate=p, kph=kph)
 
 # Tile 245: 1x Oathplate Piece/Soulflame Horn/Pet (Yama)
 # 5/600 for oath/horn, 0.24/600 for pet
-p = (5.24)/600; kph = 8
+p = (5.24)/600; kph = ehb.kill_rate("Yama", 8)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(245, "Obtain 1x Oathplate/Soulflame/Pet", med/kph, "5.4/600 for pet or oath or horn, 8 kph solo (similar rate duo)")
+add_tile(245, "Obtain 1x Oathplate/Soulflame/Pet", med/kph, "5.4/600 for pet or oath or horn, 8 kph solo (similar rate duo)", drops=1, rate=p, kph=kph)
 
 # Tile 246: 3x Easy Clue Uniques
 p = 247/1080; kph = 10 # https://oldschool.runescape.wiki/w/Reward_casket_(easy)
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(246, "Obtain 3x Easy Clue Uniques", med/kph, f"Same as tile 101, 10 easy clues/hr, 247/1080 chance for a unique from each")
+med = median_kills_nbinom(3, p)
+add_tile(246, "Obtain 3x Easy Clue Uniques", med/kph, f"Same as tile 101, 10 easy clues/hr, 247/1080 chance for a unique from each", drops=3, rate=p, kph=kph)
 
 # Tile 247: 1x Slayer Boss
-add_tile(247, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(247, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 248: 2x Raid Drops
-add_tile(248, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(248, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 249: 1x DT2 Boss Drop
-add_tile(249, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(249, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 250: 1x Champion Scroll
 add_tile(250, "Obtain 1x Champion Scroll", CHAMPION_SCROLL_HOURS)
@@ -1265,106 +1919,105 @@ add_movement(251, "Go back to Tile #244", 244)
 # Tile 252: 1x Bryophyta's Essence (from Bryophyta, 1/118 but need mossy key first)
 # 1/16 for a key
 # 1/1888 combined
-p = 1/1888; kph = 80  # Using burning claws on bryophyta, similar to Obor https://oldschool.runescape.wiki/w/Giant_key, "players can kill Obor 120+ times per hour when using burning claws, giving approximately 8 keys per hour."
+p = 1/1888; kph = ehb.kill_rate("Bryophyta", 80)  # Using burning claws on bryophyta, similar to Obor https://oldschool.runescape.wiki/w/Giant_key, "players can kill Obor 120+ times per hour when using burning claws, giving approximately 8 keys per hour."
 med = ceil(log(0.5) / log(1 - p))
-add_tile(252, "1x Bryophyta's Essence", med/kph, f"1/16 for a key, essence 1/118 from the chest, ~{kph} burning claw speccing with tele/pool, median {med} kc")
+add_tile(252, "1x Bryophyta's Essence", med/kph, f"1/16 for a key, essence 1/118 from the chest, ~{kph} burning claw speccing with tele/pool, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 253: 1x Frozen Cache
-p = 1/72; kph = 25
+p = 1/72; kph = ehb.kill_rate("Phantom Muspah", 25)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(253, "Obtain 1x Frozen Cache", med/kph, f"Same as tile 95, From muspah, {kph} kph, {med} median kc")
+add_tile(253, "Obtain 1x Frozen Cache", med/kph, f"Same as tile 95, From muspah, {kph} kph, {med} median kc", drops=1, rate=p, kph=kph)
 
 # Tile 254: 1x Zulrah Unique
-add_tile(254, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS)
+add_tile(254, "Obtain 1x Zulrah Unique", ZULRAH_1X_HOURS, **ZULRAH.shape(1))
 
 # Tile 255: 1x Dragon Pickaxe
-p = 1/358; kph = 45
+p = 1/358; kph = ehb.kill_rate("Calvar'ion", 45)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(255, "Obtain 1x Dragon Pickaxe", med/kph, f"Same as tile 70, 1/256 from Calvar'ion, {kph} kph, median {med} kc")
+add_tile(255, "Obtain 1x Dragon Pickaxe", med/kph, f"Same as tile 70, 1/256 from Calvar'ion, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 256: 1x Echo Crystal (Colo)
 add_tile(256, "Obtain 1x Echo Crystal", 4.0, "~0.25/hour completing wave 12 quickly, https://oldschool.runescape.wiki/w/Money_making_guide/Completing_the_Fortis_Colosseum_(Wave_12)", confidence="medium")
 
 # Tile 257: 2x Raid Drops
-add_tile(257, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(257, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 258: 1x Inky Paint (from krakens)
-p = 1/1500; kph = 60
+p = 1/1500; kph = ehb.kill_rate("Kraken", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(258, "Obtain 1x Inky Paint", 2.0, "1/1500 from Vampyre kraken, assuming 60 kph, median {med} kc")
+add_tile(258, "Obtain 1x Inky Paint", 2.0, "1/1500 from Vampyre kraken, assuming 60 kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 259: 5x Crystal Grail (vorpal rabbit)
 add_tile(259, "Obtain 5x Crystal Grail", 2.5, "assuming 30 minute rabbit kills")
 
 # Tile 260: 1x Slayer Boss
-add_tile(260, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS)
+add_tile(260, "Obtain 1x Slayer Boss Drop", SLAYER_BOSS_1X_HOURS, **SLAYER_POOL.shape(1))
 
 # Tile 261: 1x Zenyte Shard
 p = 1/300; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(261, "Obtain 1x Zenyte Shard", med/kph, f"Same as tile 71, 1/300 from Demonic Gorillas, {kph} kph, median {med} kc")
+add_tile(261, "Obtain 1x Zenyte Shard", med/kph, f"Same as tile 71, 1/300 from Demonic Gorillas, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 262: 2x Crystal Armour Seed
-p = 1/50; kph = 6
-med = int(ceil(nbinom.ppf(0.5, 2, p)))
-add_tile(262, "Obtain 2x Crystal Armour Seed", med/kph, f"From CG, median {med} completions")
+p = 1/50; kph = ehb.kill_rate("The Corrupted Gauntlet", 6)
+med = median_kills_nbinom(2, p)
+add_tile(262, "Obtain 2x Crystal Armour Seed", med/kph, f"From CG, median {med} completions", drops=2, rate=p, kph=kph)
 
 # Tile 263: 2x Raid Drops
-add_tile(263, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(263, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 264: 1x Malediction Shard
 # Same rates as Odium Shard
-p = 1/256; kph = 60
+p = 1/256; kph = ehb.kill_rate("Crazy Archaeologist", 60)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(264, "Obtain 1x Malediction Shard", med/kph, f"Same as tile 159, 1/256 from Crazy Archaeologist, {kph} kph")
+add_tile(264, "Obtain 1x Malediction Shard", med/kph, f"Same as tile 159, 1/256 from Crazy Archaeologist, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 265: Free
 add_free(265, "Free Tile - Roll Again")
 
 # Tile 266: 1x Doom Unique
-add_tile(266, "Obtain 1x Doom Unique", doom_hours(1))
+add_tile(266, "Obtain 1x Doom Unique", DOOM.hours(1), **DOOM.shape(1))
 
 # Tile 267: Movement
 add_movement(267, "Advance to Tile #278", 278)
 
 # Tile 268: 2x Slayer Boss
-add_tile(268, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(268, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 269: 1x Zalcano Tertiary
-p = 1/540; kph = 30
+p = 1/540; kph = ehb.kill_rate("Zalcano", 30)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(269, "Obtain 1x Zalcano Tertiary", med/kph, f"Same as tile 82, Combined ~1/540 in an efficient trio, {kph} kph, median {med} kc")
+add_tile(269, "Obtain 1x Zalcano Tertiary", med/kph, f"Same as tile 82, Combined ~1/540 in an efficient trio, {kph} kph, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 270: 2x Raid Drops
-add_tile(270, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(270, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 271: 1x Oathplate/Soulflame/Pet
-p = (5.24)/600; kph = 8
+p = (5.24)/600; kph = ehb.kill_rate("Yama", 8)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(271, "Obtain 1x Oathplate/Soulflame/Pet", med/kph, "Same as tile 245, 5.4/600 for pet or oath or horn, 8 kph solo (similar rate duo)")
+add_tile(271, "Obtain 1x Oathplate/Soulflame/Pet", med/kph, "Same as tile 245, 5.4/600 for pet or oath or horn, 8 kph solo (similar rate duo)", drops=1, rate=p, kph=kph)
 
 # Tile 272: 1x Big Fish
 p = 1/1000; kph = 120
 med = ceil(log(0.5) / log(1 - p))
-add_tile(272, "Obtain 1x Any Big Fish", med/kph, f"Same as tile 86, Fishing bass at 99, {kph} per hour, {med} fish median", confidence="medium")
+add_tile(272, "Obtain 1x Any Big Fish", med/kph, f"Same as tile 86, Fishing bass at 99, {kph} per hour, {med} fish median", confidence="medium", drops=1, rate=p, kph=kph)
 
 # Tile 273: 1x Holy/Sang/Twisted Kit (HMT/CMs)
 # HMT is much faster but I don't think it's realistic for most of the team, me included
-p = 1/75; kph = 3
-med = ceil(log(0.5) / log(1 - p))
-add_tile(273, "Obtain 1x Raid Kit", med/kph, f"Assuming 3CM's/hour, {med} kc on average. HMT would be faster (14 hours, 5/300 for either kit, 3 EHB rate), but more skill required")
+kit = CATALOG.solve("raid kit")
+add_tile(273, "Obtain 1x Raid Kit", kit.hours, kit.notes("HMT would be faster (14 hours, 5/300 for either kit, 3 EHB rate), but more skill required"), **kit.shape())
 
 # Tile 274: Wintertodt
 add_tile(274, "Obtain Wintertodt items", WINTERTODT_HOURS)
 
 # Tile 275: 1x GWD Drop
-add_tile(275, "Obtain 1x GWD Drop", GWD_1X_HOURS)
+add_tile(275, "Obtain 1x GWD Drop", GWD_1X_HOURS, **GWD.shape(1))
 
 # Tile 276: 2x Raid Drops
-add_tile(276, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(276, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 277: 1x DT2 Boss Drop
-add_tile(277, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(277, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 278: 3x Ecumenical Key
 add_tile(278, "Obtain 3x Ecumenical Key", ECUMENICAL_3X_HOURS)
@@ -1374,67 +2027,65 @@ add_tile(278, "Obtain 3x Ecumenical Key", ECUMENICAL_3X_HOURS)
 add_tile(279, "Obtain 1x Awakened DT2 Boss KC", 0.25, "Just 1 kill, any blorva havers?")
 
 # Tile 280: 1x Wildy Boss Ring
-p = 1/716; kph = 50
-med = ceil(log(0.5) / log(1 - p))
-add_tile(280, "Obtain 1x Wildy Boss Ring", med/kph, f"Same as tile 15, 1/716 from singles wildy bosses, {kph} kph, median {med} kc")
+add_tile(280, "Obtain 1x Wildy Boss Ring", ring.hours, ring.notes("Same as tile 15"), **ring.shape())
 
 # Tile 281: 1x Giant Egg Sack (from Sarachnis, 1/20)
-p = 1/20; kph = 67
+p = 1/20; kph = ehb.kill_rate("sarachnis", 67)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(281, "Obtain 1x Giant Egg Sack", med/kph, "1/20 from sarachnis")
+add_tile(281, "Obtain 1x Giant Egg Sack", med/kph, "1/20 from sarachnis", drops=1, rate=p, kph=kph)
 
 # Tile 282: 3x Moons of Peril
-add_tile(282, "Obtain 3x Moons of Peril Unique", moons_hours(3))
+add_tile(282, "Obtain 3x Moons of Peril Unique", MOONS.hours(3), **MOONS.shape(3))
 
 # Tile 283: 1x Blood/Shadow/Ice/Smoke Quartz (from DT2 area)
 # Quartz are all ~1/200, duke is the fastest to kill
-p = 1/207; kph = 40
+p = 1/207; kph = ehb.kill_rate("Duke Sucellus", 40)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(283, "Obtain 1x DT2 Quartz", med/kph, f"Assuming 40 duke/hour, median {med} kc")
+add_tile(283, "Obtain 1x DT2 Quartz", med/kph, f"Assuming 40 duke/hour, median {med} kc", drops=1, rate=p, kph=kph)
 
 # Tile 284: Movement
 add_movement(284, "Advance to Tile #291", 291)
 
 # Tile 285: 2x Slayer Boss
-add_tile(285, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(285, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 286: 2x Raid Drops
-add_tile(286, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(286, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 287: 1x Godsword Shard
 p = 3/512; kph = 30
 med = ceil(log(0.5) / log(1 - p))
-add_tile(287, "Obtain 1x Godsword Shard", med/kph, f"Same as tile 47, 3/512 for any shard, {kph} kph at GWD")
+add_tile(287, "Obtain 1x Godsword Shard", med/kph, f"Same as tile 47, 3/512 for any shard, {kph} kph at GWD", drops=1, rate=p, kph=kph)
 
 # Tile 288: 3x Crystal Armour Seed
-p = 1/50; kph = 6
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(288, "Obtain 3x Crystal Armour Seed", med/kph, f"From CG, median {med} completions")
+p = 1/50; kph = ehb.kill_rate("The Corrupted Gauntlet", 6)
+med = median_kills_nbinom(3, p)
+add_tile(288, "Obtain 3x Crystal Armour Seed", med/kph, f"From CG, median {med} completions", drops=3, rate=p, kph=kph)
 
 # Tile 289: 1x Forgotten Lockbox
-p = 1/33; kph = 8 # solo
+p = 1/33; kph = ehb.kill_rate("Yama", 8) # solo
 med = ceil(log(0.5) / log(1 - p))
-add_tile(289, "Obtain 1x Forgotten Lockbox", med/kph, f"Same as tile 124, 1/33 from solo yama, {kph} kph, median {med} kc, duo rate should be similar")
+add_tile(289, "Obtain 1x Forgotten Lockbox", med/kph, f"Same as tile 124, 1/33 from solo yama, {kph} kph, median {med} kc, duo rate should be similar", drops=1, rate=p, kph=kph)
 
 # Tile 290: 3x Dragon Boots
 p = 1/128; kph = 180  # blowpiping nex spiritual mages
-med = int(ceil(nbinom.ppf(0.5, 3, p)))
-add_tile(290, "Obtain 3x Dragon Boots", med/kph, f"Same as tile 130, 1/128 from Nex Spiritual Mages, {kph} kph, median {med} kc")
+med = median_kills_nbinom(3, p)
+add_tile(290, "Obtain 3x Dragon Boots", med/kph, f"Same as tile 130, 1/128 from Nex Spiritual Mages, {kph} kph, median {med} kc", drops=3, rate=p, kph=kph)
 
 # Tile 291: SIT (Lose -1 SKIP)
 add_free(291, "Lose -1 SKIP - Roll Again (SIT)")
 
 # Tile 292: 5x Barrows
-add_tile(292, "Obtain 5x Barrows Unique", BARROWS_5X_HOURS)
+add_tile(292, "Obtain 5x Barrows Unique", BARROWS_5X_HOURS, **BARROWS.shape(5))
 
 # Tile 293: 1x Colo Drop (any) (Fortis Colosseum)
 add_tile(293, "Obtain 1x Colosseum Drop", 3.75, "Slightly faster than echo crystal, but realistically an echo crystal")
 
 # Tile 294: 2x Raid Drops
-add_tile(294, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(294, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 295: 1x Hueycoatl
-add_tile(295, "Obtain 1x Hueycoatl Unique", huey_hours(1))
+add_tile(295, "Obtain 1x Hueycoatl Unique", HUEY.hours(1), **HUEY.shape(1))
 
 # Tile 296: 4x Whip or 1x Unsired
 add_tile(296, "Obtain 4x Whip or 1x Unsired", WHIP_OR_UNSIRED_4X_HOURS)
@@ -1442,59 +2093,58 @@ add_tile(296, "Obtain 4x Whip or 1x Unsired", WHIP_OR_UNSIRED_4X_HOURS)
 # Tile 297: 1x Ballista Component
 p = 1/180; kph = 60
 med = ceil(log(0.5) / log(1 - p))
-add_tile(297, "Obtain 1x Ballista Component", med/kph, f"Same as tile 205, ~1/180 combined from DGs, {kph} kph")
+add_tile(297, "Obtain 1x Ballista Component", med/kph, f"Same as tile 205, ~1/180 combined from DGs, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 298: 1x Holy/Sang/Twisted Kit
-p = 1/75; kph = 3
-med = ceil(log(0.5) / log(1 - p))
-add_tile(298, "Obtain 1x Raid Kit", med/kph, f"Same as tile 273, Assuming 3 CM's/hour, {med} kc on average. HMT would be faster, but more skill required")
+add_tile(298, "Obtain 1x Raid Kit", kit.hours, kit.notes("Same as tile 273, HMT would be faster, but more skill required"), **kit.shape())
 
 # Tile 299: 1x SRA Piece
-p = 1/720; kph = 40 # Duke numbers
+p = 1/720; kph = ehb.kill_rate("Duke Sucellus", 40) # Duke numbers
 med = ceil(log(0.5) / log(1 - p))
-add_tile(299, "Obtain 1x SRA Piece", med/kph, f"Same as tile 227, Uses duke numbers, 40 kph 1/720")
+add_tile(299, "Obtain 1x SRA Piece", med/kph, f"Same as tile 227, Uses duke numbers, 40 kph 1/720", drops=1, rate=p, kph=kph)
 
 # Tile 300: 2x Slayer Boss
-add_tile(300, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS)
+add_tile(300, "Obtain 2x Slayer Boss Drop", SLAYER_BOSS_2X_HOURS, **SLAYER_POOL.shape(2))
 
 # Tile 301: Movement
 add_movement(301, "Go back to Tile #290", 290)
 
 # Tile 302: 1x Pet (no chompy/skotizo)
-# Chaos ele?
-p = 1/300; kph = 48
-med = ceil(log(0.5) / log(1 - p))
-add_tile(302, "Obtain 1x Pet (no chompy/skotizo)", 11.6, "Chaos elemental, 1/300 48 kph. Low confidence because there could be a better option", confidence="low")
+pet = CATALOG.solve("pet", exclude=["chompy", "skotizo"])
+add_tile(302, "Obtain 1x Pet (no chompy/skotizo)", pet.hours, pet.notes(), confidence="medium", **pet.shape())
 
 # Tile 303: 1x DT2 Boss Drop
-add_tile(303, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS)
+add_tile(303, "Obtain 1x DT2 Boss Drop", DT2_1X_HOURS, DT2_1X.notes(), **DT2_1X.shape())
 
 # Tile 304: 2x Raid Drops
-add_tile(304, "Obtain 2x Raid Drop", RAID_2X_HOURS)
+add_tile(304, "Obtain 2x Raid Drop", RAID_2X_HOURS, **RAID_POOL.shape(2))
 
 # Tile 305: 1x Sigil or Holy Elixir (from Corp)
 # More restrictive than tile 243 (no spirit shield)
 # Holy Elixir 1/171, Sigils combined ~1/585
 # Combined: ~1/132
-p = 1/132; kph = 7
+p = 1/132; kph = ehb.kill_rate("Corporeal Beast", 7)
 med = ceil(log(0.5) / log(1 - p))
-add_tile(305, "Obtain 1x Sigil/Holy Elixir", med/kph, f"~1/132 from Corp, {kph} kph")
+add_tile(305, "Obtain 1x Sigil/Holy Elixir", med/kph, f"~1/132 from Corp, {kph} kph", drops=1, rate=p, kph=kph)
 
 # Tile 306: 1x Med Clue Boots
 p = 5/238.6; kph = 10 # 10 clues/hour from eclectics
 med = ceil(log(0.5) / log(1 - p))
-add_tile(306, "Obtain 1x Med Clue Boots", med/kph, f"same as tile 136, 5/238.6 combined from med caskets, {kph} clues/hr, median {med} caskets")
+add_tile(306, "Obtain 1x Med Clue Boots", med/kph, f"same as tile 136, 5/238.6 combined from med caskets, {kph} clues/hr, median {med} caskets", drops=1, rate=p, kph=kph)
 
 # Tile 307: 5x Inferno Capes
 # Each Inferno run takes 60-90 min for experienced players. Not guaranteed completion.
 # Let's say 75 min average with occasional deaths -> ~90 min per cape effective
-# 5 * 90 = 450 min = 7.5 hr
-add_tile(307, "Obtain 5x Inferno Capes", 7.5, "~90 min per successful run for experienced players")
+# 5 * 90 = 450 min = 7.5 hr on average. As attempts: 80% of runs succeed, a death costs ~60 min,
+# which is 90 min per cape; the median of the exact distribution is a bit under the mean
+inferno = attempts.AttemptModel(75, sd=8, success=0.8, fail_minutes=60, fail_sd=25, drops=5)
+add_tile(307, "Obtain 5x Inferno Capes", inferno.median_hours, f"{inferno.notes()}, experienced players",
+         attempts=inferno.params())
 
 # Tile 308: 1x Nightmare Unique
-p = 1/113; kph = 9 # https://oldschool.runescape.wiki/w/Phosani%27s_Nightmare#Uniques
+p = 1/113; kph = ehb.kill_rate("Phosani's Nightmare", 9) # https://oldschool.runescape.wiki/w/Phosani%27s_Nightmare#Uniques
 med = ceil(log(0.5) / log(1 - p))
-add_tile(308, "Obtain 1x Nightmare Unique", 11.0, "Same as tile 224, Phosani's ~1/113 combined unique chance, 9 kph")
+add_tile(308, "Obtain 1x Nightmare Unique", 11.0, "Same as tile 224, Phosani's ~1/113 combined unique chance, 9 kph", drops=1, rate=p, kph=kph)
 
 # Tile 309: 5x Quivers (from... Fortis Colosseum?)
 add_tile(309, "Obtain 5x Quivers", 3.0, "40 minute colo's")
@@ -1503,30 +2153,10 @@ add_tile(309, "Obtain 5x Quivers", 3.0, "40 minute colo's")
 # Now build the Excel file
 # ============================================================
 
-wb = openpyxl.Workbook()
-ws = wb.active
-ws.title = "Tile Estimates"
-
-# Headers
-headers = ["Tile #", "Description", "Category", "Median Hours", "Confidence", "Notes"]
 header_font = Font(bold=True, color="FFFFFF", size=11, name="Arial")
 header_fill = PatternFill("solid", fgColor="2F5496")
 header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
-for col, h in enumerate(headers, 1):
-    cell = ws.cell(row=1, column=col, value=h)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.alignment = header_align
-
-# Column widths
-ws.column_dimensions['A'].width = 8
-ws.column_dimensions['B'].width = 55
-ws.column_dimensions['C'].width = 12
-ws.column_dimensions['D'].width = 14
-ws.column_dimensions['E'].width = 12
-ws.column_dimensions['F'].width = 60
-
 # Color coding for confidence
 conf_fills = {
     "high": PatternFill("solid", fgColor="C6EFCE"),      # green
@@ -1549,155 +2179,608 @@ thin_border = Border(
     bottom=Side(style='thin', color='D9D9D9'),
 )
 
-# Sort tiles by number
-tiles.sort(key=lambda x: x["tile"])
-
-# Write data
-for i, t in enumerate(tiles):
-    row = i + 2
-    ws.cell(row=row, column=1, value=t["tile"]).alignment = Alignment(horizontal="center")
-    ws.cell(row=row, column=2, value=t["description"])
-    ws.cell(row=row, column=3, value=t["category"].title())
-    ws.cell(row=row, column=4, value=t["median_hours"]).number_format = '0.00'
-    ws.cell(row=row, column=5, value=t["confidence"].upper())
-    ws.cell(row=row, column=6, value=t["notes"])
-    
-    # Apply confidence color to the whole row
-    conf = t["confidence"]
-    fill = conf_fills.get(conf, PatternFill())
-    cat_fill = cat_fills.get(t["category"], PatternFill())
-    
-    for col in range(1, 7):
-        cell = ws.cell(row=row, column=col)
+def write_headers(ws, headers, fill):
+    for col, h in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col, value=h)
+        cell.font = header_font
+        cell.fill = fill
+        cell.alignment = header_align
+
+# Spread columns next to Median Hours (which is the P50)
+SPREAD_QUANTILES = [p for p in board_sim.REPORT_QUANTILES if p != 0.5]
+SPREAD_HEADERS = [f"P{p * 100:g} Hours" for p in SPREAD_QUANTILES]
+
+def tile_spreads(board):
+    """{tile #: [hours at each SPREAD_QUANTILES level]} for the obtain tiles, in one batched evaluation."""
+    obtain = [t for t in board if t["category"] == "obtain"]
+    hours = board_sim.tile_quantiles(obtain, SPREAD_QUANTILES) if obtain else []
+    return {t["tile"]: row.tolist() for t, row in zip(obtain, hours)}
+
+def write_spreads(ws, row, first_col, spread):
+    for k, hours in enumerate(spread or []):
+        cell = ws.cell(row=row, column=first_col + k, value=round(hours, 2))
+        cell.number_format = '0.00'
         cell.border = thin_border
         cell.font = Font(name="Arial", size=10)
-        if col == 5:
-            cell.fill = fill
-        elif col == 3:
-            cell.fill = cat_fill
-
-ws3 = wb.create_sheet("Slayer Bosses")
-sum_headers = ["Boss", "Unique Rate", "EHB", "Median KC for Unique", "Hours -> 1 unique", "Hours -> 2 uniques"]
-for col, h in enumerate(sum_headers, 1):
-    cell = ws3.cell(row=1, column=col, value=h)
-    cell.font = header_font
-    cell.fill = PatternFill("solid", fgColor="843C0C")
-    cell.alignment = header_align
-for i, boss in enumerate(SLAYER_BOSSES):
-    row = i + 2
-    ws3.cell(row=row, column=1, value=boss.name)
-    ws3.cell(row=row, column=2, value=boss.unique_rate).number_format = '0.00000'
-    ws3.cell(row=row, column=3, value=boss.ehb)
-    ws3.cell(row=row, column=4, value=boss.median_kc)
-    ws3.cell(row=row, column=5, value=boss.hours_to_unique).number_format = '0.00'
-    ws3.cell(row=row, column=6, value=boss.hours_for_two_uniques()).number_format = '0.00'
-ws3.column_dimensions['A'].width = 32
-ws3.column_dimensions['B'].width = 16
-ws3.column_dimensions['C'].width = 16
-ws3.column_dimensions['D'].width = 16
-ws3.column_dimensions['E'].width = 16
-ws3.column_dimensions['F'].width = 16
-
-ws4 = wb.create_sheet("Raids")
-sum_headers = ["Raid", "Unique Rate", "EHB", "Median KC for Unique", "Hours -> 1 unique", "Hours -> 2 uniques"]
-for col, h in enumerate(sum_headers, 1):
-    cell = ws4.cell(row=1, column=col, value=h)
-    cell.font = header_font
-    cell.fill = PatternFill("solid", fgColor="843C0C")
-    cell.alignment = header_align
-for i, raid in enumerate(RAIDS):
-    row = i + 2
-    ws4.cell(row=row, column=1, value=raid.name)
-    ws4.cell(row=row, column=2, value=raid.unique_rate).number_format = '0.00000'
-    ws4.cell(row=row, column=3, value=raid.ehb)
-    ws4.cell(row=row, column=4, value=raid.median_kc)
-    ws4.cell(row=row, column=5, value=raid.hours_to_unique).number_format = '0.00'
-    ws4.cell(row=row, column=6, value=raid.hours_for_two_uniques()).number_format = '0.00'
-ws4.column_dimensions['A'].width = 32
-ws4.column_dimensions['B'].width = 16
-ws4.column_dimensions['C'].width = 16
-ws4.column_dimensions['D'].width = 16
-ws4.column_dimensions['E'].width = 16
-ws4.column_dimensions['F'].width = 16
-
-
-# Add summary sheet
-ws2 = wb.create_sheet("Skip Analysis")
-
-# Find only "obtain" tiles, sorted by median hours descending (best skip candidates)
-obtain_tiles = [t for t in tiles if t["category"] == "obtain"]
-obtain_tiles.sort(key=lambda x: x["median_hours"], reverse=True)
-
-# Headers for summary
-sum_headers = ["Rank", "Tile #", "Description", "Median Hours", "Confidence", "Skip Priority"]
-for col, h in enumerate(sum_headers, 1):
-    cell = ws2.cell(row=1, column=col, value=h)
-    cell.font = header_font
-    cell.fill = PatternFill("solid", fgColor="843C0C")
-    cell.alignment = header_align
-
-ws2.column_dimensions['A'].width = 8
-ws2.column_dimensions['B'].width = 8
-ws2.column_dimensions['C'].width = 55
-ws2.column_dimensions['D'].width = 14
-ws2.column_dimensions['E'].width = 12
-ws2.column_dimensions['F'].width = 15
-
-for i, t in enumerate(obtain_tiles):
-    row = i + 2
-    ws2.cell(row=row, column=1, value=i+1).alignment = Alignment(horizontal="center")
-    ws2.cell(row=row, column=2, value=t["tile"]).alignment = Alignment(horizontal="center")
-    ws2.cell(row=row, column=3, value=t["description"])
-    ws2.cell(row=row, column=4, value=t["median_hours"]).number_format = '0.00'
-    ws2.cell(row=row, column=5, value=t["confidence"].upper())
-    
-    # Skip priority
-    if i < 3:
-        priority = "TOP 3 SKIP"
-        pfill = PatternFill("solid", fgColor="FF0000")
-        pfont = Font(name="Arial", size=10, bold=True, color="FFFFFF")
-    elif i < 10:
-        priority = "Strong candidate"
-        pfill = PatternFill("solid", fgColor="FFC000")
-        pfont = Font(name="Arial", size=10)
-    elif i < 20:
-        priority = "Consider"
-        pfill = PatternFill("solid", fgColor="FFEB9C")
-        pfont = Font(name="Arial", size=10)
+
+def rank_skips(board):
+    """Obtain tiles sorted by median hours descending (best skip candidates first)."""
+    obtain_tiles = [t for t in board if t["category"] == "obtain"]
+    obtain_tiles.sort(key=lambda x: x["median_hours"], reverse=True)
+    return obtain_tiles
+
+def write_pool_sheet(wb, title, first_header, pool):
+    ws = wb.create_sheet(title)
+    sum_headers = [first_header, "Unique Rate", "EHB", "Median KC for Unique", "Hours -> 1 unique", "Hours -> 2 uniques",
+                   "Hours -> 3 uniques"]
+    write_headers(ws, sum_headers, PatternFill("solid", fgColor="843C0C"))
+    for i, boss in enumerate(pool):
+        row = i + 2
+        ws.cell(row=row, column=1, value=boss.name)
+        ws.cell(row=row, column=2, value=boss.unique_rate).number_format = '0.00000'
+        ws.cell(row=row, column=3, value=boss.ehb)
+        ws.cell(row=row, column=4, value=boss.median_kc)
+        ws.cell(row=row, column=5, value=boss.hours_to_unique).number_format = '0.00'
+        ws.cell(row=row, column=6, value=boss.hours_for_two_uniques()).number_format = '0.00'
+        ws.cell(row=row, column=7, value=boss.hours_for(3)).number_format = '0.00'
+    ws.column_dimensions['A'].width = 32
+    for col in "BCDEFG":
+        ws.column_dimensions[col].width = 16
+    ws.freeze_panes = 'A2'
+    ws.auto_filter.ref = f"A1:G{len(pool)+1}"
+    return ws
+
+def write_workbook(board, output_path, spreads=None):
+    """Write the Tile Estimates / Slayer Bosses / Raids / Skip Analysis workbook for one board.
+
+    `spreads` is a precomputed tile_spreads(board) (the watch daemon keeps one up to date)."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Tile Estimates"
+
+    # Headers
+    headers = ["Tile #", "Description", "Category", "Median Hours", "Confidence", "Notes"] + SPREAD_HEADERS
+    write_headers(ws, headers, header_fill)
+    if spreads is None:
+        spreads = tile_spreads(board)
+
+    # Column widths
+    ws.column_dimensions['A'].width = 8
+    ws.column_dimensions['B'].width = 55
+    ws.column_dimensions['C'].width = 12
+    ws.column_dimensions['D'].width = 14
+    ws.column_dimensions['E'].width = 12
+    ws.column_dimensions['F'].width = 60
+    for k in range(len(SPREAD_HEADERS)):
+        ws.column_dimensions[get_column_letter(7 + k)].width = 12
+
+    # Sort tiles by number
+    board.sort(key=lambda x: x["tile"])
+
+    # Write data
+    for i, t in enumerate(board):
+        row = i + 2
+        ws.cell(row=row, column=1, value=t["tile"]).alignment = Alignment(horizontal="center")
+        ws.cell(row=row, column=2, value=t["description"])
+        ws.cell(row=row, column=3, value=t["category"].title())
+        ws.cell(row=row, column=4, value=t["median_hours"]).number_format = '0.00'
+        ws.cell(row=row, column=5, value=t["confidence"].upper())
+        ws.cell(row=row, column=6, value=t["notes"])
+
+        # Apply confidence color to the whole row
+        conf = t["confidence"]
+        fill = conf_fills.get(conf, PatternFill())
+        cat_fill = cat_fills.get(t["category"], PatternFill())
+
+        for col in range(1, 7):
+            cell = ws.cell(row=row, column=col)
+            cell.border = thin_border
+            cell.font = Font(name="Arial", size=10)
+            if col == 5:
+                cell.fill = fill
+            elif col == 3:
+                cell.fill = cat_fill
+        write_spreads(ws, row, 7, spreads.get(t["tile"]))
+
+    write_pool_sheet(wb, "Slayer Bosses", "Boss", SLAYER_BOSSES)
+    write_pool_sheet(wb, "Raids", "Raid", RAIDS)
+
+    # Add summary sheet
+    ws2 = wb.create_sheet("Skip Analysis")
+
+    obtain_tiles = rank_skips(board)
+    labels = [label for _, label in whatif.SKIP_TIERS]
+    priority_styles = {
+        labels[0]: (PatternFill("solid", fgColor="FF0000"), Font(name="Arial", size=10, bold=True, color="FFFFFF")),
+        labels[1]: (PatternFill("solid", fgColor="FFC000"), Font(name="Arial", size=10)),
+        labels[2]: (PatternFill("solid", fgColor="FFEB9C"), Font(name="Arial", size=10)),
+        "": (PatternFill(), Font(name="Arial", size=10)),
+    }
+
+    # Headers for summary
+    sum_headers = ["Rank", "Tile #", "Description", "Median Hours", "Confidence", "Skip Priority"] + SPREAD_HEADERS
+    write_headers(ws2, sum_headers, PatternFill("solid", fgColor="843C0C"))
+
+    ws2.column_dimensions['A'].width = 8
+    ws2.column_dimensions['B'].width = 8
+    ws2.column_dimensions['C'].width = 55
+    ws2.column_dimensions['D'].width = 14
+    ws2.column_dimensions['E'].width = 12
+    ws2.column_dimensions['F'].width = 15
+    for k in range(len(SPREAD_HEADERS)):
+        ws2.column_dimensions[get_column_letter(7 + k)].width = 12
+
+    for i, t in enumerate(obtain_tiles):
+        row = i + 2
+        ws2.cell(row=row, column=1, value=i+1).alignment = Alignment(horizontal="center")
+        ws2.cell(row=row, column=2, value=t["tile"]).alignment = Alignment(horizontal="center")
+        ws2.cell(row=row, column=3, value=t["description"])
+        ws2.cell(row=row, column=4, value=t["median_hours"]).number_format = '0.00'
+        ws2.cell(row=row, column=5, value=t["confidence"].upper())
+
+        # Skip priority
+        priority = whatif.skip_tier(i)
+        pfill, pfont = priority_styles[priority]
+
+        pcell = ws2.cell(row=row, column=6, value=priority)
+        pcell.fill = pfill
+        pcell.font = pfont
+
+        conf_fill = conf_fills.get(t["confidence"], PatternFill())
+        ws2.cell(row=row, column=5).fill = conf_fill
+
+        for col in range(1, 7):
+            ws2.cell(row=row, column=col).border = thin_border
+            if col != 5 and col != 6:
+                ws2.cell(row=row, column=col).font = Font(name="Arial", size=10)
+        write_spreads(ws2, row, 7, spreads.get(t["tile"]))
+
+    # Freeze panes
+    ws.freeze_panes = 'A2'
+    ws2.freeze_panes = 'A2'
+
+    # Auto-filter
+    last_col = get_column_letter(6 + len(SPREAD_HEADERS))
+    ws.auto_filter.ref = f"A1:{last_col}{len(board)+1}"
+    ws2.auto_filter.ref = f"A1:{last_col}{len(obtain_tiles)+1}"
+
+    wb.save(output_path)
+    return obtain_tiles
+
+# ============================================================
+# Batch mode: many boards, one process
+# ============================================================
+
+def summarize_board(name, board):
+    obtain_tiles = rank_skips(board)
+    total = sum(t["median_hours"] for t in obtain_tiles)
+    return {
+        "board": name,
+        "tiles": len(board),
+        "obtain": len(obtain_tiles),
+        "total_hours": total,
+        "after_skips": total - sum(t["median_hours"] for t in obtain_tiles[:3]),
+        "top_skips": ", ".join(f"#{t['tile']} ({t['median_hours']:.1f}h)" for t in obtain_tiles[:3]),
+        "low_confidence": sum(t["confidence"] == "low" for t in obtain_tiles),
+    }
+
+def write_comparison(summaries, boards, output_path):
+    """One row per board plus a tile-by-board hours matrix."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Board Comparison"
+    headers = ["Board", "Tiles", "Obtain Tiles", "Total Median Hours", "Hours After Top 3 Skips", "Top 3 Skips", "Low Confidence"]
+    write_headers(ws, headers, header_fill)
+    for i, s in enumerate(summaries):
+        row = i + 2
+        for col, key in enumerate(["board", "tiles", "obtain", "total_hours", "after_skips", "top_skips", "low_confidence"], 1):
+            cell = ws.cell(row=row, column=col, value=s[key])
+            cell.border = thin_border
+            cell.font = Font(name="Arial", size=10)
+            if key in ("total_hours", "after_skips"):
+                cell.number_format = '0.00'
+    ws.column_dimensions['A'].width = 24
+    for col in "BCDE":
+        ws.column_dimensions[col].width = 14
+    ws.column_dimensions['F'].width = 50
+    ws.column_dimensions['G'].width = 14
+    ws.freeze_panes = 'A2'
+
+    ws2 = wb.create_sheet("Tiles by Board")
+    write_headers(ws2, ["Tile #"] + [s["board"] for s in summaries], header_fill)
+    hours_by_board = [{t["tile"]: t["median_hours"] for t in board if t["category"] == "obtain"} for board in boards]
+    all_tiles = sorted({num for hours in hours_by_board for num in hours})
+    for i, num in enumerate(all_tiles):
+        row = i + 2
+        ws2.cell(row=row, column=1, value=num).alignment = Alignment(horizontal="center")
+        for col, hours in enumerate(hours_by_board, 2):
+            if num in hours:
+                ws2.cell(row=row, column=col, value=hours[num]).number_format = '0.00'
+    for col in range(2, len(summaries) + 2):
+        ws2.column_dimensions[get_column_letter(col)].width = 16
+    ws2.freeze_panes = 'B2'
+    wb.save(output_path)
+
+def run_batch(board_dir, output_dir):
+    """Evaluate every *.json board in board_dir, sharing the catalog and quantile cache."""
+    os.makedirs(output_dir, exist_ok=True)
+    names, boards, summaries = [], [], []
+    for fname in sorted(os.listdir(board_dir)):
+        if not fname.endswith(".json"):
+            continue
+        name = fname[:-len(".json")]
+        board = load_board(os.path.join(board_dir, fname))
+        write_workbook(board, os.path.join(output_dir, f"{name}_estimates.xlsx"))
+        names.append(name)
+        boards.append(board)
+        summaries.append(summarize_board(name, board))
+    write_comparison(summaries, boards, os.path.join(output_dir, "board_comparison.xlsx"))
+    return summaries
+
+# ============================================================
+# Rule sweeps (dice size, skips, SIT penalty, board length)
+# ============================================================
+
+def write_sweep(rows, output_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Rule Sweep"
+    headers = ["Dice", "Skips", "SIT Hours", "Board Length", "Expected Hours", "Median Hours", "P90 Hours", "Skips Used"]
+    keys = ["dice", "skips", "sit_hours", "board_length", "mean_hours", "median_hours", "p90_hours", "skips_used"]
+    write_headers(ws, headers, header_fill)
+    for i, r in enumerate(rows):
+        row = i + 2
+        for col, key in enumerate(keys, 1):
+            cell = ws.cell(row=row, column=col, value=float(r[key]) if col > 4 else r[key])
+            cell.border = thin_border
+            cell.font = Font(name="Arial", size=10)
+            if col > 4:
+                cell.number_format = '0.00'
+    for col in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 14
+    ws.freeze_panes = 'A2'
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(rows)+1}"
+    wb.save(output_path)
+
+def write_race(result, output_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Race"
+    k = len(result.teams)
+    headers = ["Team", "Speed", "Skip Threshold", "Win Probability", "Mean Hours"] + [f"P(Place {j+1})" for j in range(k)]
+    write_headers(ws, headers, header_fill)
+    for i, team in enumerate(result.teams):
+        row = i + 2
+        values = [team["name"], team.get("speed", 1.0), team.get("skip_threshold", "default"),
+                  float(result.win_prob[i]), float(result.mean_hours[i])] + [float(x) for x in result.place_prob[i]]
+        for col, value in enumerate(values, 1):
+            cell = ws.cell(row=row, column=col, value=value)
+            cell.border = thin_border
+            cell.font = Font(name="Arial", size=10)
+            if col == 5:
+                cell.number_format = '0.00'
+            elif col > 3:
+                cell.number_format = '0.0%'
+    ws.column_dimensions['A'].width = 24
+    for col in range(2, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 14
+    ws.freeze_panes = 'B2'
+    wb.save(output_path)
+
+def write_risk_policy(policy, board, skips, output_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Risk Summary"
+    stat = f"P{policy.level * 100:g}" if policy.objective == "quantile" else f"ES {policy.level:g}"
+    summary = [
+        ("Objective", f"{stat} of total event hours"),
+        ("Optimized policy", policy.value),
+        ("Median-ranked threshold policy", policy.baseline),
+        ("Planning budget (hours)", policy.budget),
+    ]
+    write_headers(ws, ["Statistic", "Value"], header_fill)
+    for i, (name, value) in enumerate(summary):
+        ws.cell(row=i + 2, column=1, value=name).font = Font(name="Arial", size=10)
+        cell = ws.cell(row=i + 2, column=2, value=float(value) if i else value)
+        cell.font = Font(name="Arial", size=10)
+        if i:
+            cell.number_format = '0.00'
+    ws.column_dimensions['A'].width = 34
+    ws.column_dimensions['B'].width = 30
+
+    # Skip a tile when no more than this many hours of budget remain
+    ws2 = wb.create_sheet("Risk Skips")
+    counts = range(1, policy.skip_table.shape[0])
+    headers = ["Tile #", "Description", "Median Hours"] + [f"Skip If <= Hrs Left ({s} skips)" for s in counts]
+    write_headers(ws2, headers, PatternFill("solid", fgColor="843C0C"))
+    row = 2
+    for t in rank_skips(board):
+        cutoffs = [policy.skip_below(t["tile"], s) for s in counts]
+        if all(c is None for c in cutoffs):
+            continue
+        ws2.cell(row=row, column=1, value=t["tile"]).alignment = Alignment(horizontal="center")
+        ws2.cell(row=row, column=2, value=t["description"])
+        ws2.cell(row=row, column=3, value=t["median_hours"]).number_format = '0.00'
+        for col, c in enumerate(cutoffs, 4):
+            if c is not None:
+                ws2.cell(row=row, column=col, value=float(c)).number_format = '0.0'
+        for col in range(1, len(headers) + 1):
+            ws2.cell(row=row, column=col).border = thin_border
+        row += 1
+    ws2.column_dimensions['A'].width = 8
+    ws2.column_dimensions['B'].width = 55
+    for col in range(3, len(headers) + 1):
+        ws2.column_dimensions[get_column_letter(col)].width = 16
+    ws2.freeze_panes = 'C2'
+    wb.save(output_path)
+
+def print_top_skips(obtain_tiles):
+    print(f"\nTop 10 skip candidates:")
+    for i, t in enumerate(obtain_tiles[:10]):
+        print(f"  {i+1}. Tile {t['tile']}: {t['description']} - {t['median_hours']:.1f} hrs ({t['confidence']})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate median completion time for snakes & ladders tiles")
+    parser.add_argument("--output", default="./snakes_ladders_estimates.xlsx", help="workbook path for the built-in board")
+    parser.add_argument("--batch", metavar="DIR", help="evaluate every *.json board definition in DIR")
+    parser.add_argument("--batch-output", metavar="DIR", default="./batch_estimates", help="where --batch writes its workbooks")
+    parser.add_argument("--dump-board", metavar="PATH", help="write the built-in board as a board definition file")
+    parser.add_argument("--board", metavar="PATH", help="use a board definition file instead of the built-in board")
+    parser.add_argument("--board-text", metavar="PATH", help="use a numbered list of tile descriptions instead")
+    parser.add_argument("--board-pdf", metavar="PATH", help="use the tiles in a tile-descriptions PDF instead")
+    parser.add_argument("--unknown-hours", type=float, default=None,
+                        help="hours for --board-text/--board-pdf tiles nothing can estimate")
+    parser.add_argument("--sweep", action="store_true", help="simulate every combination of --dice/--skips/--sit-hours/--board-length")
+    parser.add_argument("--sweep-output", metavar="PATH", default="./snakes_ladders_sweep.xlsx")
+    parser.add_argument("--dice", type=int, nargs="+", default=[6], help="dice sizes to sweep")
+    parser.add_argument("--skips", type=int, nargs="+", default=[3], help="starting skip counts to sweep")
+    parser.add_argument("--sit-hours", type=float, nargs="+", default=[0.0], help="hours lost per SIT tile landed on")
+    parser.add_argument("--board-length", type=int, nargs="+", default=[None], help="last tile of the board")
+    parser.add_argument("--playthroughs", type=int, default=20000, help="simulated playthroughs per combination")
+    parser.add_argument("--race", metavar="TEAMS", help="simulate a race between the teams in a JSON file")
+    parser.add_argument("--races", type=int, default=100000, help="number of simulated races")
+    parser.add_argument("--race-output", metavar="PATH", default="./snakes_ladders_race.xlsx")
+    parser.add_argument("--risk-policy", choices=risk_policy.OBJECTIVES,
+                        help="solve for the skip policy minimizing a quantile or expected shortfall of event hours")
+    parser.add_argument("--level", type=float, default=0.9, help="quantile / shortfall level for --risk-policy")
+    parser.add_argument("--risk-output", metavar="PATH", default="./snakes_ladders_risk_policy.xlsx")
+    parser.add_argument("--compare", nargs=2, metavar=("A", "B"),
+                        help="compare two skip strategies: a threshold in hours, or quantile/shortfall (risk policy at --level)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="simulate until median/P90 hours and skip frequencies reach --precision")
+    parser.add_argument("--precision", type=float, default=2.0, help="95%% CI half-width (hours) for --adaptive")
+    parser.add_argument("--skip-precision", type=float, default=0.01, help="95%% CI half-width of skip frequencies")
+    parser.add_argument("--stream", action="store_true",
+                        help="simulate --playthroughs in batches into fixed-size sketches (any count, constant memory)")
+    parser.add_argument("--record", metavar="DIR", help="simulate --playthroughs and write every trajectory to DIR")
+    parser.add_argument("--given-skip", type=int, metavar="TILE",
+                        help="from the trajectories in --record DIR: where else runs that skipped TILE used skips")
+    parser.add_argument("--calendar", metavar="ROSTER",
+                        help="calendar finishing times from member availability in a JSON roster (capacity-curve approximation)")
+    parser.add_argument("--sqlite", metavar="PATH", help="write tiles, pools and a --playthroughs simulation to SQLite")
+    parser.add_argument("--what-if", nargs="+", metavar="TARGET.FIELD=VALUE",
+                        help="re-rank skips with one change per scenario, e.g. dt2.kph=35 302.hours=8 15.rate=1/600")
+    parser.add_argument("--snapshot", metavar="PATH", help="save the board's estimates and skip ranks to a .npz for --diff")
+    parser.add_argument("--diff", nargs="+", metavar="SNAPSHOT",
+                        help="compare a snapshot (.npz or --sqlite .db) with the current board, or two snapshots")
+    parser.add_argument("--calibrate", metavar="LOG",
+                        help="fit team / activity speed factors to a completion log and write calibration.json")
+    parser.add_argument("--watch", action="store_true",
+                        help="stay running and re-estimate / rewrite --output whenever the board or rates change")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--build-dropdb", metavar="DIR", help="parse saved wiki drop-table pages in DIR into drops.npz")
+    parser.add_argument("--workers", type=int, default=None, help="processes for --build-dropdb / --stream")
+    args = parser.parse_args()
+    if args.given_skip is not None and not args.record:
+        parser.error("--given-skip needs --record DIR (the trajectories to query)")
+
+    if args.build_dropdb:
+        n = dropdb.build(args.build_dropdb, workers=args.workers)
+        print(f"Wrote {n} drop rates to {dropdb.DEFAULT_PATH}")
+        return
+
+    if args.watch:
+        import daemon
+        source, kind = next(((path, kind) for path, kind in ((args.board, "board"), (args.board_text, "text"),
+                                                              (args.board_pdf, "pdf")) if path), (None, "board"))
+        estimator = daemon.Estimator(source, kind, args.output, seed=args.seed or 0,
+                                     load_kwargs={"unknown_hours": args.unknown_hours}, dice=args.dice[0],
+                                     skips=args.skips[0], sit_hours=args.sit_hours[0])
+        print(f"Watching {', '.join(estimator.watched())} (Ctrl-C to stop)")
+        try:
+            daemon.watch(estimator)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.board:
+        board = load_board(args.board)
+    elif args.board_text:
+        board = board_from_text(args.board_text, unknown_hours=args.unknown_hours)
+    elif args.board_pdf:
+        board = board_from_pdf(args.board_pdf, unknown_hours=args.unknown_hours)
     else:
-        priority = ""
-        pfill = PatternFill()
-        pfont = Font(name="Arial", size=10)
-    
-    pcell = ws2.cell(row=row, column=6, value=priority)
-    pcell.fill = pfill
-    pcell.font = pfont
-    
-    conf_fill = conf_fills.get(t["confidence"], PatternFill())
-    ws2.cell(row=row, column=5).fill = conf_fill
-    
-    for col in range(1, 7):
-        ws2.cell(row=row, column=col).border = thin_border
-        if col != 5 and col != 6:
-            ws2.cell(row=row, column=col).font = Font(name="Arial", size=10)
-
-# Freeze panes
-ws.freeze_panes = 'A2'
-ws2.freeze_panes = 'A2'
-ws3.freeze_panes = 'A2'
-ws4.freeze_panes = 'A2'
-
-# Auto-filter
-ws.auto_filter.ref = f"A1:F{len(tiles)+1}"
-ws2.auto_filter.ref = f"A1:F{len(obtain_tiles)+1}"
-ws3.auto_filter.ref = f"A1:F{len(SLAYER_BOSSES)+1}"
-ws4.auto_filter.ref = f"A1:F{len(RAIDS)+1}"
-
-output_path = "./snakes_ladders_estimates.xlsx"
-wb.save(output_path)
-print(f"Saved to {output_path}")
-print(f"Total tiles: {len(tiles)}")
-print(f"Obtain tiles: {len(obtain_tiles)}")
-print(f"\nTop 10 skip candidates:")
-for i, t in enumerate(obtain_tiles[:10]):
-    print(f"  {i+1}. Tile {t['tile']}: {t['description']} - {t['median_hours']:.1f} hrs ({t['confidence']})")
+        board = tiles
+
+    if args.dump_board:
+        dump_board(board, args.dump_board)
+        print(f"Wrote board to {args.dump_board}")
+        return
+
+    if args.snapshot:
+        import snapshot
+        snapshot.Snapshot.from_ranked(rank_skips(board)).save(args.snapshot)
+        print(f"Saved snapshot to {args.snapshot}")
+        return
+
+    if args.diff:
+        import snapshot
+        old = snapshot.load(args.diff[0])
+        new = snapshot.load(args.diff[1]) if len(args.diff) > 1 else snapshot.Snapshot.from_ranked(rank_skips(board))
+        print("\n".join(snapshot.diff(old, new).report()))
+        return
+
+    if args.calibrate:
+        fitted = calibration.fit(board, calibration.load_log(args.calibrate), previous=calibration.current())
+        combined = fitted.combined(calibration.current())
+        combined.save(calibration.default_path())
+        print(f"Team speed x{fitted.team_speed:.3f} (now x{combined.team_speed:.3f}) "
+              f"from {fitted.observations} completions, {len(fitted.unmatched)} log rows unmatched")
+        for name, m in sorted(fitted.activities.items(), key=lambda a: abs(log(a[1])), reverse=True):
+            print(f"  {name}: kph x{m:.3f} (now x{combined.activities[name]:.3f})")
+        print(f"Saved to {calibration.default_path()}")
+        return
+
+    if args.sqlite:
+        import sqlite_export
+        sim = board_sim.simulate(board_sim.BoardArrays(board), args.playthroughs, dice=args.dice[0],
+                                 skips=args.skips[0], sit_hours=args.sit_hours[0], rng=args.seed)
+        sqlite_export.export(board, args.sqlite, {"slayer": SLAYER_BOSSES, "raid": RAIDS}, sim)
+        print(f"Saved {len(board)} tiles and {sim.hours.size} playthroughs to {args.sqlite}")
+        return
+
+    if args.what_if:
+        w = whatif.WhatIf(board)
+        for spec in args.what_if:
+            with w.scenario():
+                moved = w.apply(spec)
+                print(f"\n{spec}: " + ", ".join(f"#{tile} rank {old + 1} -> {new + 1}"
+                                                for tile, (old, new) in moved.items()))
+                for i, t in enumerate(w.top(whatif.SKIP_TIERS[1][0])):
+                    print(f"  {i+1}. Tile {t['tile']}: {t['description']} - {t['median_hours']:.1f} hrs "
+                          f"[{whatif.skip_tier(i)}]")
+        return
+
+    if args.risk_policy:
+        arrays = board_sim.BoardArrays(board)
+        policy = risk_policy.solve(arrays, args.risk_policy, args.level, dice=args.dice[0],
+                                   skips=args.skips[0], sit_hours=args.sit_hours[0])
+        write_risk_policy(policy, board, args.skips[0], args.risk_output)
+        print(f"Optimized {args.risk_policy} {args.level:g}: {policy.value:.1f} hrs "
+              f"(median-ranked threshold policy: {policy.baseline:.1f} hrs)")
+        print(f"Saved to {args.risk_output}")
+        return
+
+    if args.compare:
+        arrays = board_sim.BoardArrays(board)
+
+        def strategy(spec):
+            if spec in risk_policy.OBJECTIVES:
+                return {"policy": risk_policy.solve(arrays, spec, args.level, dice=args.dice[0],
+                                                    skips=args.skips[0], sit_hours=args.sit_hours[0])}
+            return {"threshold": float(spec)}
+
+        a, b = args.compare
+        cmp = board_sim.compare(arrays, args.playthroughs, strategy(a), strategy(b), dice=args.dice[0],
+                                skips=args.skips[0], sit_hours=args.sit_hours[0], rng=args.seed)
+        print(f"{a}: {cmp.mean_a:.1f} hrs expected, {b}: {cmp.mean_b:.1f} hrs expected")
+        print(f"{a} - {b}: {cmp.diff:+.2f} +/- {1.96 * cmp.stderr:.2f} hrs (95%), "
+              f"{cmp.speedup:.0f}x fewer playthroughs than independent runs")
+        return
+
+    if args.adaptive:
+        arrays = board_sim.BoardArrays(board)
+        res = board_sim.adaptive(arrays, args.precision, skip_precision=args.skip_precision, rng=args.seed,
+                                 dice=args.dice[0], skips=args.skips[0], sit_hours=args.sit_hours[0])
+        for p, (est, lo, hi) in res.quantiles.items():
+            print(f"  P{p * 100:g}: {est:.1f} hrs ({lo:.1f} - {hi:.1f})")
+        for t in np.argsort(res.skip_freq)[::-1][:5]:
+            print(f"  Tile {t}: skipped in {res.skip_freq[t]:.1%} +/- {res.skip_halfwidth[t]:.1%} of playthroughs")
+        status = "converged" if res.converged else "stopped at the playthrough limit"
+        print(f"{res.n} playthroughs in {res.batches} batches, {status}")
+        return
+
+    if args.stream:
+        import sketches
+        arrays = board_sim.BoardArrays(board)
+        agg = sketches.stream(arrays, args.playthroughs, workers=args.workers or 1, rng=args.seed,
+                              dice=args.dice[0], skips=args.skips[0], sit_hours=args.sit_hours[0])
+        for p, hours in zip(board_sim.REPORT_QUANTILES, agg.hours.quantile(board_sim.REPORT_QUANTILES)):
+            print(f"  P{p * 100:g}: {hours:.1f} hrs")
+        for t in np.argsort(agg.skip_freq())[::-1][:5]:
+            print(f"  Tile {t}: skipped in {agg.skip_freq()[t]:.1%} of playthroughs")
+        print(f"{agg.n} playthroughs: {agg.mean_hours:.1f} +/- {agg.std_hours:.1f} hrs")
+        return
+
+    if args.given_skip is not None:
+        import trajectories
+        store = trajectories.TrajectoryStore(args.record)
+        runs = store.playthrough_mask(args.given_skip, skip=True)
+        if not runs.any():
+            print(f"0 of {store.playthroughs} playthroughs skipped tile {args.given_skip}")
+            return
+        counts = store.tile_counts(runs, skip=True)
+        counts[args.given_skip] = 0
+        print(f"{runs.sum()} of {store.playthroughs} playthroughs skipped tile {args.given_skip}; their other skips:")
+        for t in np.argsort(counts)[::-1][:10]:
+            if counts[t]:
+                print(f"  Tile {t}: {counts[t] / runs.sum():.1%}")
+        return
+
+    if args.record:
+        import trajectories
+        arrays = board_sim.BoardArrays(board)
+        rng = np.random.default_rng(args.seed)
+        with trajectories.TrajectoryWriter(args.record) as writer:
+            for start in range(0, args.playthroughs, board_sim.STREAM_BATCH):
+                board_sim.simulate(arrays, min(board_sim.STREAM_BATCH, args.playthroughs - start), dice=args.dice[0],
+                                   skips=args.skips[0], sit_hours=args.sit_hours[0], rng=rng, recorder=writer)
+        print(f"Wrote {writer.records} tile records of {writer.playthroughs} playthroughs to {args.record}")
+        return
+
+    if args.calendar:
+        import calendar_sim
+        roster = calendar_sim.load_roster(args.calendar)
+        arrays = board_sim.BoardArrays(board)
+        res = calendar_sim.capacity_calendar(arrays, roster, args.playthroughs, rng=args.seed, dice=args.dice[0],
+                                             skips=args.skips[0], sit_hours=args.sit_hours[0])
+        for p in (0.1, 0.5, 0.9):
+            t = res.finish_quantile(p)
+            when = f"day {t / 24:.1f}" if np.isfinite(t) else "after the deadline"
+            print(f"  P{p * 100:g}: finished {when}")
+        print(f"{res.p_finish:.1%} of {args.playthroughs} events finish within {roster['days']} days "
+              f"({len(roster['members'])} members)")
+        return
+
+    if args.race:
+        import race
+        teams = race.load_teams(args.race)
+        arrays = board_sim.BoardArrays(board)
+        result = race.race(arrays, teams, args.races, dice=args.dice[0], skips=args.skips[0],
+                           sit_hours=args.sit_hours[0], rng=args.seed)
+        write_race(result, args.race_output)
+        for i, team in enumerate(teams):
+            print(f"  {team['name']}: {result.win_prob[i]:.1%} to win, {result.mean_hours[i]:.1f} hrs mean")
+        print(f"Saved {args.races} races to {args.race_output}")
+        return
+
+    if args.sweep:
+        arrays = board_sim.BoardArrays(board)
+        rows = board_sim.sweep(arrays, args.playthroughs, dice=args.dice, skips=args.skips,
+                               sit_hours=args.sit_hours, board_length=args.board_length, rng=args.seed)
+        write_sweep(rows, args.sweep_output)
+        for r in rows:
+            print(f"  d{r['dice']}, {r['skips']} skips, {r['sit_hours']:g}h SIT, {r['board_length']} tiles: "
+                  f"{r['mean_hours']:.1f} hrs expected, {r['p90_hours']:.1f} hrs P90")
+        print(f"Saved {len(rows)} combinations to {args.sweep_output}")
+        return
+
+    if args.batch:
+        summaries = run_batch(args.batch, args.batch_output)
+        for s in summaries:
+            print(f"  {s['board']}: {s['obtain']} obtain tiles, {s['total_hours']:.1f} hrs total, "
+                  f"{s['after_skips']:.1f} hrs after top 3 skips ({s['top_skips']})")
+        cache = median_kills_nbinom.cache_info()
+        print(f"Saved {len(summaries)} boards + comparison to {args.batch_output}")
+        print(f"Quantile cache: {cache.hits} hits, {cache.misses} misses")
+        return
+
+    output_path = args.output
+    obtain_tiles = write_workbook(board, output_path)
+    print(f"Saved to {output_path}")
+    print(f"Total tiles: {len(board)}")
+    print(f"Obtain tiles: {len(obtain_tiles)}")
+    print_top_skips(obtain_tiles)
+
+if __name__ == "__main__":
+    main()
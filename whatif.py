@@ -0,0 +1,140 @@
+# Interactive what-if on the skip ranking.
+#   w = whatif.WhatIf(vibeslop.tiles); w.set_kph("dt2", 35); w.top(10)
+#   python vibeslop.py --what-if dt2.kph=35 302.hours=8 15.rate=1/600
+# Moved tiles are re-placed by bisection in the sorted list (del/insort shifts it, O(n) per tile).
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+
+import numpy as np
+
+import nbkernel
+
+# (ranks below, label) for the Skip Priority column
+SKIP_TIERS = ((3, "TOP 3 SKIP"), (10, "Strong candidate"), (20, "Consider"))
+
+
+def skip_tier(rank):
+    """Skip Priority label for a 0-based rank ("" past the last tier)."""
+    for below, label in SKIP_TIERS:
+        if rank < below:
+            return label
+    return ""
+
+
+def median_kills(drops, rate):
+    """Median total kills for `drops` drops at `rate`, vectorized (geometric median for 1 drop)."""
+    drops, rate = np.broadcast_arrays(np.asarray(drops, dtype=float), np.asarray(rate, dtype=float))
+    return np.where(drops == 1, np.ceil(np.log(0.5) / np.log1p(-rate)),
+                    np.ceil(nbkernel.nbinom_ppf(0.5, drops, rate)) + drops)
+
+
+class WhatIf:
+    """Skip ranking of a board that can be edited a few tiles at a time."""
+
+    def __init__(self, board):
+        obtain = [t for t in board if t["category"] == "obtain"]
+        self.tiles = {t["tile"]: dict(t) for t in obtain}
+        self.position = {t["tile"]: i for i, t in enumerate(obtain)}  # board order breaks ties, as in rank_skips
+        self.order = [t["tile"] for t in obtain]
+        self.by_activity = {}
+        for t in obtain:
+            if t.get("activity"):
+                self.by_activity.setdefault(t["activity"], []).append(t["tile"])
+        self.ranked = sorted(self._key(t) for t in self.tiles)
+        self._undo = []
+
+    def _key(self, tile):
+        return -self.tiles[tile]["median_hours"], self.position[tile]
+
+    def select(self, target):
+        """Tile numbers for a tile number, or every tile of an activity name."""
+        if isinstance(target, str) and not target.isdigit():
+            if target not in self.by_activity:
+                raise KeyError(f"no obtain tiles with activity {target!r}")
+            return list(self.by_activity[target])
+        if int(target) not in self.tiles:
+            raise KeyError(f"no obtain tile {target}")
+        return [int(target)]
+
+    def _move(self, tile, hours, **fields):
+        """Re-rank one tile at new hours; returns (old rank, new rank)."""
+        t = self.tiles[tile]
+        self._undo.append((tile, {k: t[k] for k in ("median_hours", *fields)}))
+        old = bisect_left(self.ranked, self._key(tile))
+        del self.ranked[old]
+        t["median_hours"] = round(float(hours), 2)
+        t.update(fields)
+        insort(self.ranked, self._key(tile))
+        return old, bisect_left(self.ranked, self._key(tile))
+
+    def set_hours(self, target, hours):
+        """Set the hours of a tile (or every tile of an activity); returns {tile: (old rank, new rank)}."""
+        return {tile: self._move(tile, hours) for tile in self.select(target)}
+
+    def _drop_model(self, tiles):
+        missing = [tile for tile in tiles if self.tiles[tile]["rate"] is None]
+        if missing:
+            raise ValueError(f"tiles {missing} have no drop model (rate/kph); use set_hours")
+        return [self.tiles[tile] for tile in tiles]
+
+    def set_kph(self, target, kph):
+        """Kill rate for a tile or an activity's tiles; hours scale by old kph / new kph."""
+        tiles = self.select(target)
+        ts = self._drop_model(tiles)
+        hours = np.array([t["median_hours"] for t in ts]) * np.array([t["kph"] for t in ts], dtype=float) / kph
+        return {tile: self._move(tile, h, kph=kph) for tile, h in zip(tiles, hours)}
+
+    def set_rate(self, target, rate):
+        """Drop rate for a tile or an activity's tiles; hours scale by the change in median kills."""
+        tiles = self.select(target)
+        ts = self._drop_model(tiles)
+        drops = np.array([t["drops"] or 1 for t in ts])
+        ratio = median_kills(drops, rate) / median_kills(drops, [t["rate"] for t in ts])
+        hours = np.array([t["median_hours"] for t in ts]) * ratio
+        return {tile: self._move(tile, h, rate=rate) for tile, h in zip(tiles, hours)}
+
+    def apply(self, spec):
+        """One "TARGET.FIELD=VALUE" change (FIELD: hours, kph or rate; rate may be "1/600")."""
+        lhs, value = spec.split("=", 1)
+        target, field = lhs.rsplit(".", 1)
+        if "/" in value:
+            num, den = value.split("/")
+            value = float(num) / float(den)
+        setter = {"hours": self.set_hours, "kph": self.set_kph, "rate": self.set_rate}[field]
+        return setter(target, float(value))
+
+    def undo(self, steps=None):
+        """Revert the last `steps` tile changes (all of them if None)."""
+        while self._undo and (steps is None or steps > 0):
+            tile, fields = self._undo.pop()
+            del self.ranked[bisect_left(self.ranked, self._key(tile))]
+            self.tiles[tile].update(fields)
+            insort(self.ranked, self._key(tile))
+            if steps is not None:
+                steps -= 1
+
+    @contextmanager
+    def scenario(self):
+        """Changes made inside the with block are undone when it exits."""
+        mark = len(self._undo)
+        try:
+            yield self
+        finally:
+            self.undo(len(self._undo) - mark)
+
+    def top(self, n=10):
+        """The n best skip candidates (tile dicts), as rank_skips(board)[:n]."""
+        return [self.tiles[self._tile_at(k)] for k in range(min(n, len(self.ranked)))]
+
+    def _tile_at(self, rank):
+        return self.order[self.ranked[rank][1]]
+
+    def tiers(self):
+        """{Skip Priority label: [tile numbers]} for the tiered ranks."""
+        out = {label: [] for _, label in SKIP_TIERS}
+        for rank in range(min(SKIP_TIERS[-1][0], len(self.ranked))):
+            out[skip_tier(rank)].append(self._tile_at(rank))
+        return out
+
+    def rank(self, tile):
+        return bisect_left(self.ranked, self._key(tile))